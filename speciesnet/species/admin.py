@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.utils import timezone
 from .models import User
 
 # Register your models here.
@@ -7,7 +8,7 @@ from .models import Species, SpeciesComment, SpeciesReferenceLink
 from .models import SpeciesInstance, SpeciesInstanceLabel, SpeciesInstanceLogEntry, SpeciesMaintenanceLog, SpeciesMaintenanceLogEntry 
 from .models import User, UserEmail, AquaristClub, AquaristClubMember, ImportArchive
 from .models import BapSubmission, BapGenus, BapSpecies, BapLeaderboard, CaresRegistration, CaresApprover
-from .models import SpeciesFeedback
+from .models import SpeciesFeedback, BackgroundJob, SpeciesSyncState, SpeciesSyncRun
 from allauth.account.models import EmailAddress
 
 
@@ -82,6 +83,37 @@ class SpeciesFeedbackAdmin(admin.ModelAdmin):
     search_fields = ('name', 'comment', 'email')
     readonly_fields = ('name', 'created', 'reviewed_by', 'reviewed_at')
 
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display  = ('id', 'job_type', 'status', 'progress_current', 'progress_total', 'attempts', 'requested_by', 'created', 'finished')
+    list_filter   = ('job_type', 'status')
+    readonly_fields = ('created', 'started', 'finished', 'heartbeat')
+    actions = ['requeue_jobs']
+
+    def requeue_jobs(self, request, queryset):
+        count = queryset.exclude(status=BackgroundJob.JobStatus.RUNNING).update(
+            status=BackgroundJob.JobStatus.PENDING, attempts=0, progress_current=0, last_error='', run_after=timezone.now())
+        self.message_user(request, f'{count} job(s) requeued.')
+    requeue_jobs.short_description = 'Requeue selected jobs'
+
+class SpeciesSyncStateAdmin(admin.ModelAdmin):
+    # clear synced_until and change_sequence to make the next scheduled sync a full sync
+    list_display  = ('target_url', 'synced_until', 'change_sequence', 'last_run_succeeded', 'last_run_finished', 'last_run_duration', 'last_success')
+    readonly_fields = ('last_run_started', 'last_run_finished', 'last_run_duration', 'last_run_since', 'last_run_stats',
+                       'last_run_succeeded', 'last_success')
+
+class SpeciesSyncRunAdmin(admin.ModelAdmin):
+    # read-only history written by sync_species - compare duration and transfer as the catalog grows
+    list_display  = ('started', 'target_url', 'mode', 'dry_run', 'succeeded', 'duration', 'fetched', 'created', 'updated',
+                     'removed', 'errors', 'pages', 'bytes_received')
+    list_filter   = ('mode', 'succeeded', 'dry_run', 'target_url')
+    date_hierarchy = 'started'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
 admin.site.register (User, UserAdmin)  
 admin.site.register (UserEmail)
 admin.site.register (AquaristClub)
@@ -101,4 +133,7 @@ admin.site.register (BapSpecies)
 admin.site.register (BapLeaderboard)
 admin.site.register (CaresRegistration)
 admin.site.register (CaresApprover)
-admin.site.register(SpeciesFeedback, SpeciesFeedbackAdmin)
\ No newline at end of file
+admin.site.register(SpeciesFeedback, SpeciesFeedbackAdmin)
+admin.site.register(BackgroundJob, BackgroundJobAdmin)
+admin.site.register(SpeciesSyncState, SpeciesSyncStateAdmin)
+admin.site.register(SpeciesSyncRun, SpeciesSyncRunAdmin)
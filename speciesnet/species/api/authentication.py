@@ -0,0 +1,91 @@
+"""
+HMAC request signing for the species-sync API service account.
+
+HTTP Basic Authentication makes the server run the PBKDF2 password hasher on
+every request.  Signed requests are verified with a single HMAC-SHA256 instead:
+
+    Authorization: SpeciesSync-HMAC username="<email>", timestamp="<unix time>", signature="<hex>"
+
+where signature = HMAC-SHA256(key, "<METHOD>\\n<path?query>\\n<timestamp>").  The key
+is API_SERVICE_KEY, or derived from API_SERVICE_PASSWORD when that is not set, so
+both sites already share it.  Only the API_SERVICE_EMAIL account may sign requests
+and signatures expire after API_SIGNATURE_MAX_AGE seconds.
+"""
+
+import hashlib
+import hmac
+import re
+import time
+from django.conf import settings
+from requests.auth import AuthBase
+from rest_framework import authentication, exceptions
+from species.models import User
+
+SIGNATURE_KEYWORD = 'SpeciesSync-HMAC'
+SIGNATURE_PARAM_RE = re.compile(r'(\w+)="([^"]*)"')
+DEFAULT_SIGNATURE_MAX_AGE = 300
+
+
+def service_signing_key(password=None):
+    """Return the shared signing key of the API service account."""
+    key = getattr(settings, 'API_SERVICE_KEY', '')
+    if not key:
+        password = password or getattr(settings, 'API_SERVICE_PASSWORD', 'changeme_in_production')
+        key = hashlib.sha256(f'species-sync:{password}'.encode('utf-8')).hexdigest()
+    return key.encode('utf-8')
+
+
+def sign_request(key, method, path, timestamp):
+    message = f'{method.upper()}\n{path}\n{timestamp}'.encode('utf-8')
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+class ServiceSignatureAuth(AuthBase):
+    """requests auth handler signing each request for ServiceSignatureAuthentication."""
+
+    def __init__(self, username, key):
+        self.username = username
+        self.key = key
+
+    def __call__(self, request):
+        timestamp = str(int(time.time()))
+        signature = sign_request(self.key, request.method, request.path_url, timestamp)
+        request.headers['Authorization'] = (
+            f'{SIGNATURE_KEYWORD} username="{self.username}", timestamp="{timestamp}", signature="{signature}"'
+        )
+        return request
+
+
+class ServiceSignatureAuthentication(authentication.BaseAuthentication):
+    """DRF authentication for requests signed with the API service account key."""
+
+    def authenticate(self, request):
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        if not header.startswith(SIGNATURE_KEYWORD + ' '):
+            return None  # not a signed request - let session / basic authentication try
+
+        params = dict(SIGNATURE_PARAM_RE.findall(header[len(SIGNATURE_KEYWORD):]))
+        username = params.get('username', '')
+        signature = params.get('signature', '')
+        try:
+            timestamp = int(params.get('timestamp', ''))
+        except ValueError:
+            raise exceptions.AuthenticationFailed('Invalid signature timestamp.')
+
+        max_age = getattr(settings, 'API_SIGNATURE_MAX_AGE', DEFAULT_SIGNATURE_MAX_AGE)
+        if abs(time.time() - timestamp) > max_age:
+            raise exceptions.AuthenticationFailed('Signature expired.')
+        if username.lower() != getattr(settings, 'API_SERVICE_EMAIL', 'api_service@localhost').lower():
+            raise exceptions.AuthenticationFailed('Only the API service account may sign requests.')
+
+        expected = sign_request(service_signing_key(), request.method, request.get_full_path(), timestamp)
+        if not hmac.compare_digest(expected, signature):
+            raise exceptions.AuthenticationFailed('Invalid signature.')
+
+        user = User.objects.filter(email__iexact=username, is_active=True).first()
+        if user is None:
+            raise exceptions.AuthenticationFailed('API service account not found - run create_api_user.')
+        return (user, None)
+
+    def authenticate_header(self, request):
+        return SIGNATURE_KEYWORD
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from species.models import Species
+from species.models import Species, SpeciesSyncRun
 
 
 class SpeciesSyncSerializer(serializers.ModelSerializer):
@@ -24,3 +24,37 @@ class SpeciesSyncSerializer(serializers.ModelSerializer):
             'lastUpdated',
         ]
         read_only_fields = fields
+
+
+class SpeciesSyncRunSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the species sync run history (Site1), for tracking sync duration trends.
+    """
+    records_per_second = serializers.ReadOnlyField()
+
+    class Meta:
+        model = SpeciesSyncRun
+        fields = [
+            'id',
+            'target_url',
+            'mode',
+            'dry_run',
+            'started',
+            'finished',
+            'duration',
+            'since',
+            'sequence',
+            'succeeded',
+            'fetched',
+            'created',
+            'updated',
+            'skipped',
+            'removed',
+            'errors',
+            'pages',
+            'bytes_received',
+            'fetch_seconds',
+            'wait_seconds',
+            'write_seconds',
+            'records_per_second',
+        ]
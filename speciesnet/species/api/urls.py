@@ -1,7 +1,8 @@
 from rest_framework.routers import DefaultRouter
-from .views import SpeciesSyncViewSet
+from .views import SpeciesSyncRunViewSet, SpeciesSyncViewSet
 
 router = DefaultRouter()
 router.register(r'species-sync', SpeciesSyncViewSet, basename='species-sync')
+router.register(r'species-sync-runs', SpeciesSyncRunViewSet, basename='species-sync-runs')
 
 urlpatterns = router.urls
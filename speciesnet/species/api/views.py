@@ -1,12 +1,21 @@
+import hashlib
 import logging
+from datetime import timezone as dt_timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
+from django.conf import settings
+from django.db.models import Count, Max
 from django.utils.dateparse import parse_datetime, parse_date
+from django.utils.http import parse_etags, quote_etag
 from django.utils import timezone
-from species.models import Species
-from .serializers import SpeciesSyncSerializer
+from django.views.decorators.gzip import gzip_page
+from species.models import Species, SpeciesSyncRun
+from species.services.species_changes import CHANGE_FEED_LIMIT, change_feed_head, read_change_feed
+from species.services.species_sync import SYNC_FIELDS, sync_content_hash
+from .serializers import SpeciesSyncRunSerializer, SpeciesSyncSerializer
 
 logger = logging.getLogger(__name__)
 
@@ -30,13 +39,42 @@ def _parse_since_param(since_param):
         if parsed_date:
             dt = timezone.datetime(
                 parsed_date.year, parsed_date.month, parsed_date.day,
-                tzinfo=timezone.utc,
+                tzinfo=dt_timezone.utc,
             )
     if dt is not None and timezone.is_naive(dt):
-        dt = timezone.make_aware(dt, timezone.utc)
+        dt = timezone.make_aware(dt, dt_timezone.utc)
     return dt
 
 
+class SpeciesSyncCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (lastUpdated, id), served by species_sync_cursor_idx.
+
+    Each page continues from the last row of the previous one instead of an
+    OFFSET, so a page costs the same however deep into the catalog it is, and
+    species updated while a client pages through move to the end of the feed.
+    """
+    ordering = ('lastUpdated', 'id')
+    page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE', 100)
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+def _species_etag(request, queryset):
+    """
+    Cheap ETag for a species-sync response: the request path and query string
+    plus the count and latest lastUpdated of the species it covers.  One indexed
+    aggregate query - nothing is serialized to decide whether the client is current.
+    """
+    summary = queryset.order_by().aggregate(count=Count('id'), latest=Max('lastUpdated'))
+    key = f"{request.get_full_path()}|{summary['count']}|{summary['latest']}"
+    return quote_etag(hashlib.md5(key.encode('utf-8')).hexdigest())
+
+
+def _strong_etag(etag):
+    return etag[2:] if etag.startswith('W/') else etag
+
+
 class SpeciesSyncViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Read-only API viewset for CARES species synchronization.
@@ -49,11 +87,37 @@ class SpeciesSyncViewSet(viewsets.ReadOnlyModelViewSet):
         GET /api/species-sync/                          - list all CARES species (paginated)
         GET /api/species-sync/?since=<ISO_DATETIME>     - filter by lastUpdated date
         GET /api/species-sync/stats/                    - sync statistics
+        GET /api/species-sync/changes/?since=<ISO_DATETIME>
+                                                        - cursor-paginated feed ordered by (lastUpdated, id)
+        GET /api/species-sync/?name=<NAME>&name=<NAME>  - only the named species
+        GET /api/species-sync/manifest/                 - name -> content hash of every CARES species
+        GET /api/species-sync/feed/?after=<SEQUENCE>    - species change log entries (creates, updates, deletions)
+
+    List, changes and manifest responses carry an ETag; a request whose
+    If-None-Match matches (weakly - compressed responses carry W/"...") gets
+    304 Not Modified.  Responses are gzip-compressed when accepted.
     """
 
     serializer_class = SpeciesSyncSerializer
     permission_classes = [IsAdminUser]
 
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        # compress only the API - site-wide GZipMiddleware would expose csrf tokens in pages to BREACH
+        return gzip_page(super().as_view(actions, **initkwargs))
+
+    def _conditional_response(self, request, queryset, build_response):
+        """Return 304 when If-None-Match matches the current ETag, otherwise build_response()."""
+        etag = _species_etag(request, queryset)
+        # weak comparison (RFC 9110 13.1.2): gzip_page sends the ETag back as W/"..."
+        if_none_match = {_strong_etag(tag) for tag in parse_etags(request.headers.get('If-None-Match', ''))}
+        if etag in if_none_match or '*' in if_none_match:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = build_response()
+        response['ETag'] = etag
+        return response
+
     def get_queryset(self):
         queryset = Species.objects.filter(render_cares=True).order_by('name')
 
@@ -66,16 +130,79 @@ class SpeciesSyncViewSet(viewsets.ReadOnlyModelViewSet):
             else:
                 logger.warning('species-sync: invalid since parameter "%s" ignored', since_param)
 
+        names = self.request.query_params.getlist('name')
+        if names:
+            queryset = queryset.filter(name__in=names)
+
         return queryset
 
     def list(self, request, *args, **kwargs):
         logger.info('species-sync list requested by user=%s', request.user.username)
-        return super().list(request, *args, **kwargs)
+        return self._conditional_response(
+            request, self.get_queryset(), lambda: super(SpeciesSyncViewSet, self).list(request, *args, **kwargs))
+
+    @action(detail=False, methods=['get'], url_path='changes')
+    def changes(self, request):
+        """Cursor-paginated CARES species ordered by (lastUpdated, id) - used by SpeciesSyncService."""
+        logger.info('species-sync changes requested by user=%s', request.user.username)
+        queryset = self.get_queryset()
+
+        def build_response():
+            paginator = SpeciesSyncCursorPagination()
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            return paginator.get_paginated_response(self.get_serializer(page, many=True).data)
+
+        return self._conditional_response(request, queryset, build_response)
+
+    @action(detail=False, methods=['get'], url_path='manifest')
+    def manifest(self, request):
+        """
+        Return the content hash of the SYNC_FIELDS of every CARES species, keyed by name.
+
+        Site1 compares these with hashes of its own records and fetches full records
+        (?name=...) only for the species that differ.
+        """
+        logger.info('species-sync manifest requested by user=%s', request.user.username)
+        queryset = Species.objects.filter(render_cares=True)
+
+        def build_response():
+            rows = queryset.order_by('name').values('name', *SYNC_FIELDS).iterator(chunk_size=2000)
+            species = {row['name']: sync_content_hash(row) for row in rows}
+            return Response({'server_time': timezone.now().isoformat(), 'species': species}, status=status.HTTP_200_OK)
+
+        return self._conditional_response(request, queryset, build_response)
+
+    @action(detail=False, methods=['get'], url_path='feed')
+    def feed(self, request):
+        """
+        Return species change log entries with sequence > ?after, oldest first.
+
+        Entries cover every species (not only CARES) so that deletions and species
+        leaving CARES are visible: render_cares is the flag after the change.
+        'last_sequence' is the value to pass as ?after next time.
+        """
+        try:
+            after = int(request.query_params.get('after', 0))
+            limit = int(request.query_params.get('limit', CHANGE_FEED_LIMIT))
+        except ValueError:
+            return Response({'detail': 'after and limit must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+        logger.info('species-sync feed after=%d requested by user=%s', after, request.user.username)
+
+        entries, more = read_change_feed(after, limit)
+        results = [{'sequence': entry.id, 'name': entry.species_name, 'action': entry.action,
+                    'render_cares': entry.render_cares} for entry in entries]
+        return Response({'results': results, 'last_sequence': entries[-1].id if entries else after, 'more': more},
+                        status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'], url_path='stats')
     def stats(self, request):
         """Return statistics about the CARES species available for sync."""
         logger.info('species-sync stats requested by user=%s', request.user.username)
+        # no ETag: server_time and change_sequence must be current for the sync high-water marks
+        return self._build_stats()
+
+    def _build_stats(self):
+        request = self.request
         total_cares = Species.objects.filter(render_cares=True).count()
 
         since_param = request.query_params.get('since')
@@ -90,9 +217,34 @@ class SpeciesSyncViewSet(viewsets.ReadOnlyModelViewSet):
         data = {
             'total_cares_species': total_cares,
             'server_time': timezone.now().isoformat(),
+            'change_sequence': change_feed_head(),
         }
         if recent_count is not None:
             data['updated_since'] = since_param
             data['updated_since_count'] = recent_count
 
         return Response(data, status=status.HTTP_200_OK)
+
+
+class SpeciesSyncRunViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only API viewset for the sync_species run history (Site1).
+
+    Endpoints:
+        GET /api/species-sync-runs/                                 - runs, newest first (paginated)
+        GET /api/species-sync-runs/?target_url=<URL>&mode=<MODE>    - runs against one target / in one mode
+        GET /api/species-sync-runs/<id>/                            - a single run
+    """
+
+    serializer_class = SpeciesSyncRunSerializer
+    permission_classes = [IsAdminUser]
+
+    def get_queryset(self):
+        queryset = SpeciesSyncRun.objects.all()
+        target_url = self.request.query_params.get('target_url')
+        if target_url:
+            queryset = queryset.filter(target_url=target_url)
+        mode = self.request.query_params.get('mode')
+        if mode:
+            queryset = queryset.filter(mode=mode)
+        return queryset
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SpeciesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'species'
+
+    def ready(self):
+        from . import signals  # noqa: F401 - registers signal handlers
@@ -1,12 +1,12 @@
-from species.models import Species, SpeciesInstance, AquaristClub, AquaristClubMember, BapGenus, ImportArchive, SpeciesImportStaging, SpeciesReferenceLink, User
+from species.models import Species, SpeciesInstance, AquaristClub, AquaristClubMember, BapGenus, BapSubmission, ImportArchive, SpeciesChangeLog, SpeciesImportStaging, SpeciesReferenceLink, User
 from species.forms import SpeciesForm, SpeciesInstanceForm, CaresRegistration
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import FileField, Q
 from django.db.models.functions import Lower
 #from django.contrib.auth.models import User
 from django.shortcuts import render
 from django.views.generic.base import View
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.core.files import File
 from django.utils import timezone
 from io import BytesIO
@@ -18,6 +18,9 @@ from io import StringIO, TextIOWrapper
 from django.core.files.base import ContentFile
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned, ValidationError
 from django.core.validators import URLValidator
+from species.services.species_changes import record_species_changes
+from species.services.species_counts import refresh_species_counts
+from species.services.species_search import index_species_ids
 
 logger = logging.getLogger(__name__)
 
@@ -66,138 +69,168 @@ SPECIES_TRACKED_FIELDS = (
 
 # Import Species List
 # iterate through csv rows add only valid and non-duplicate species to DB
+# rows are validated in memory against a name index loaded in one query, new species are written with
+# batched bulk_create inside a single transaction (bulk_create skips post_save so search tokens are built after)
+
+IMPORT_BATCH_SIZE = 500
 
 def import_csv_species (import_archive: ImportArchive, current_user: User):
     with open(import_archive.import_csv_file.path,'r', encoding="utf-8") as import_file:
+        import_rows = list(DictReader(import_file))
 
-        # create results csv file
-        csv_report_buffer = StringIO()
-        csv_report_writer = csv.writer(csv_report_buffer)
-        report_row = ["Species", "Import_Status"]
-        csv_report_writer.writerow(report_row)
+    # create results csv file
+    csv_report_buffer = StringIO()
+    csv_report_writer = csv.writer(csv_report_buffer)
+    report_row = ["Species", "Import_Status"]
+    csv_report_writer.writerow(report_row)
 
-        # batch process import one species per row
-        row_count = 0
-        import_count = 0
-        for import_row in DictReader(import_file):
-            row_count = row_count + 1
-            species_name = import_row['name']
-            species_cares_classification = import_row['cares_classification']
+    # existing species names (case-insensitive like the production collation) - new names are added as rows validate
+    known_names = {name.lower() for name in Species.objects.values_list('name', flat=True)}
 
-            # validate Species data using Form validation
-            species_form = SpeciesForm (import_row) # reads expected fields by header name
-            if species_form.is_valid():
-                species = species_form.save(commit=False)
-                
-                # validate input species name and verify non-duplicate
-                if not Species.objects.filter(name=species_name).exists():
-                    report_row = [species_name, "Validated: Species is unique and new, import successful"]
-                    import_count = import_count + 1
-                    newly_added_species = species_form.save()
-
-                    # special case: re-importing previous species may have media images - try to restore them
-                    species_image = import_row['species_image']
-                    if species_image != '':
-                        # seems like the following very simple 2 lines of code should happen via the species_form but it does not
-                        newly_added_species.species_image = species_image
-                        newly_added_species.save()
-
-                    #special case: update bool 'render_cares' value if species is 'Not a CARES Species' ('NOTC')
-                    if species_cares_classification != "NOTC":
-                        species.render_cares = True
-                        newly_added_species.save()
-                else:
-                    report_row = [species_name, "ERROR: species exists - cannot add duplicate species"]
+    # batch process import one species per row
+    row_count = 0
+    new_species = []
+    for import_row in import_rows:
+        row_count = row_count + 1
+        species_name = import_row['name']
+        species_cares_classification = import_row['cares_classification']
+
+        # validate Species data using Form validation
+        species_form = SpeciesForm (import_row) # reads expected fields by header name
+        if species_form.is_valid():
+            species = species_form.save(commit=False)
+            
+            # validate input species name and verify non-duplicate
+            if species_name.lower() not in known_names:
+                report_row = [species_name, "Validated: Species is unique and new, import successful"]
+                known_names.add(species_name.lower())
+
+                # special case: re-importing previous species may have media images - try to restore them
+                species_image = import_row['species_image']
+                if species_image != '':
+                    species.species_image = species_image
+
+                #special case: update bool 'render_cares' value if species is 'Not a CARES Species' ('NOTC')
+                if species_cares_classification != "NOTC":
+                    species.render_cares = True
+                new_species.append(species)
             else:
-                report_row = [species_name, "ERROR: validation failure - cannot save species"]
-            csv_report_writer.writerow(report_row)
+                report_row = [species_name, "ERROR: species exists - cannot add duplicate species"]
+        else:
+            report_row = [species_name, "ERROR: validation failure - cannot save species"]
+        csv_report_writer.writerow(report_row)
 
-        # persist import report
-        csv_report_file = ContentFile(csv_report_buffer.getvalue().encode('utf-8'))
-        csv_report_filename = current_user.get_display_name + "_species_import_log.csv"
-        import_archive.import_results_file.save(csv_report_filename, csv_report_file)
+    with transaction.atomic():
+        Species.objects.bulk_create(new_species, batch_size=IMPORT_BATCH_SIZE)
+        created = list(Species.objects.filter(name__in=[species.name for species in new_species]).only('id', 'name', 'render_cares'))
+        index_species_ids([species.id for species in created])
+        record_species_changes(created, SpeciesChangeLog.Action.CREATED)   # bulk_create skips the change log signal
+    import_count = len(new_species)
+    logger.info('User %s imported species: %d of %d rows added', current_user.username, import_count, row_count)
+
+    # persist import report
+    csv_report_file = ContentFile(csv_report_buffer.getvalue().encode('utf-8'))
+    csv_report_filename = current_user.get_display_name() + "_species_import_log.csv"
+    import_archive.import_results_file.save(csv_report_filename, csv_report_file)
 
-        # persist import archive
-        import_archive.import_status = ImportArchive.ImportStatus.PARTIAL
-        if import_count == 0:
-            import_archive.import_status = ImportArchive.ImportStatus.FAIL
-        else:
-            if import_count == row_count:
-                import_archive.import_status = ImportArchive.ImportStatus.FULL
-        import_archive.name = current_user.username + "_species_import"
-        import_archive.save()
+    # persist import archive
+    import_archive.import_status = ImportArchive.ImportStatus.PARTIAL
+    if import_count == 0:
+        import_archive.import_status = ImportArchive.ImportStatus.FAIL
+    else:
+        if import_count == row_count:
+            import_archive.import_status = ImportArchive.ImportStatus.FULL
+    import_archive.name = current_user.username + "_species_import"
+    import_archive.save()
     return
 
 # Import SpeciesInstance List
 # iterate through csv rows verifying unique speciesInstances matching current user
 # NOTE: users can have multiple instances of the same species assuming they vary in collection point or genetic traits
+# species referenced by the file and the user's existing instance names are loaded up front, new instances are bulk created
 
 def import_csv_speciesInstances (import_archive: ImportArchive, current_user: User):
     with open(import_archive.import_csv_file.path,'r', encoding="utf-8") as import_file:
+        import_rows = list(DictReader(import_file))
 
-        # create results csv file
-        csv_report_buffer = StringIO()
-        csv_report_writer = csv.writer(csv_report_buffer)
-        report_row = ["Species Instance Name", "Import_Status"]
-        csv_report_writer.writerow(report_row)
-
-        # batch process import one species per row
-        row_count = 0
-        import_count = 0
-        for import_row in DictReader(import_file):
-            row_count = row_count + 1
-            speciesInstance_user = import_row['aquarist']
-            speciesInstance_name = import_row['name']
-
-            # Note: current_user is of type django.utils.functional.SimpleLazyObject need a str type to compare with speciesInstance_user
-            current_user_str = str(current_user)
-            if (current_user_str == speciesInstance_user):
-
-                # validate Species exists - required to instantiate SpeciesInstance
-                species_name = import_row['species']
-                if Species.objects.filter(name=species_name).exists():
-                    species = Species.objects.get(name=species_name)
+    # create results csv file
+    csv_report_buffer = StringIO()
+    csv_report_writer = csv.writer(csv_report_buffer)
+    report_row = ["Species Instance Name", "Import_Status"]
+    csv_report_writer.writerow(report_row)
+
+    # Note: current_user is of type django.utils.functional.SimpleLazyObject need a str type to compare with speciesInstance_user
+    current_user_str = str(current_user)
+    # species and instance names are matched case-insensitively, like the production collation
+    species_names = {import_row['species'] for import_row in import_rows}
+    if connection.vendor == 'mysql':
+        # the utf8mb4 collation already compares case-insensitively - name__in keeps using the name index
+        candidates = Species.objects.filter(name__in=species_names)
+    else:
+        candidates = Species.objects.annotate(name_lower=Lower('name')).filter(name_lower__in={name.lower() for name in species_names})
+    species_by_name = {}
+    for species in candidates.order_by('id'):
+        species_by_name.setdefault(species.name.lower(), species)
+    known_instance_names = {name.lower() for name in SpeciesInstance.objects.filter(user=current_user).values_list('name', flat=True)}
 
-                    # validate pending SpeciesInstance object 
-                    # will foreign key species resolve by name? TBD
-                    
-                    speciesInstance_form = SpeciesInstanceForm (import_row) # reads expected fields by header name
-                    if speciesInstance_form.is_valid():
-                        species_instance = speciesInstance_form.save(commit=False)
-                        species_instance.species = species
-                        species_instance.user = current_user
-
-                        # validate instance is unique - not a duplicate - cannot rely on simply name: must use name, species name, and user
-                        if not SpeciesInstance.objects.filter(name=speciesInstance_name, user=current_user).exists():
-                            report_row = [speciesInstance_name, "Validated: species instance is unique and new for this user, import successful"]
-                            import_count = import_count + 1
-                            speciesInstance_form.save() # commits to DB
-                        else:
-                            report_row = [speciesInstance_name, "ERROR: species instance exists - cannot add duplicate"]
+    # batch process import one species per row
+    row_count = 0
+    new_instances = []
+    for import_row in import_rows:
+        row_count = row_count + 1
+        speciesInstance_user = import_row['aquarist']
+        speciesInstance_name = import_row['name']
+
+        if (current_user_str == speciesInstance_user):
+
+            # validate Species exists - required to instantiate SpeciesInstance
+            species_name = import_row['species']
+            species = species_by_name.get(species_name.lower())
+            if species is not None:
+
+                speciesInstance_form = SpeciesInstanceForm (import_row) # reads expected fields by header name
+                if speciesInstance_form.is_valid():
+                    species_instance = speciesInstance_form.save(commit=False)
+                    species_instance.species = species
+                    species_instance.user = current_user
+
+                    # validate instance is unique - not a duplicate - cannot rely on simply name: must use name, species name, and user
+                    if speciesInstance_name.lower() not in known_instance_names:
+                        report_row = [speciesInstance_name, "Validated: species instance is unique and new for this user, import successful"]
+                        known_instance_names.add(speciesInstance_name.lower())
+                        new_instances.append(species_instance)
                     else:
-                        report_row = [speciesInstance_name, "ERROR: validation failed - unable to create species instance"]
-                            
+                        report_row = [speciesInstance_name, "ERROR: species instance exists - cannot add duplicate"]
                 else:
-                    report_row = [speciesInstance_name, "ERROR: species ", species_name, " does not exist - required for species instance"]
+                    report_row = [speciesInstance_name, "ERROR: validation failed - unable to create species instance"]
+                        
             else:
-                report_row = [speciesInstance_name, "IGNORE: aquarist ", speciesInstance_user, " is not the active user: ", current_user]
-            csv_report_writer.writerow(report_row)
+                report_row = [speciesInstance_name, "ERROR: species ", species_name, " does not exist - required for species instance"]
+        else:
+            report_row = [speciesInstance_name, "IGNORE: aquarist ", speciesInstance_user, " is not the active user: ", current_user]
+        csv_report_writer.writerow(report_row)
 
+    with transaction.atomic():
+        SpeciesInstance.objects.bulk_create(new_instances, batch_size=IMPORT_BATCH_SIZE)
+        # bulk_create skips the signals maintaining the Species counters
+        refresh_species_counts({species_instance.species_id for species_instance in new_instances})
+    import_count = len(new_instances)
+    logger.info('User %s imported species instances: %d of %d rows added', current_user.username, import_count, row_count)
 
-        # persist import report
-        csv_report_file = ContentFile(csv_report_buffer.getvalue().encode('utf-8'))
-        csv_report_filename = current_user.get_display_name + "_species_instance_import_log.csv"
-        import_archive.import_results_file.save(csv_report_filename, csv_report_file)
+    # persist import report
+    csv_report_file = ContentFile(csv_report_buffer.getvalue().encode('utf-8'))
+    csv_report_filename = current_user.get_display_name() + "_species_instance_import_log.csv"
+    import_archive.import_results_file.save(csv_report_filename, csv_report_file)
 
-        # persist import archive
-        import_archive.import_status = ImportArchive.ImportStatus.PARTIAL
-        if import_count == 0:
-            import_archive.import_status = ImportArchive.ImportStatus.FAIL
-        else:
-            if import_count == row_count:
-                import_archive.import_status = ImportArchive.ImportStatus.FULL
-        import_archive.name = current_user.username + "_speciesInstance_import"
-        import_archive.save()
+    # persist import archive
+    import_archive.import_status = ImportArchive.ImportStatus.PARTIAL
+    if import_count == 0:
+        import_archive.import_status = ImportArchive.ImportStatus.FAIL
+    else:
+        if import_count == row_count:
+            import_archive.import_status = ImportArchive.ImportStatus.FULL
+    import_archive.name = current_user.username + "_speciesInstance_import"
+    import_archive.save()
     return
 
 
@@ -274,7 +307,7 @@ def import_csv_aquarist_clubs (import_archive: ImportArchive, current_user: User
 # Import BAP Genus List
 # iterate through csv rows check if example species exists, and add or update BAP Genus entries. Supports club import/update workflow
 
-def import_csv_bap_genus (import_archive: ImportArchive, current_user: User, bap_club: AquaristClub):
+def import_csv_bap_genus (import_archive: ImportArchive, current_user: User, bap_club: AquaristClub, progress=None):
     with open(import_archive.import_csv_file.path,'r', encoding="utf-8") as import_file:
 
         # create results csv file
@@ -288,6 +321,8 @@ def import_csv_bap_genus (import_archive: ImportArchive, current_user: User, bap
         import_count = 0
         for import_row in DictReader(import_file):
             row_count = row_count + 1
+            if progress:
+                progress(row_count)
             genus_name = import_row['name']
             bap_points = int(import_row['points'])
             example_species_name = import_row['example_species']
@@ -337,8 +372,8 @@ def import_csv_bap_genus (import_archive: ImportArchive, current_user: User, bap
                 
                 # set current species count for genus - will be zero but may be non-zero if species got added after BapGenus initialization
 
-                genus_species = Species.objects.filter(name__regex=r'^' + genus_name + r'\s')          # TODO optimize remove N+1 query
-                bap_genus.species_count = len(genus_species)  
+                genus_species = Species.objects.filter(genus=genus_name)
+                bap_genus.species_count = genus_species.count()  
                 print ('  BapGenus added: ' + bap_genus.name + ' current species count: ' + str(bap_genus.species_count))       
                 bap_genus.species_override_count = 0
 
@@ -406,10 +441,11 @@ def import_csv_bap_genus (import_archive: ImportArchive, current_user: User, bap
 # Iterate through CSV rows, look up each species by name (case-insensitive exact match),
 # validate the reference URL and name_prefix, then create and save a SpeciesReferenceLink.
 
-def import_csv_species_reference_links(import_archive: ImportArchive, current_user: User) -> dict:
+def import_csv_species_reference_links(import_archive: ImportArchive, current_user: User, progress=None) -> dict:
     """
     Process a CSV file to import SpeciesReferenceLink objects.
     Expected CSV columns: species, reference_url, name_prefix
+    progress is an optional callable(row_count) invoked as each row is processed.
     Returns a summary dict with keys:
         success_count  - number of rows imported successfully
         error_count    - number of rows that failed
@@ -429,6 +465,8 @@ def import_csv_species_reference_links(import_archive: ImportArchive, current_us
     with open(import_archive.import_csv_file.path, 'r', encoding='utf-8') as import_file:
         for import_row in DictReader(import_file):
             row_count = row_count + 1
+            if progress:
+                progress(row_count)
             raw_species_name = import_row.get('species', '')
             species_name = raw_species_name.strip()
             print ('CSV Reference Link Import Species: ' + species_name)
@@ -559,44 +597,62 @@ def import_csv_species_reference_links(import_archive: ImportArchive, current_us
 
 #Export Species List, SpeciesInstances, Aquarists, Clubs, BAP
 
-def export_csv_bap_genus(bap_club: AquaristClub):
-    bapGenusSet = BapGenus.objects.filter(club=bap_club)
-    response = HttpResponse (
-        content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="bap_genus_points_export.csv"'},
-    )
-    writer = csv.writer(response)
-    writer.writerow(['club', 'name', 'points', 'category', 'global_region', 'example_species', 'example_species_description'])
-    for bapGenus in bapGenusSet:
-        if bapGenus.example_species:
-            writer.writerow([bapGenus.club.acronym, bapGenus.name, bapGenus.points, bapGenus.example_species.category, bapGenus.example_species.global_region, 
-                            bapGenus.example_species.name, bapGenus.example_species.description])
-        else:
-            logger.error ('BAP Export error for club %s: BapGenus %s. has null example_species', bap_club.acronym, bapGenus.name)
-    return response
+# Exports stream rows to the client as they are read: querysets are walked with .iterator() in chunks
+# (FKs loaded via select_related) and each CSV row is yielded as soon as it is written, so memory stays
+# flat and the first bytes go out immediately regardless of table size.
 
+EXPORT_CHUNK_SIZE = 2000
 
-def export_csv_aquarists():
-    aquaristSet = User.objects.all()
-    response = HttpResponse (
+class EchoBuffer:
+    """Pseudo-buffer for csv.writer - write() returns the formatted row instead of storing it."""
+    def write(self, value):
+        return value
+
+
+def stream_csv_response(filename, header, rows):
+    writer = csv.writer(EchoBuffer())
+
+    def stream_rows():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    return StreamingHttpResponse (
+        stream_rows(),
         content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="aquarists_export.csv"'},
+        headers={"Content-Disposition": 'attachment; filename="' + filename + '"'},
     )
-    writer = csv.writer(response)
 
-    writer.writerow([
+
+def export_csv_bap_genus(bap_club: AquaristClub):
+    bapGenusSet = BapGenus.objects.filter(club=bap_club).select_related('club', 'example_species')
+    header = ['club', 'name', 'points', 'category', 'global_region', 'example_species', 'example_species_description']
+
+    def rows():
+        for bapGenus in bapGenusSet.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            if bapGenus.example_species:
+                yield [bapGenus.club.acronym, bapGenus.name, bapGenus.points, bapGenus.example_species.category, bapGenus.example_species.global_region, 
+                       bapGenus.example_species.name, bapGenus.example_species.description]
+            else:
+                logger.error ('BAP Export error for club %s: BapGenus %s. has null example_species', bapGenus.club.acronym, bapGenus.name)
+
+    return stream_csv_response('bap_genus_points_export.csv', header, rows())
+
+
+def export_csv_aquarists():
+    aquaristSet = User.objects.order_by('id')
+    header = [
        # id    username    email    first_name    last_name    state    country
         'id', 'username', 'email', 'first_name', 'last_name', 'state', 'country', 
        # is_private_name    is_private_email    is_email_blocked   is_private_location    date_joined
         'is_private_name', 'is_private_email', 'is_email_blocked', 'is_private_location', 'date_joined', 
        # is_admin    is_staff    is_species_admin    is_proxy   is_active 
-        'is_admin', 'is_staff', 'is_species_admin', 'is_proxy' 'is_active',
+        'is_admin', 'is_staff', 'is_species_admin', 'is_proxy', 'is_active',
        # instagram_url    facebook_url    youtube_url    prefer_tile_view
         'instagram_url', 'facebook_url', 'youtube_url', 'prefer_tile_view'
-        ])
+        ]
     
-    for user in aquaristSet:
-        writer.writerow([
+    rows = ([
             #    id       username       email       first_name       last_name       state       country
             user.id, user.username, user.email, user.first_name, user.last_name, user.state, user.country, 
             #    is_private_name       is_private_email       is_email_blocked       is_private_location       date_joined
@@ -605,19 +661,13 @@ def export_csv_aquarists():
             user.is_admin, user.is_staff, user.is_species_admin, user.is_proxy, user.is_active,
             #    instagram_url       facebook_url       youtube_url       prefer_tile_view
             user.instagram_url, user.facebook_url, user.youtube_url, user.prefer_tile_view
-            ])
+            ] for user in aquaristSet.iterator(chunk_size=EXPORT_CHUNK_SIZE))
         
-    return response
+    return stream_csv_response('aquarists_export.csv', header, rows)
 
 def export_csv_species():
-    speciesSet = Species.objects.all()
-    response = HttpResponse (
-        content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="species_export.csv"'},
-    )
-    writer = csv.writer(response)
-
-    writer.writerow([
+    speciesSet = Species.objects.select_related('created_by', 'last_edited_by')
+    header = [
        # id    name   alt_name    common_name     description    species_image    photo_credit           
         'id', 'name', 'alt_name', 'common_name', 'description', 'species_image', 'photo_credit', 
        # category    global_region    local_distribution 
@@ -626,10 +676,9 @@ def export_csv_species():
         'cares_family',         'cares_classification',  'cares_assessment_date',  'iucn_red_list', 'iucn_assessment_date', 
        # created   created_by     lastUpdated    last_edited_by    
         'created', 'created_by', 'lastUpdated', 'last_edited_by' 
-        ])
+        ]
     
-    for species in speciesSet:
-        writer.writerow([
+    rows = ([
             #       id          name          alt_name          common_name          description          species_image          photo_credit           
             species.id, species.name, species.alt_name, species.common_name, species.description, species.species_image, species.photo_credit, 
             #       category          global_region          local_distribution 
@@ -638,19 +687,13 @@ def export_csv_species():
             species.cares_family, species.cares_classification, species.cares_assessment_date, species.iucn_red_list, species.iucn_assessment_date,
             #       created          created_by          lastUpdated          last_edited_by    
             species.created, species.created_by, species.lastUpdated, species.last_edited_by
-            ])
+            ] for species in speciesSet.iterator(chunk_size=EXPORT_CHUNK_SIZE))
     
-    return response
+    return stream_csv_response('species_export.csv', header, rows)
 
 def export_csv_speciesInstances():
-    speciesInstances = SpeciesInstance.objects.all()
-    response = HttpResponse (
-        content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="species_instance_export.csv"'},
-    )
-    writer = csv.writer(response)
-
-    writer.writerow([
+    speciesInstances = SpeciesInstance.objects.select_related('user', 'species').order_by('id')
+    header = [
        # id    user    name    species    unique_traits    genetic_traits    collection_point
         'id' ,'user', 'name', 'species', 'unique_traits', 'genetic_traits', 'collection_point', 
        # acquired_from    year_acquired    aquarist_species_image aquarist_species_video_url 
@@ -659,9 +702,8 @@ def export_csv_speciesInstances():
         'aquarist_notes', 'have_spawned', 'spawning_notes', 'have_reared_fry', 'fry_rearing_notes', 'young_available', 'young_available_image', 
        # currently_keep    enable_species_log    log_is_private    cares_registered    created    lastUpdated           
         'currently_keep', 'enable_species_log', 'log_is_private', 'cares_registered', 'created', 'lastUpdated'
-        ])
-    for si in speciesInstances:
-        writer.writerow([
+        ]
+    rows = ([
             #  id     user              name     species     unique_traits     genetic_traits     collection_point
             si.id, si.user.username, si.name, si.species, si.unique_traits, si.genetic_traits, si.collection_point, 
             #  acquired_from     year_acquired     aquarist_species_image     aquarist_species_video_url 
@@ -670,104 +712,78 @@ def export_csv_speciesInstances():
             si.aquarist_notes, si.have_spawned, si.spawning_notes, si.have_reared_fry, si.fry_rearing_notes, si.young_available, si.young_available_image,
             # currently_keep      enable_species_log     log_is_private     cares_registered     created     lastUpdated           
             si.currently_keep, si.enable_species_log, si.log_is_private, si.cares_registered, si.created, si.lastUpdated
-        ])
+        ] for si in speciesInstances.iterator(chunk_size=EXPORT_CHUNK_SIZE))
 
-    return response
+    return stream_csv_response('species_instance_export.csv', header, rows)
 
 def export_csv_aquaristClubs():
-    clubs = AquaristClub.objects.all()
-    response = HttpResponse (
-        content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="aquarist_club_export.csv"'},
-    )
-    writer = csv.writer(response)
-
-    writer.writerow([
+    clubs = AquaristClub.objects.order_by('id')
+    header = [
        # id     name    acronym    about    logo_image    website    city    state    country   
         'id' , 'name', 'acronym', 'about', 'logo_image', 'website', 'city', 'state', 'country',
        # bap_guidelines    bap_notes_template    cares_muliplier    bap_start_date    bap_end_date
         'bap_guidelines', 'bap_notes_template', 'cares_muliplier', 'bap_start_date', 'bap_end_date',
        # is_bap_club is_cares_club require_member_approval created lastUpdated            
         'is_bap_club', 'is_cares_club', 'require_member_approval', 'created', 'lastUpdated'
-        ])
-    for club in clubs:
-        writer.writerow([
+        ]
+    rows = ([
             #    id       name        acronym      about       logo_image       website       city       state       country   
             club.id, club.name, club.acronym, club.about, club.logo_image, club.website, club.city, club.state, club.country,
             #    bap_guidelines       bap_notes_template       cares_muliplier       bap_start_date       bap_end_date
             club.bap_guidelines, club.bap_notes_template, club.cares_muliplier, club.bap_start_date, club.bap_end_date,
             #    is_bap_club       is_cares_club       require_member_approval       created       lastUpdated            
             club.is_bap_club, club.is_cares_club, club.require_member_approval, club.created, club.lastUpdated
-        ])
+        ] for club in clubs.iterator(chunk_size=EXPORT_CHUNK_SIZE))
 
-    return response
+    return stream_csv_response('aquarist_club_export.csv', header, rows)
 
 def export_csv_aquaristClubMembers():
-    club_members = AquaristClubMember.objects.all()
-    response = HttpResponse (
-        content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="aquarist_club_member_export.csv"'},
-    )
-    writer = csv.writer(response)
-     
-    writer.writerow([
+    club_members = AquaristClubMember.objects.select_related('club', 'user').order_by('id')
+    header = [
        # id  name club user membership_approved   
         'id', 'name', 'club', 'user', 'membership_approved',
        # bap_participant is_club_admin is_cares_admin 
         'bap_participant', 'is_club_admin', 'is_cares_admin',
        # date_requested last_updated 
         'date_requested', 'last_updated'
-        ])
-    for cm in club_members:
-        writer.writerow([
+        ]
+    rows = ([
             # id  name club user membership_approved   
             cm.id, cm.name, cm.club, cm.user, cm.membership_approved, 
             # bap_participant is_club_admin is_cares_admin 
             cm.bap_participant, cm.is_club_admin, cm.is_cares_admin, 
             # date_requested last_updated 
             cm.date_requested, cm.last_updated
-        ])
+        ] for cm in club_members.iterator(chunk_size=EXPORT_CHUNK_SIZE))
 
-    return response
+    return stream_csv_response('aquarist_club_member_export.csv', header, rows)
 
 
-def export_csv_bap_submissions():
-    bap_submissions = BapSubmission.objects.all()
-    response = HttpResponse (
-        content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="aquarist_club_member_export.csv"'},
-    )
-
-    writer = csv.writer(response)
-    writer.writerow([
-        # name   club    year    speciesInstance
-        'name', 'club', 'year', 'speciesInstance',
+def export_csv_bap_submissions(bap_club: AquaristClub):
+    bap_submissions = BapSubmission.objects.filter(club=bap_club).select_related('aquarist', 'speciesInstance').order_by('id')
+    header = [
+        # name   aquarist    year    speciesInstance
+        'name', 'aquarist', 'year', 'speciesInstance',
         # status   points    request_points_review    notes
         'status', 'points', 'request_points_review', 'notes',
         # breeder_comments    admin_comments  active  created lastUpdated
         'breeder_comments', 'admin_comments', 'active', 'created', 'lastUpdated'
-        ])
-    for bap_s in bap_submissions:
-        writer.writerow([
+        ]
+    rows = ([
             # name  aquarist   year speciesInstance
             bap_s.name, bap_s.aquarist, bap_s.year, bap_s.speciesInstance,
             #     status        points        request_points_review         notes
             bap_s.status, bap_s.points, bap_s.request_points_review, bap_s.notes,
             # breeder_comments    admin_comments  active  created lastUpdated
             bap_s.breeder_comments, bap_s.admin_comments, bap_s.active, bap_s.created, bap_s.lastUpdated
-        ])
+        ] for bap_s in bap_submissions.iterator(chunk_size=EXPORT_CHUNK_SIZE))
 
-    return response
+    return stream_csv_response('bap_submissions_export.csv', header, rows)
 
 
 def export_csv_caresRegistrations():
-    registrations = CaresRegistration.objects.all()
-    response = HttpResponse (
-        content_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="cares_registration_export.csv"'},
-    )
-    writer = csv.writer(response)
-    writer.writerow([
+    registrations = CaresRegistration.objects.select_related('affiliate_club', 'species', 'cares_approver', 'last_updated_by').order_by('id')
+    header = [
        # id name aquarist_name aquarist_email affiliate_club species collection_location
         'id' , 'name', 'aquarist_name', 'aquarist_email', 'affiliate_club', 'species', 'collection_location',
        # species_source year_acquired verification_photo species_has_spawned young_available offspring_shared
@@ -776,9 +792,8 @@ def export_csv_caresRegistrations():
         'cares_approver', 'approver_notes', 'status',
        # date_requested lastUpdated last_updated_by last_report_date
         'date_requested', 'lastUpdated', 'last_updated_by', 'last_report_date'
-        ])
-    for reg in registrations:
-        writer.writerow([
+        ]
+    rows = ([
             # id name aquarist_name aquarist_email affiliate_club species collection_location
             reg.id, reg.name, reg.aquarist_name, reg.aquarist_email, reg.affiliate_club, reg.species, reg.collection_location,
             # species_source year_acquired verification_photo species_has_spawned young_available offspring_shared
@@ -787,9 +802,9 @@ def export_csv_caresRegistrations():
             reg.cares_approver, reg.approver_notes, reg.status,
             # date_requested lastUpdated last_updated_by last_report_date
             reg.date_requested, reg.lastUpdated, reg.last_updated_by, reg.last_report_date
-        ])
+        ] for reg in registrations.iterator(chunk_size=EXPORT_CHUNK_SIZE))
 
-    return response
+    return stream_csv_response('cares_registration_export.csv', header, rows)
 
 
 # ---------------------------------------------------------------------------
@@ -857,7 +872,7 @@ def _build_changed_fields(existing_species: Species, import_row: dict) -> dict:
     return changed
 
 
-def import_csv_species_to_staging(import_archive: ImportArchive, current_user: User) -> dict:
+def import_csv_species_to_staging(import_archive: ImportArchive, current_user: User, progress=None) -> dict:
     """
     Parse a species CSV and create SpeciesImportStaging records for review.
 
@@ -868,6 +883,8 @@ def import_csv_species_to_staging(import_archive: ImportArchive, current_user: U
       - iucn_red_list         → UN  (Undefined)
       - cares_classification  → NOTC (Not a CARES Species)
 
+    progress is an optional callable(row_number) invoked as each row is processed.
+
     Returns a summary dict with counts: new, update, skip, conflict, error.
     """
     summary = {'new': 0, 'update': 0, 'skip': 0, 'conflict': 0, 'error': 0, 'total': 0}
@@ -881,6 +898,8 @@ def import_csv_species_to_staging(import_archive: ImportArchive, current_user: U
         for import_row in DictReader(import_file):
             row_number += 1
             summary['total'] += 1
+            if progress:
+                progress(row_number)
             species_name = import_row.get('name', '').strip()
             notes = ''
 
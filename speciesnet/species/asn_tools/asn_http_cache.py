@@ -0,0 +1,188 @@
+"""
+On-disk HTTP response cache for species data aggregation (FishBase scraping)
+
+Entries are keyed by the sha256 of the request url and stored as two files:
+  <key>.json  - metadata: url, final url, status code, negative flag, stored time
+  <key>.body  - response content
+Entries expire after a TTL (shorter for negative entries - 404 / "not a species page")
+and the least recently used entries are evicted once the cache exceeds its size cap.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600           # species pages change rarely
+DEFAULT_NEGATIVE_TTL_SECONDS = 7 * 24 * 3600   # retry missing species sooner
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+EVICT_TO_RATIO = 0.9                           # evict down to 90% of the cap to avoid evicting on every put
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    status_code: int
+    content: bytes
+    negative: bool
+
+
+class HttpCache:
+    """Thread-safe on-disk response cache with TTL, size cap and LRU eviction."""
+
+    def __init__(self, directory: str, ttl: int = DEFAULT_TTL_SECONDS,
+                 negative_ttl: int = DEFAULT_NEGATIVE_TTL_SECONDS, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = sum(size for _, _, size in self._entries())
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.directory, key[:2], key)
+        return base + '.json', base + '.body'
+
+    def _entries(self):
+        """Yield (key, last used time, size in bytes) for every stored entry."""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                key = name[:-5]
+                meta_path, body_path = self._paths(key)
+                try:
+                    size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+                    used = os.path.getmtime(meta_path)
+                except OSError:
+                    continue
+                yield key, used, size
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for url, or None when missing or expired."""
+        key = self.key(url)
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                meta = json.load(meta_file)
+            ttl = self.negative_ttl if meta['negative'] else self.ttl
+            if time.time() - meta['stored'] > ttl:
+                with self.lock:
+                    self.total_bytes -= self._remove(key)
+                return None
+            with open(body_path, 'rb') as body_file:
+                content = body_file.read()
+            os.utime(meta_path)   # mark as recently used for LRU eviction
+        except (OSError, ValueError, KeyError):
+            return None
+        return CachedResponse(meta['final_url'], meta['status_code'], content, meta['negative'])
+
+    def put(self, url: str, status_code: int, content: bytes, final_url: Optional[str] = None, negative: bool = False):
+        """Store a response; negative entries record that url has no usable page."""
+        key = self.key(url)
+        meta_path, body_path = self._paths(key)
+        meta = {
+            'url': url,
+            'final_url': final_url or url,
+            'status_code': status_code,
+            'negative': negative,
+            'stored': time.time(),
+        }
+        content = b'' if negative else content
+        try:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            with self.lock:
+                old_size = self._size(key)
+                # body first, then metadata: an entry is only visible once both are complete
+                self._write_atomic(body_path, content)
+                self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+                self.total_bytes += self._size(key) - old_size
+                if self.total_bytes > self.max_bytes:
+                    self._evict()
+        except OSError as e:
+            logger.warning('HTTP cache write failed for %s: %s', url, e)
+
+    def clear(self):
+        with self.lock:
+            for key, _, _ in list(self._entries()):
+                self._remove(key)
+            self.total_bytes = 0
+
+    def _size(self, key: str) -> int:
+        size = 0
+        for path in self._paths(key):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _write_atomic(self, path: str, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _remove(self, key: str) -> int:
+        removed = 0
+        for path in self._paths(key):
+            try:
+                removed += os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                pass
+        return removed
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is below EVICT_TO_RATIO of its cap."""
+        target = self.max_bytes * EVICT_TO_RATIO
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self.total_bytes = sum(size for _, _, size in entries)
+        for key, _, _ in entries:
+            if self.total_bytes <= target:
+                break
+            self.total_bytes -= self._remove(key)
+        logger.info('HTTP cache %s evicted to %d bytes', self.directory, self.total_bytes)
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_fishbase_cache() -> Optional[HttpCache]:
+    """Return the shared FishBase response cache, or None when FISHBASE_CACHE_DIR is not set."""
+    directory = getattr(settings, 'FISHBASE_CACHE_DIR', '')
+    if not directory:
+        return None
+    with _caches_lock:
+        cache = _caches.get(directory)
+        if cache is None:
+            try:
+                cache = HttpCache(
+                    directory,
+                    ttl=getattr(settings, 'FISHBASE_CACHE_TTL', DEFAULT_TTL_SECONDS),
+                    negative_ttl=getattr(settings, 'FISHBASE_CACHE_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL_SECONDS),
+                    max_bytes=getattr(settings, 'FISHBASE_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES),
+                )
+            except OSError as e:
+                logger.warning('FishBase response cache disabled - cannot use %s: %s', directory, e)
+                return None
+            _caches[directory] = cache
+        return cache
@@ -15,22 +15,96 @@ import csv
 import logging
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
 from typing import Optional, Tuple, Dict, List
+from urllib.parse import urlsplit
 
 import requests
-from bs4 import BeautifulSoup
-from django.http import HttpResponse
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import CData, NavigableString, Tag
+from django.conf import settings
 from django.core.files.base import ContentFile
-from species.models import ImportArchive, User
+from species.models import ImportArchive, SpeciesAggregationResult, User
+from species.asn_tools.asn_http_cache import get_fishbase_cache
+from species.services.http_client import RETRY_STATUS_CODES, get_session, retry_delay
 
 logger = logging.getLogger(__name__)
 
-# Rate limiting to not choke website traffic
-REQUEST_DELAY = 2.0  # seconds between requests
-CHUNK_SIZE = 10  # Process 10 species at a time (workaround to avoid timeouts)
-#TODO: Implement celery and process the CSV asynchronously
+# Rate limiting to not choke website traffic - requests are spread over FISHBASE_MAX_WORKERS
+# threads but every request to a host first takes a token from that host's shared bucket
+REQUEST_DELAY = 2.0  # default seconds between requests (settings.FISHBASE_REQUESTS_PER_SECOND overrides)
+REQUEST_BURST = 1    # requests a host may receive back to back after an idle period
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a request may be sent."""
+
+    def __init__(self, rate: float, capacity: int = REQUEST_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_host_limiters = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url: str) -> TokenBucket:
+    """Return the process-wide TokenBucket for the url's host."""
+    host = urlsplit(url).netloc.lower()
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            rate = getattr(settings, 'FISHBASE_REQUESTS_PER_SECOND', 1 / REQUEST_DELAY)
+            limiter = TokenBucket(rate)
+            _host_limiters[host] = limiter
+        return limiter
+
+
+class FishBaseUnavailable(Exception):
+    """FishBase could not be reached or answered with an unexpected status - worth retrying later."""
+
+
+def fishbase_get(url: str, **kwargs) -> requests.Response:
+    """
+    GET through the pooled FishBase session, throttled by the per-host rate limiter.
+
+    Connection errors and RETRY_STATUS_CODES are retried here rather than by the
+    session, so every attempt - retries after a 429 included - takes its own token.
+    The last response is returned once settings.HTTP_CLIENT_RETRIES are used up.
+    """
+    limiter = get_rate_limiter(url)
+    session = get_session('fishbase', retries=False)
+    retries = getattr(settings, 'HTTP_CLIENT_RETRIES', 3)
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        response = None
+        try:
+            response = session.get(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                return response
+        time.sleep(retry_delay(attempt + 1, response))
 
 
 def is_valid_binomial(species_name: str) -> bool:
@@ -71,7 +145,7 @@ def test_network_connectivity():
     print("="*60) 
     try:
         print("Testing FishBase connection...")
-        response = requests.get("https://www.fishbase.se", timeout=5)
+        response = fishbase_get("https://www.fishbase.se", timeout=5)
         print(f"FishBase reachable (status: {response.status_code})")
     except Exception as e:
         print(f"ERROR: FishBase unreachable: {e}")
@@ -80,10 +154,16 @@ def test_network_connectivity():
     return
 
 
-def get_fishbase_url(species_name: str) -> Optional[str]:
+def fetch_fishbase_page(species_name: str) -> Optional[Tuple[str, bytes]]:
     """
-    Construct FishBase URL directly using species name.
+    Fetch the FishBase summary page for a species, constructing the URL directly.
     Format: https://www.fishbase.se/summary/Genus-species
+
+    Returns (final url, page content) for a valid species page, otherwise None.
+    Raises FishBaseUnavailable for network errors and unexpected status codes.
+    The content is handed to parse_fishbase_data so each page is downloaded once.
+    Pages and 404 / not-a-species-page results are kept in the FishBase response
+    cache, so reruns on overlapping species lists are answered locally.
     """
     try:
         print(f'Constructing FishBase URL for: {species_name}')
@@ -92,10 +172,17 @@ def get_fishbase_url(species_name: str) -> Optional[str]:
         url_formatted_name = species_name.replace(' ', '-')
         direct_url = f"https://www.fishbase.se/summary/{url_formatted_name}"
         
-        print(f'Testing URL: {direct_url}')
-        time.sleep(REQUEST_DELAY)
+        cache = get_fishbase_cache()
+        cached = cache.get(direct_url) if cache else None
+        if cached:
+            if cached.negative:
+                print(f'WARNING: Species not in FishBase (cached {cached.status_code})')
+                return None
+            print(f'Valid species page found (cached): {cached.url}')
+            return cached.url, cached.content
         
-        response = requests.get(direct_url, timeout=15, allow_redirects=True)
+        print(f'Testing URL: {direct_url}')
+        response = fishbase_get(direct_url, timeout=15, allow_redirects=True)
         
         if response.status_code == 200:
             # Verify this is actually a species page with content
@@ -103,282 +190,392 @@ def get_fishbase_url(species_name: str) -> Optional[str]:
             if 'distribution' in content or 'biology' in content or 'classification' in content:
                 print(f'Valid species page found: {response.url}')
                 logger.info(f"FishBase URL found: {species_name}")
-                return response.url
+                if cache:
+                    cache.put(direct_url, response.status_code, response.content, final_url=response.url)
+                return response.url, response.content
             else:
                 print(f'WARNING: Page exists but appears to be error/not found page')
+                if cache:
+                    cache.put(direct_url, response.status_code, b'', negative=True)
                 return None
         elif response.status_code == 404:
             print(f'WARNING: Species not in FishBase (404)')
+            if cache:
+                cache.put(direct_url, response.status_code, b'', negative=True)
             return None
         else:
             print(f'WARNING: Unexpected status: {response.status_code}')
-            return None
+            raise FishBaseUnavailable(f'FishBase returned HTTP {response.status_code} for {direct_url}')
             
+    except FishBaseUnavailable:
+        raise
+    except requests.RequestException as e:
+        print(f"WARNING: Exception: {e}")
+        logger.error(f"Error accessing FishBase for {species_name}: {e}")
+        raise FishBaseUnavailable(str(e)) from e
     except Exception as e:
         print(f"WARNING: Exception: {e}")
         logger.error(f"Error accessing FishBase for {species_name}: {e}")
         return None
 
 
-def extract_distribution(soup: BeautifulSoup) -> Optional[str]:
-    """Extract ONLY the geographic distribution text"""
-    try:
-        # Method 1: Find the distribution table row
-        for tr in soup.find_all('tr'):
-            header = tr.find(['th', 'td', 'b'])
-            if header and 'distribution' in header.get_text().lower():
-                # Get the next cell or paragraph
-                content_cell = tr.find_all('td')
-                if len(content_cell) > 1:
-                    text = content_cell[1].get_text(strip=True)
-                    # Clean up
-                    text = re.sub(r'Territories\|.*?Faunafri', '', text)
-                    text = re.sub(r'Size / Weight.*', '', text)
-                    text = re.sub(r'Short description.*', '', text)
-                    text = ' '.join(text.split())
-                    if len(text) > 20 and len(text) < 800:
-                        return text
-        
-        # Method 2: Look for geographic keywords in standalone paragraphs
-        for p in soup.find_all('p'):
-            text = p.get_text(strip=True)
-            
-            # Must start with a region
-            if not any(text.startswith(region) for region in [
-                'Africa:', 'Asia:', 'Europe:', 'Oceania:', 
-                'Central America:', 'South America:', 'North America:'
-            ]):
-                continue
-            
-            # Must be reasonable length
-            if len(text) < 20 or len(text) > 800:
-                continue
-            
-            # Must not contain navigation
-            if any(nav in text for nav in ['Territories|', 'FAO areas|', 'Click here']):
+### Single-pass FishBase page extraction
+
+# Only these tags (with everything nested in them) are built into the parse tree -
+# scripts, styles and page chrome outside them are skipped by the parser
+FISHBASE_PAGE_TAGS = ['title', 'tr', 'th', 'td', 'p', 'div', 'span', 'b']
+
+# String types get_text() includes (comments, scripts and styles are excluded)
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+IUCN_STATUS_RE = re.compile(r'(Extinct|Extinct in the Wild|Critically Endangered|Endangered|Vulnerable|Near Threatened|Least Concern|Data Deficient|Not Evaluated)\s*\(([A-Z]{2,3})\)')
+IUCN_STATUS_CODES = ['(LC)', '(NT)', '(VU)', '(EN)', '(CR)', '(EW)', '(EX)', '(DD)', '(NE)']
+ENGLISH_NAME_RE = re.compile(r'English\s+name', re.IGNORECASE)
+REF_RE = re.compile(r'\(Ref\.\d+\)')
+URL_RE = re.compile(r'http[s]?://\S+')
+
+DISTRIBUTION_REGIONS = ('Africa:', 'Asia:', 'Europe:', 'Oceania:', 'Central America:', 'South America:', 'North America:')
+DISTRIBUTION_NAV = ['Territories|', 'FAO areas|', 'Click here']
+DISTRIBUTION_MENU = ['Territories|FAO', 'Occurrences|Point', 'Ecosystems|']
+DISTRIBUTION_PATTERNS = [
+    'Central America:', 'South America:', 'Africa:', 'Asia:', 'Oceania:', 'Europe:',
+    'Atlantic slope', 'Pacific slope', 'endemic to', 'River', 'Basin', 'known only from'
+]
+
+BIOLOGY_SKIP = [
+    'Glossary', 'Life cycle and mating', 'Main reference',
+    'Upload your references', 'Trophic ecology', 'Food items',
+    'Maturity|Reproduction', 'Click here', '(e.g. epibenthic)',
+    'Distribution', 'Territories|FAO', 'Short description'
+]
+BIOLOGY_INDICATORS = [
+    'inhabits', 'found in', 'occurs in', 'feeds on', 'diet consists',
+    'omnivore', 'herbivore', 'carnivore', 'prefers', 'lives in',
+    'spawns', 'breeds', 'temperature', 'depth', 'substrate',
+    'abundant in', 'common in', 'endemic to', 'aquarium conditions'
+]
+BIOLOGY_BREAK_POINTS = [
+    'Life cycle and mating', 'Main reference', 'IUCN Red List', 'Threat to humans',
+    'Human uses', 'Short description', 'Distribution', 'Size / Weight'
+]
+
+CONSERVATION_KEYWORDS = [
+    'threat', 'decline', 'habitat loss', 'pollution',
+    'overfishing', 'endangered', 'vulnerable', 'extinct',
+    'conservation', 'protected', 'rare', 'population decline'
+]
+CONSERVATION_NAV = ['IUCN Red List Status', 'Click here', 'References']
+
+
+def make_fishbase_soup(content) -> BeautifulSoup:
+    """Parse FishBase page content with lxml, building only the tags the extractors read."""
+    return BeautifulSoup(content, 'lxml', parse_only=SoupStrainer(FISHBASE_PAGE_TAGS))
+
+
+class FishBasePageIndex:
+    """
+    One walk over a parsed page.
+
+    Every tag gets a record in document order: its name, the span of its text in
+    a shared list of stripped text fragments and the index of its last descendant.
+    get_text(strip=True) of any tag is then a join over a slice of that list, and
+    the tags around 'IUCN Red List Status' / 'English name' strings are noted on
+    the way, so no extractor has to search or re-walk the tree.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.fragments = []
+        self.tags = []
+        self.names = []
+        self.starts = []
+        self.ends = []
+        self.last_descendant = []
+        self.index_of = {}
+        self.iucn_parents = []          # nearest tr/div/p/td around each 'IUCN Red List Status' string
+        self.english_name_parents = []  # nearest tr/td/div around each 'English name' string
+        self.title = None
+        self._texts = {}
+        self._walk(soup)
+
+    def _nearest(self, stack, names):
+        for idx, _ in reversed(stack):
+            if idx >= 0 and self.names[idx] in names:
+                return idx
+        return None
+
+    def _walk(self, soup):
+        stack = [(-1, iter(soup.contents))]
+        while stack:
+            idx, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if idx >= 0:
+                    self.ends[idx] = len(self.fragments)
+                    self.last_descendant[idx] = len(self.tags) - 1
                 continue
-            
-            # Clean and return
-            text = re.sub(r'Size / Weight.*', '', text)
-            text = ' '.join(text.split())
-            return text
-        
-        # Method 3: Look in elements containing geographic keywords
-        for element in soup.find_all(['td', 'div', 'p']):
-            text = element.get_text(strip=True)
-            
-            if any(skip in text for skip in ['Territories|FAO', 'Occurrences|Point', 'Ecosystems|']):
-                parts = text.split('Faunafri')
-                if len(parts) > 1:
-                    cleaned = parts[1].strip()
-                    # Remove common junk patterns
-                    cleaned = re.sub(r'Size / Weight.*', '', cleaned)
-                    cleaned = re.sub(r'Short description.*', '', cleaned)
-                    cleaned = ' '.join(cleaned.split())
-                    if len(cleaned) > 20 and len(cleaned) < 800:
-                        return cleaned
+            if isinstance(child, Tag):
+                child_idx = len(self.tags)
+                self.tags.append(child)
+                self.names.append(child.name)
+                self.starts.append(len(self.fragments))
+                self.ends.append(None)
+                self.last_descendant.append(None)
+                self.index_of[id(child)] = child_idx
+                if child.name == 'title' and self.title is None:
+                    self.title = child
+                stack.append((child_idx, iter(child.contents)))
                 continue
-            
-            if any(pattern in text for pattern in [
-                'Central America:', 'South America:', 'Africa:', 'Asia:', 'Oceania:', 'Europe:',
-                'Atlantic slope', 'Pacific slope', 'endemic to', 'River', 'Basin', 'known only from'
-            ]):
-                cleaned = re.sub(r'Territories\|FAO.*?Faunafri', '', text)
-                cleaned = re.sub(r'Size / Weight.*', '', cleaned)
-                cleaned = re.sub(r'Short description.*', '', cleaned)
-                cleaned = re.sub(r'http[s]?://\S+', '', cleaned)
-                cleaned = ' '.join(cleaned.split())
-                
-                if len(cleaned) > 20 and len(cleaned) < 800:
-                    return cleaned
-        
-        return None
-        
-    except Exception as e:
-        print(f'Error extracting distribution: {e}')
+            if 'IUCN Red List Status' in child:
+                parent = self._nearest(stack, ('tr', 'div', 'p', 'td'))
+                if parent is not None:
+                    self.iucn_parents.append(parent)
+            if ENGLISH_NAME_RE.search(child):
+                parent = self._nearest(stack, ('tr', 'td', 'div'))
+                if parent is not None:
+                    self.english_name_parents.append(parent)
+            if type(child) in TEXT_STRING_TYPES:
+                text = child.strip()
+                if text:
+                    self.fragments.append(text)
+
+    def text(self, idx: int) -> str:
+        """get_text(strip=True) of the tag at record idx."""
+        text = self._texts.get(idx)
+        if text is None:
+            text = ''.join(self.fragments[self.starts[idx]:self.ends[idx]])
+            self._texts[idx] = text
+        return text
+
+
+def _clean_distribution(text: str) -> str:
+    text = re.sub(r'Size / Weight.*', '', text)
+    text = re.sub(r'Short description.*', '', text)
+    return ' '.join(text.split())
+
+
+def _distribution_from_row(page: FishBasePageIndex, idx: int) -> Optional[str]:
+    """Distribution table row: header cell mentions distribution, second cell holds the text."""
+    header = None
+    cells = []
+    for child_idx in range(idx + 1, page.last_descendant[idx] + 1):
+        name = page.names[child_idx]
+        if header is None and name in ('th', 'td', 'b'):
+            header = child_idx
+            if 'distribution' not in page.text(header).lower():
+                return None
+        if name == 'td':
+            cells.append(child_idx)
+            if len(cells) > 1:
+                break
+    if header is None or len(cells) < 2:
         return None
+    text = re.sub(r'Territories\|.*?Faunafri', '', page.text(cells[1]))
+    text = _clean_distribution(text)
+    if 20 < len(text) < 800:
+        return text
+    return None
 
 
-def extract_biology(soup: BeautifulSoup) -> Optional[str]:
-    """Extract ONLY the biology/ecology narrative text"""
+def _distribution_from_paragraph(text: str) -> Optional[str]:
+    """Standalone paragraph starting with a region."""
+    if not text.startswith(DISTRIBUTION_REGIONS):
+        return None
+    if len(text) < 20 or len(text) > 800:
+        return None
+    if any(nav in text for nav in DISTRIBUTION_NAV):
+        return None
+    text = re.sub(r'Size / Weight.*', '', text)
+    return ' '.join(text.split())
+
+
+def _distribution_from_block(text: str) -> Optional[str]:
+    """Any text block containing geographic keywords (or the distribution menu block)."""
+    if any(skip in text for skip in DISTRIBUTION_MENU):
+        parts = text.split('Faunafri')
+        if len(parts) > 1:
+            cleaned = _clean_distribution(parts[1].strip())
+            if 20 < len(cleaned) < 800:
+                return cleaned
+        return None
+    if any(pattern in text for pattern in DISTRIBUTION_PATTERNS):
+        cleaned = re.sub(r'Territories\|FAO.*?Faunafri', '', text)
+        cleaned = re.sub(r'Size / Weight.*', '', cleaned)
+        cleaned = re.sub(r'Short description.*', '', cleaned)
+        cleaned = URL_RE.sub('', cleaned)
+        cleaned = ' '.join(cleaned.split())
+        if 20 < len(cleaned) < 800:
+            return cleaned
+    return None
+
+
+def _biology_part(text: str) -> Optional[str]:
+    if any(skip in text for skip in BIOLOGY_SKIP):
+        return None
+    # Skip if it's just the environment line
+    if text.startswith('Freshwater;') and 'Tropical' in text and len(text) < 200:
+        return None
+    lower = text.lower()
+    if not any(indicator in lower for indicator in BIOLOGY_INDICATORS):
+        return None
+    cleaned = REF_RE.sub('', text)
+    cleaned = URL_RE.sub('', cleaned)
+    cleaned = re.sub(r'\|[A-Z][a-z]+\s*\|', '', cleaned)
+    for break_point in BIOLOGY_BREAK_POINTS:
+        if break_point in cleaned:
+            cleaned = cleaned.split(break_point)[0]
+    cleaned = ' '.join(cleaned.split())
+    if 20 < len(cleaned) < 800:
+        return cleaned
+    return None
+
+
+def _conservation_note(text: str) -> Optional[str]:
+    lower = text.lower()
+    if not any(keyword in lower for keyword in CONSERVATION_KEYWORDS):
+        return None
+    if any(nav in text for nav in CONSERVATION_NAV):
+        return None
+    cleaned = REF_RE.sub('', text)
+    cleaned = URL_RE.sub('', cleaned)
+    cleaned = ' '.join(cleaned.split())
+    if 20 < len(cleaned) < 500:
+        return cleaned
+    return None
+
+
+def _iucn_status(text: str) -> Optional[str]:
+    match = IUCN_STATUS_RE.search(text)
+    if match:
+        return match.group(1) + ' (' + match.group(2) + ')'
+    return None
+
+
+def _common_name(page: FishBasePageIndex) -> Optional[str]:
+    # Look in title - often format is "Scientific name, Common name"
+    if page.title is not None:
+        text = page.title.get_text()
+        if ',' in text:
+            common = text.split(',')[1].strip()
+            common = re.sub(r'\s+FishBase', '', common)
+            common = re.sub(r'\s+\(.*?\)', '', common)
+            if 0 < len(common) < 50:
+                return common
+    # Look for "English name" label and take the next cell
+    for idx in page.english_name_parents:
+        next_elem = page.tags[idx].find_next_sibling()
+        if next_elem:
+            next_idx = page.index_of.get(id(next_elem))
+            name = page.text(next_idx) if next_idx is not None else next_elem.get_text(strip=True)
+            if 0 < len(name) < 50:
+                return name
+    return None
+
+
+def extract_fishbase_fields(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+    """
+    Extract every FishBase field from one walk of the page.
+
+    Returns a dict with keys common_name, distribution, biology,
+    conservation_notes and iucn_status (None when not found).
+    """
+    fields = dict.fromkeys(['common_name', 'distribution', 'biology', 'conservation_notes', 'iucn_status'])
     try:
-        biology_text_parts = []
-        
-        # Look for the biology section - typically after "Biology" header
-        for element in soup.find_all(['p', 'div', 'td']):
-            text = element.get_text(strip=True)
-            
-            # Skip navigation and headers
-            if any(skip in text for skip in [
-                'Glossary', 'Life cycle and mating', 'Main reference',
-                'Upload your references', 'Trophic ecology', 'Food items',
-                'Maturity|Reproduction', 'Click here', '(e.g. epibenthic)',
-                'Distribution', 'Territories|FAO', 'Short description'
-            ]):
+        page = FishBasePageIndex(soup)
+
+        distribution_row = distribution_paragraph = distribution_block = None
+        biology_parts = []
+        conservation = None
+        iucn_fallback = None
+
+        for idx, name in enumerate(page.names):
+            if name == 'tr':
+                if distribution_row is None:
+                    distribution_row = _distribution_from_row(page, idx)
                 continue
-            
-            # Skip if it's just the environment line
-            if text.startswith('Freshwater;') and 'Tropical' in text and len(text) < 200:
+            if name not in ('p', 'div', 'td', 'span'):
                 continue
-            
-            # Look for actual biology sentences
-            biology_indicators = [
-                'inhabits', 'found in', 'occurs in', 'feeds on', 'diet consists',
-                'omnivore', 'herbivore', 'carnivore', 'prefers', 'lives in',
-                'spawns', 'breeds', 'temperature', 'depth', 'substrate',
-                'abundant in', 'common in', 'endemic to', 'aquarium conditions'
-            ]
-            
-            if any(indicator in text.lower() for indicator in biology_indicators):
-                # Clean the text
-                cleaned = text
-                
-                # Remove reference citations like (Ref.12345)
-                cleaned = re.sub(r'\(Ref\.\d+\)', '', cleaned)
-                
-                # Remove URLs
-                cleaned = re.sub(r'http[s]?://\S+', '', cleaned)
-                
-                # Remove navigation pipes
-                cleaned = re.sub(r'\|[A-Z][a-z]+\s*\|', '', cleaned)
-                
-                # Stop at certain break points
-                for break_point in [
-                    'Life cycle and mating',
-                    'Main reference',
-                    'IUCN Red List',
-                    'Threat to humans',
-                    'Human uses',
-                    'Short description',
-                    'Distribution',
-                    'Size / Weight'
-                ]:
-                    if break_point in cleaned:
-                        cleaned = cleaned.split(break_point)[0]
-                
-                cleaned = ' '.join(cleaned.split())
-                
-                if 20 < len(cleaned) < 800:
-                    biology_text_parts.append(cleaned)
-        
-        # Combine and deduplicate
-        if biology_text_parts:
-            # Join unique parts
-            combined = ' '.join(biology_text_parts)
-            # Remove duplicates that sometimes appear
+            text = page.text(idx)
+            if iucn_fallback is None and any(code in text for code in IUCN_STATUS_CODES):
+                iucn_fallback = _iucn_status(text)
+            if name == 'span':
+                continue
+            if name == 'p' and distribution_paragraph is None:
+                distribution_paragraph = _distribution_from_paragraph(text)
+            if distribution_block is None:
+                distribution_block = _distribution_from_block(text)
+            biology_part = _biology_part(text)
+            if biology_part:
+                biology_parts.append(biology_part)
+            if conservation is None:
+                conservation = _conservation_note(text)
+
+        fields['distribution'] = distribution_row or distribution_paragraph or distribution_block
+        if biology_parts:
+            combined = ' '.join(biology_parts)
             if len(combined) > 50:
-                return combined[:800]  # Cap at 800 chars
-        
-        return None
-        
+                fields['biology'] = combined[:800]  # Cap at 800 chars
+        fields['conservation_notes'] = conservation
+        for idx in page.iucn_parents:
+            fields['iucn_status'] = _iucn_status(page.text(idx))
+            if fields['iucn_status']:
+                break
+        if not fields['iucn_status']:
+            fields['iucn_status'] = iucn_fallback
+        fields['common_name'] = _common_name(page)
+
     except Exception as e:
-        print(f'Error extracting biology: {e}')
-        return None
+        print(f'Error extracting FishBase page fields: {e}')
+        logger.error(f"Error extracting FishBase page fields: {e}")
+    return fields
+
+
+def extract_distribution(soup: BeautifulSoup) -> Optional[str]:
+    """Extract ONLY the geographic distribution text"""
+    return extract_fishbase_fields(soup)['distribution']
+
+
+def extract_biology(soup: BeautifulSoup) -> Optional[str]:
+    """Extract ONLY the biology/ecology narrative text"""
+    return extract_fishbase_fields(soup)['biology']
 
 
 def extract_conservation_notes(soup: BeautifulSoup) -> Optional[str]:
     """Extract conservation-relevant notes (threats, habitat loss, etc.)"""
-    try:
-        for element in soup.find_all(['p', 'div', 'td']):
-            text = element.get_text(strip=True)
-            
-            # Look for conservation keywords
-            conservation_keywords = [
-                'threat', 'decline', 'habitat loss', 'pollution',
-                'overfishing', 'endangered', 'vulnerable', 'extinct',
-                'conservation', 'protected', 'rare', 'population decline'
-            ]
-            
-            if any(keyword in text.lower() for keyword in conservation_keywords):
-                # Skip navigation
-                if any(nav in text for nav in ['IUCN Red List Status', 'Click here', 'References']):
-                    continue
-                
-                # Clean
-                cleaned = re.sub(r'\(Ref\.\d+\)', '', text)
-                cleaned = re.sub(r'http[s]?://\S+', '', cleaned)
-                cleaned = ' '.join(cleaned.split())
-                
-                if 20 < len(cleaned) < 500:
-                    return cleaned
-        
-        return None
-        
-    except Exception as e:
-        print(f'Error extracting conservation notes: {e}')
-        return None
+    return extract_fishbase_fields(soup)['conservation_notes']
 
 
 def extract_iucn_from_fishbase(soup: BeautifulSoup) -> Optional[str]:
     """Extract JUST the IUCN status code"""
-    try:
-        # Look for IUCN Red List Status
-        for element in soup.find_all(text=re.compile(r'IUCN Red List Status')):
-            parent = element.find_parent(['tr', 'div', 'p', 'td'])
-            if parent:
-                text = parent.get_text(strip=True)
-                
-                # Extract just the status
-                pattern = r'(Extinct|Extinct in the Wild|Critically Endangered|Endangered|Vulnerable|Near Threatened|Least Concern|Data Deficient|Not Evaluated)\s*\(([A-Z]{2,3})\)'
-                match = re.search(pattern, text)
-                if match:
-                    return match.group(1) + ' (' + match.group(2) + ')'
-        
-        # Fallback: look for status codes directly
-        for element in soup.find_all(['td', 'div', 'p', 'span']):
-            text = element.get_text(strip=True)
-            
-            if any(code in text for code in ['(LC)', '(NT)', '(VU)', '(EN)', '(CR)', '(EW)', '(EX)', '(DD)', '(NE)']):
-                pattern = r'(Extinct|Extinct in the Wild|Critically Endangered|Endangered|Vulnerable|Near Threatened|Least Concern|Data Deficient|Not Evaluated)\s*\(([A-Z]{2,3})\)'
-                match = re.search(pattern, text)
-                if match:
-                    return match.group(1) + ' (' + match.group(2) + ')'
-        
-        return None
-        
-    except Exception as e:
-        print(f'Error extracting IUCN: {e}')
-        return None
+    return extract_fishbase_fields(soup)['iucn_status']
 
 
 def extract_common_name(soup: BeautifulSoup) -> Optional[str]:
     """Extract the common/English name"""
+    return extract_fishbase_fields(soup)['common_name']
+
+
+def get_fishbase_data(fishbase_url: str) -> Dict[str, str]:
+    """Fetch a FishBase species page by url and extract its data (see parse_fishbase_data)."""
+    cache = get_fishbase_cache()
+    cached = cache.get(fishbase_url) if cache else None
+    if cached and not cached.negative:
+        return parse_fishbase_data(cached.content)
     try:
-        # Look in title or header
-        title = soup.find('title')
-        if title:
-            text = title.get_text()
-            # Often format is "Scientific name, Common name"
-            if ',' in text:
-                parts = text.split(',')
-                if len(parts) > 1:
-                    common = parts[1].strip()
-                    # Remove any extra junk
-                    common = re.sub(r'\s+FishBase', '', common)
-                    common = re.sub(r'\s+\(.*?\)', '', common)
-                    if len(common) > 0 and len(common) < 50:
-                        return common
-        
-        # Look for "Common names" section or English name
-        for element in soup.find_all(text=re.compile(r'English\s+name', re.IGNORECASE)):
-            parent = element.find_parent(['tr', 'td', 'div'])
-            if parent:
-                # Get next sibling or cell
-                next_elem = parent.find_next_sibling()
-                if next_elem:
-                    name = next_elem.get_text(strip=True)
-                    if len(name) > 0 and len(name) < 50:
-                        return name
-        
-        return None
-        
+        print(f'Scraping FishBase page: {fishbase_url}')
+        response = fishbase_get(fishbase_url, timeout=15)
+        response.raise_for_status()
     except Exception as e:
-        print(f'Error extracting common name: {e}')
-        return None
+        print(f'ERROR fetching FishBase page: {e}')
+        logger.error(f"Error fetching FishBase page {fishbase_url}: {e}")
+        return parse_fishbase_data(b'')
+    if cache:
+        cache.put(fishbase_url, response.status_code, response.content, final_url=response.url)
+    return parse_fishbase_data(response.content)
 
 
-def get_fishbase_data(fishbase_url: str) -> Dict[str, str]:
-    """Extract CLEAN, conservation-relevant data from FishBase species page."""
+def parse_fishbase_data(content: bytes) -> Dict[str, str]:
+    """Extract CLEAN, conservation-relevant data from FishBase species page content."""
     result = {
         'common_name': '',
         'distribution': '',
@@ -387,53 +584,42 @@ def get_fishbase_data(fishbase_url: str) -> Dict[str, str]:
         'iucn_status': ''
     }
     
+    if not content:
+        return result
+    
     try:
-        print(f'Scraping FishBase page: {fishbase_url}')
-        time.sleep(REQUEST_DELAY)
-        response = requests.get(fishbase_url, timeout=15)
-        response.raise_for_status()
+        soup = make_fishbase_soup(content)
+        fields = extract_fishbase_fields(soup)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract common name
-        print('  Looking for Common Name...')
-        common_name = extract_common_name(soup)
+        common_name = fields['common_name']
         if common_name:
             result['common_name'] = common_name
             print(f'  Common Name: {common_name}')
         else:
             print('  WARNING: Common Name not found')
         
-        # Extract Distribution
-        print('  Looking for Distribution...')
-        distribution = extract_distribution(soup)
+        distribution = fields['distribution']
         if distribution:
             result['distribution'] = distribution
             print(f'  Distribution found: {distribution[:80]}...')
         else:
             print('  WARNING: Distribution not found')
         
-        # Extract Biology
-        print('  Looking for Biology...')
-        biology = extract_biology(soup)
+        biology = fields['biology']
         if biology:
             result['biology'] = biology
             print(f'  Biology found: {biology[:80]}...')
         else:
             print('  WARNING: Biology not found')
         
-        # Extract Conservation Notes
-        print('  Looking for Conservation Notes...')
-        conservation = extract_conservation_notes(soup)
+        conservation = fields['conservation_notes']
         if conservation:
             result['conservation_notes'] = conservation
             print(f'  Conservation: {conservation[:80]}...')
         else:
             print('  INFO: Conservation notes not found')
         
-        # Extract IUCN Status
-        print('  Looking for IUCN Red List Status...')
-        iucn_status = extract_iucn_from_fishbase(soup)
+        iucn_status = fields['iucn_status']
         if iucn_status:
             result['iucn_status'] = iucn_status
             print(f'  IUCN Status: {iucn_status}')
@@ -444,7 +630,7 @@ def get_fishbase_data(fishbase_url: str) -> Dict[str, str]:
         
     except Exception as e:
         print(f'ERROR scraping FishBase page: {e}')
-        logger.error(f"Error scraping FishBase data from {fishbase_url}: {e}")
+        logger.error(f"Error scraping FishBase page data: {e}")
         return result
 
 
@@ -476,16 +662,17 @@ def enrich_species_row(row: Dict[str, str]) -> Tuple[Dict[str, str], Optional[st
     
     try:
         print(f'\nAttempting FishBase lookup for: {clean_name}')
-        fishbase_url = get_fishbase_url(clean_name)
+        fishbase_page = fetch_fishbase_page(clean_name)
         
-        if fishbase_url:
+        if fishbase_page:
+            fishbase_url, fishbase_content = fishbase_page
             print(f'FishBase URL found: {fishbase_url}')
             enriched_row['FishBase URL'] = fishbase_url
             species_data_found = True
             
             try:
                 print(f'Extracting CLEAN data from FishBase page')
-                fishbase_data = get_fishbase_data(fishbase_url)
+                fishbase_data = parse_fishbase_data(fishbase_content)
                 
                 if fishbase_data['common_name']:
                     enriched_row['Common Name'] = fishbase_data['common_name']
@@ -508,6 +695,8 @@ def enrich_species_row(row: Dict[str, str]) -> Tuple[Dict[str, str], Optional[st
         else:
             print(f'WARNING: FishBase URL not found for: {clean_name}')
             
+    except FishBaseUnavailable:
+        raise   # not a result - the caller retries the species later
     except Exception as fb_e:
         print(f'ERROR FishBase lookup exception: {fb_e}')
         logger.error(f"FishBase lookup error for {clean_name}: {fb_e}")
@@ -521,10 +710,24 @@ def enrich_species_row(row: Dict[str, str]) -> Tuple[Dict[str, str], Optional[st
     return enriched_row, None
 
 
-def collect_species_data_as_csv(import_archive: ImportArchive, current_user: User):
+def collect_species_data(import_archive: ImportArchive, current_user: User, progress=None,
+                         raise_on_unavailable: bool = False) -> str:
     """
-    Process species CSV in chunks to avoid timeout issues.
-    Each chunk processes CHUNK_SIZE species before saving progress.
+    Enrich the species CSV of an ImportArchive with FishBase data.
+
+    Runs out of band as a BackgroundJob (see species.services.background_jobs).
+    Species are fetched concurrently by FISHBASE_MAX_WORKERS threads, throttled
+    globally to FISHBASE_REQUESTS_PER_SECOND per host.  The per-species report is saved
+    to import_archive.import_results_file and the enriched CSV is returned as text.
+
+    Each enriched row is checkpointed as a SpeciesAggregationResult as soon as it
+    completes; a rerun for the same archive only fetches the rows still missing.
+
+    Args:
+        progress: optional callable(rows_done, rows_total) invoked after each species
+        raise_on_unavailable: raise FishBaseUnavailable (after checkpointing every other
+            row) if any species could not be fetched, so the run can be retried; otherwise
+            those species are reported as needing research
     """
     import sys
     
@@ -538,7 +741,7 @@ def collect_species_data_as_csv(import_archive: ImportArchive, current_user: Use
             print(f"[{elapsed:.1f}s] {msg}", flush=True)
             sys.stdout.flush()
         
-        tprint("=== STARTING CHUNKED CSV COLLECTION ===")
+        tprint("=== STARTING CSV COLLECTION ===")
         
         # Test network once at start
         test_network_connectivity()
@@ -546,7 +749,7 @@ def collect_species_data_as_csv(import_archive: ImportArchive, current_user: Use
 
         # Read CSV
         csv_reader = csv.DictReader(input_csv_file)
-        input_fieldnames = list(csv_reader.fieldnames)
+        input_fieldnames = list(csv_reader.fieldnames or [])
         
         if not input_fieldnames or 'Species' not in input_fieldnames:
             raise ValueError("CSV must contain 'Species' column")
@@ -554,10 +757,8 @@ def collect_species_data_as_csv(import_archive: ImportArchive, current_user: Use
         # Convert to list
         rows = list(csv_reader)
         total_species = len(rows)
-        num_chunks = (total_species + CHUNK_SIZE - 1) // CHUNK_SIZE  # Ceiling division
         
-        tprint(f"Processing {total_species} species in {num_chunks} chunks of {CHUNK_SIZE}")
-        tprint(f"Estimated time: {(total_species * REQUEST_DELAY * 2)/60:.1f} minutes")
+        tprint(f"Processing {total_species} species")
         
         # Ensure our columns are in the output
         required_columns = [
@@ -574,12 +775,9 @@ def collect_species_data_as_csv(import_archive: ImportArchive, current_user: Use
             if col not in output_fieldnames:
                 output_fieldnames.append(col)
         
-        # Create response with DictWriter
-        response = HttpResponse(
-            content_type="text/csv",
-            headers={"Content-Disposition": 'attachment; filename="species_data_collection.csv"'},
-        )
-        result_writer = csv.DictWriter(response, fieldnames=output_fieldnames)
+        # Enriched output csv
+        csv_output_buffer = StringIO()
+        result_writer = csv.DictWriter(csv_output_buffer, fieldnames=output_fieldnames)
         result_writer.writeheader()
         
         # Create report
@@ -587,63 +785,73 @@ def collect_species_data_as_csv(import_archive: ImportArchive, current_user: Use
         csv_report_writer = csv.writer(csv_report_buffer)
         csv_report_writer.writerow(["Species", "Data_Collection_Status", "Details"])
         
-        enriched_rows = []
-        needs_research_rows = []
+        needs_research_count = 0
         lookup_success_count = 0
         species_count = 0
+        max_workers = max(1, getattr(settings, 'FISHBASE_MAX_WORKERS', 1))
+        rate = getattr(settings, 'FISHBASE_REQUESTS_PER_SECOND', 1 / REQUEST_DELAY)
+        
+        tprint(f"Estimated time: {(total_species * 2 / rate)/60:.1f} minutes ({max_workers} workers)")
+        logger.info(f"Starting species data aggregation for {total_species} species...")
+        
+        # Resume from rows checkpointed by an earlier (failed or interrupted) run
+        enriched_results = [None] * total_species
+        checkpoint = {result.row_number: result
+                      for result in SpeciesAggregationResult.objects.filter(import_archive=import_archive)}
+        for idx, row in enumerate(rows):
+            saved = checkpoint.get(idx + 1)
+            if saved is not None and saved.species_name == row.get('Species', ''):
+                enriched_results[idx] = (saved.enriched_row, saved.error_reason or None)
+        species_count = sum(1 for result in enriched_results if result is not None)
+        if species_count:
+            tprint(f"Resuming from checkpoint: {species_count}/{total_species} species already enriched")
+            if progress:
+                progress(species_count, total_species)
+        pending = [idx for idx, result in enumerate(enriched_results) if result is None]
+        unavailable_count = 0
+        
+        # Enrich concurrently - worker threads only do network and parsing; results are
+        # collected and checkpointed here (database access stays on this thread)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fishbase') as executor:
+            futures = {executor.submit(enrich_species_row, rows[idx]): idx for idx in pending}
+            for future in as_completed(futures):
+                idx = futures[future]
+                try:
+                    enriched_results[idx] = future.result()
+                except FishBaseUnavailable as e:
+                    # not checkpointed - fetched again when the run is retried
+                    unavailable_count += 1
+                    enriched_results[idx] = (rows[idx].copy(), f"FishBase unavailable: {e}")
+                else:
+                    enriched_row, error_reason = enriched_results[idx]
+                    SpeciesAggregationResult.objects.update_or_create(
+                        import_archive=import_archive, row_number=idx + 1,
+                        defaults={'species_name': rows[idx].get('Species', ''), 'enriched_row': enriched_row,
+                                  'error_reason': (error_reason or '')[:240]})
+                species_count += 1
+                tprint(f"[{species_count}/{total_species}] Completed: {rows[idx].get('Species', 'Unknown')}")
+                if progress:
+                    progress(species_count, total_species)
         
-        logger.info(f"Starting species data aggregation for {total_species} species in {num_chunks} chunks...")
+        if unavailable_count and raise_on_unavailable:
+            raise FishBaseUnavailable(f"{unavailable_count} of {total_species} species could not be fetched - "
+                                      f"{total_species - unavailable_count} completed rows are checkpointed")
         
-        # Process in manageable chunks to avoid timeouts (timeout workaround) TODO: Implement celery and process the CSV asynchronously
-        for chunk_num in range(num_chunks):
-            chunk_start = chunk_num * CHUNK_SIZE
-            chunk_end = min(chunk_start + CHUNK_SIZE, total_species)
-            chunk = rows[chunk_start:chunk_end]
-            
-            tprint(f"\n{'='*60}")
-            tprint(f"PROCESSING CHUNK {chunk_num + 1}/{num_chunks}")
-            tprint(f"Species {chunk_start + 1} to {chunk_end} of {total_species}")
-            tprint(f"{'='*60}")
-            
-            chunk_start_time = time.time()
+        for row, (enriched_row, error_reason) in zip(rows, enriched_results):
+            species_name = row.get('Species', 'Unknown')
             
-            # Process each row in the chunk
-            for idx_in_chunk, row in enumerate(chunk):
-                global_idx = chunk_start + idx_in_chunk + 1
-                species_name = row.get('Species', 'Unknown')
+            if error_reason:
+                enriched_row['Research Needed Reason'] = error_reason
+                needs_research_count += 1
                 
-                elapsed = time.time() - start_time
-                tprint(f"[{global_idx}/{total_species}] Starting: {species_name}")
-                
-                logger.info(f"Processing row {global_idx}/{total_species}: {species_name}")
-                
-                enriched_row, error_reason = enrich_species_row(row)
-                species_count += 1
-                
-                if error_reason:
-                    enriched_row['Research Needed Reason'] = error_reason
-                    needs_research_rows.append(enriched_row)
-                    
-                    result_row = {k: v for k, v in enriched_row.items() if k in output_fieldnames}
-                    result_writer.writerow(result_row)
-                    csv_report_writer.writerow([species_name, "Needs Research", error_reason])
-                else:
-                    enriched_rows.append(enriched_row)
-                    lookup_success_count += 1
-                    
-                    result_writer.writerow(enriched_row)
-                    csv_report_writer.writerow([species_name, "Success", "Data found"])
+                result_row = {k: v for k, v in enriched_row.items() if k in output_fieldnames}
+                result_writer.writerow(result_row)
+                csv_report_writer.writerow([species_name, "Needs Research", error_reason])
+            else:
+                lookup_success_count += 1
                 
-                tprint(f"[{global_idx}/{total_species}] Completed: {species_name}")
-            
-            chunk_elapsed = time.time() - chunk_start_time
-            tprint(f"\nChunk {chunk_num + 1} completed in {chunk_elapsed:.1f}s")
-            tprint(f"Progress: {chunk_end}/{total_species} ({(chunk_end/total_species)*100:.1f}%)")
-            
-            # Brief pause between chunks
-            if chunk_num < num_chunks - 1:
-                tprint("Pausing 2 seconds before next chunk...")
-                time.sleep(2)
+                result_writer.writerow(enriched_row)
+                csv_report_writer.writerow([species_name, "Success", "Data found"])
         
         total_time = time.time() - start_time
         tprint(f"\n{'='*60}")
@@ -652,7 +860,7 @@ def collect_species_data_as_csv(import_archive: ImportArchive, current_user: Use
         tprint(f"Successful: {lookup_success_count}/{total_species}")
         tprint(f"{'='*60}")
         
-        logger.info(f"Enrichment complete: {lookup_success_count} enriched, {len(needs_research_rows)} need research")
+        logger.info(f"Enrichment complete: {lookup_success_count} enriched, {needs_research_count} need research")
         
         # Persist report
         csv_report_file = ContentFile(csv_report_buffer.getvalue().encode('utf-8'))
@@ -670,4 +878,4 @@ def collect_species_data_as_csv(import_archive: ImportArchive, current_user: Use
         import_archive.name = current_user.username + "_species_data_collection"
         import_archive.save()
 
-    return response
\ No newline at end of file
+    return csv_output_buffer.getvalue()
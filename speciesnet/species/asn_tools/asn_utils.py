@@ -9,6 +9,8 @@ from django.utils import timezone
 from urllib.parse import urlparse
 import logging, bleach, re
 
+logger = logging.getLogger(__name__)
+
 # user_can_edit | user_is_admin
 
 def user_is_admin (cur_user: User):
@@ -85,6 +87,24 @@ def user_can_edit_sml (cur_user: User, speciesMaintenanceLog: SpeciesMaintenance
                     userCanEdit = True;                   # allow all contributors to edit/delete
     return userCanEdit
 
+# Club membership lookups are cached on the user object: request.user is loaded once per request, so all
+# user_can_edit_club / user_is_club_member / user_is_pending_club_member calls in a request share one query
+
+def get_club_memberships (cur_user: User):
+    memberships = getattr(cur_user, '_club_memberships', None)
+    if memberships is None:
+        memberships = {}
+        for member in AquaristClubMember.objects.filter(user=cur_user).only('id', 'club_id', 'membership_approved', 'is_club_admin', 'is_cares_admin'):
+            memberships.setdefault(member.club_id, []).append(member)
+        cur_user._club_memberships = memberships
+    return memberships
+
+def get_club_membership_entries (cur_user: User, club: AquaristClub):
+    if club is None:
+        return []
+    return get_club_memberships(cur_user).get(club.id, [])
+
+
 def user_can_edit_club (cur_user: User, club: AquaristClub):
     userCanEdit = False
     if cur_user.is_authenticated:    
@@ -92,16 +112,16 @@ def user_can_edit_club (cur_user: User, club: AquaristClub):
             userCanEdit = True
         else:
             print ('user_can_edit_club: seeing if member exists')
-            try:
-                member = AquaristClubMember.objects.get(user=cur_user, club=club) 
+            members = get_club_membership_entries(cur_user, club)
+            if len(members) == 1:
+                member = members[0]
                 if (member.is_club_admin or member.is_cares_admin):
                     userCanEdit = True
                     print ('Club Member is club admin: ' + cur_user.username)
-            except ObjectDoesNotExist:
+            elif len(members) == 0:
                 pass # user is not a member 
                 print ('Club Member not found: ' + cur_user.username + ' can join')
-            except MultipleObjectsReturned:
-                error_msg = "Club Members: duplicate members found!"
+            else:
                 print ('Error multiple objects found AquaristClubMember: ' + cur_user.username)
                 logger.error('Club edit check: multiple entries found for %s', cur_user.username)
     return userCanEdit
@@ -110,14 +130,11 @@ def user_can_edit_club (cur_user: User, club: AquaristClub):
 def user_is_club_member (cur_user: User, club: AquaristClub):
     user_is_member = False
     if cur_user.is_authenticated:    
-        try:
-            member = AquaristClubMember.objects.get(user=cur_user, club=club, membership_approved=True) 
+        members = [member for member in get_club_membership_entries(cur_user, club) if member.membership_approved]
+        if len(members) == 1:
             user_is_member = True
             print ('Club Member found: ' + cur_user.username)
-        except ObjectDoesNotExist:
-            pass # user is not a member 
-        except MultipleObjectsReturned:
-            error_msg = "Club Members: duplicate members found!"
+        elif len(members) > 1:
             print ('Error multiple objects found AquaristClubMember: ' + cur_user.username)
             logger.error('Club member check: multiple entries found for %s', cur_user.username)
     return user_is_member
@@ -125,14 +142,11 @@ def user_is_club_member (cur_user: User, club: AquaristClub):
 def user_is_pending_club_member (cur_user: User, club: AquaristClub):
     user_is_pending = False
     if cur_user.is_authenticated:    
-        try:
-            member = AquaristClubMember.objects.get(user=cur_user, club=club, membership_approved=False) 
+        members = [member for member in get_club_membership_entries(cur_user, club) if not member.membership_approved]
+        if len(members) == 1:
             user_is_pending = True
             print ('Club Member found: ' + cur_user.username)
-        except ObjectDoesNotExist:
-            pass # user is not a pending member 
-        except MultipleObjectsReturned:
-            error_msg = "Club Members: duplicate members found!"
+        elif len(members) > 1:
             print ('Error multiple objects found AquaristClubMember: ' + cur_user.username)
             logger.error('Club member check: multiple entries found for %s', cur_user.username)
     return user_is_pending
@@ -0,0 +1,153 @@
+import contextlib
+import io
+import json
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from species.asn_tools import asn_species_aggregation as aggregation
+
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(aggregation.__file__), os.pardir, 'tests', 'fishbase_corpus')
+EXPECTED_FILE = 'expected.json'
+FIELDS = ['common_name', 'distribution', 'biology', 'conservation_notes', 'iucn_status']
+
+# extract_* functions benchmarked on pre-parsed pages, with the result field each fills
+EXTRACTORS = [
+    ('extract_common_name', 'common_name'),
+    ('extract_distribution', 'distribution'),
+    ('extract_biology', 'biology'),
+    ('extract_conservation_notes', 'conservation_notes'),
+    ('extract_iucn_from_fishbase', 'iucn_status'),
+    ('extract_fishbase_fields', None),
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark FishBase page extraction offline against the saved-HTML corpus and report field accuracy'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--corpus',
+            default=DEFAULT_CORPUS_DIR,
+            help='Directory of saved FishBase pages (*.html) with expected.json (default: species/tests/fishbase_corpus)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Times each page is processed per measurement (default: 20)',
+        )
+        parser.add_argument(
+            '--add',
+            metavar='SPECIES',
+            help='Fetch the FishBase page for "Genus species" into the corpus and record its current extraction '
+                 'as expected (network access required - review expected.json afterwards)',
+        )
+
+    def handle(self, *args, **options):
+        corpus_dir = os.path.abspath(options['corpus'])
+        if not os.path.isdir(corpus_dir):
+            raise CommandError(f'Corpus directory not found: {corpus_dir}')
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+
+        if options['add']:
+            self.add_page(corpus_dir, options['add'])
+
+        pages, expected = self.load_corpus(corpus_dir)
+        iterations = options['iterations']
+        total_kb = sum(len(content) for content in pages.values()) / 1024
+        self.stdout.write(f'Corpus: {len(pages)} pages ({total_kb:.0f} KB) from {corpus_dir}')
+        self.stdout.write(f'Iterations: {iterations}\n')
+
+        # extraction code prints progress for every page - keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = {name: aggregation.parse_fishbase_data(content) for name, content in pages.items()}
+            timings = [
+                ('parse_fishbase_data (parse + extract)',
+                 self.measure(lambda: [aggregation.parse_fishbase_data(c) for c in pages.values()], iterations)),
+                ('make_fishbase_soup (parse only)',
+                 self.measure(lambda: [aggregation.make_fishbase_soup(c) for c in pages.values()], iterations)),
+            ]
+            soups = [aggregation.make_fishbase_soup(content) for content in pages.values()]
+            for function_name, _ in EXTRACTORS:
+                function = getattr(aggregation, function_name)
+                timings.append((function_name, self.measure(lambda: [function(soup) for soup in soups], iterations)))
+
+        self.stdout.write('Throughput:')
+        for label, seconds in timings:
+            pages_per_second = len(pages) * iterations / seconds if seconds else float('inf')
+            ms_per_page = seconds * 1000 / (len(pages) * iterations)
+            self.stdout.write(f'  {label:<40} {pages_per_second:>10.1f} pages/s  {ms_per_page:>8.2f} ms/page')
+
+        self.report_accuracy(results, expected)
+
+    def load_corpus(self, corpus_dir):
+        expected_path = os.path.join(corpus_dir, EXPECTED_FILE)
+        expected = {}
+        if os.path.exists(expected_path):
+            with open(expected_path, 'r', encoding='utf-8') as expected_file:
+                expected = json.load(expected_file)
+        pages = {}
+        for name in sorted(os.listdir(corpus_dir)):
+            if name.endswith('.html'):
+                with open(os.path.join(corpus_dir, name), 'rb') as page_file:
+                    pages[name] = page_file.read()
+        if not pages:
+            raise CommandError(f'No .html pages in {corpus_dir}')
+        return pages, expected
+
+    @staticmethod
+    def measure(run, iterations):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            run()
+        return time.perf_counter() - start
+
+    def report_accuracy(self, results, expected):
+        self.stdout.write('\nField accuracy (exact match with expected.json):')
+        checked = [name for name in results if name in expected]
+        if not checked:
+            self.stdout.write(self.style.WARNING('  No expected values recorded for these pages'))
+            return
+        mismatches = []
+        for field in FIELDS:
+            matched = 0
+            for name in checked:
+                if results[name][field] == expected[name].get(field, ''):
+                    matched += 1
+                else:
+                    mismatches.append((name, field))
+            self.stdout.write(f'  {field:<20} {matched}/{len(checked)}  ({matched * 100 / len(checked):.0f}%)')
+        unchecked = sorted(set(results) - set(checked))
+        if unchecked:
+            self.stdout.write(self.style.WARNING(f'  No expected values for: {", ".join(unchecked)}'))
+        if mismatches:
+            for name, field in mismatches:
+                self.stdout.write(self.style.ERROR(f'  MISMATCH {name} {field}: {results[name][field]!r}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'All fields match for {len(checked)} pages'))
+
+    def add_page(self, corpus_dir, species_name):
+        clean_name = aggregation.clean_species_name(species_name)
+        try:
+            page = aggregation.fetch_fishbase_page(clean_name)
+        except aggregation.FishBaseUnavailable as e:
+            raise CommandError(f'FishBase unavailable: {e}')
+        if page is None:
+            raise CommandError(f'No FishBase species page found for {clean_name}')
+        _, content = page
+        filename = clean_name.replace(' ', '-') + '.html'
+        with open(os.path.join(corpus_dir, filename), 'wb') as page_file:
+            page_file.write(content)
+
+        expected_path = os.path.join(corpus_dir, EXPECTED_FILE)
+        expected = {}
+        if os.path.exists(expected_path):
+            with open(expected_path, 'r', encoding='utf-8') as expected_file:
+                expected = json.load(expected_file)
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected[filename] = aggregation.parse_fishbase_data(content)
+        with open(expected_path, 'w', encoding='utf-8') as expected_file:
+            json.dump(dict(sorted(expected.items())), expected_file, indent=4, ensure_ascii=False)
+            expected_file.write('\n')
+        self.stdout.write(self.style.SUCCESS(f'Added {filename} to the corpus'))
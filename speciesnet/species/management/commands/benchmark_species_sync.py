@@ -0,0 +1,134 @@
+import logging
+import time
+import tracemalloc
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from species.models import Species, SpeciesChangeLog
+from species.services.species_sync import SpeciesSyncService
+from species.services.species_sync_stub import STUB_NAME_PREFIX, StubSite2Server, SyntheticCatalog
+
+# (label, catalog revision) - each pass syncs the whole catalog
+PASSES = [
+    ('initial sync (all new)', 0),
+    ('resync (unchanged)', 0),
+    ('resync (all changed)', 1),
+]
+
+# sync modes benchmarked - an incremental (?since=) sync runs the same code as full on fewer records
+MODES = ('full', 'manifest', 'changes')
+
+
+class Command(BaseCommand):
+    help = ('Benchmark SpeciesSyncService end to end against a local synthetic Site2 and report '
+            'records/second, queries per record and peak memory.  Each batch commits as in production; '
+            f'the "{STUB_NAME_PREFIX} ..." species are deleted afterwards unless --keep')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--species', type=int, default=2000, help='Synthetic CARES species served (default: 2000)')
+        parser.add_argument('--latency', type=float, default=0, metavar='MS',
+                            help='Milliseconds added to every API response (default: 0)')
+        parser.add_argument('--page-size', type=int, default=100, help='Species per API page (default: 100)')
+        parser.add_argument('--mode', choices=MODES, default='full',
+                            help='Sync mode: full (sync), manifest (sync_manifest) or changes (sync_changes) '
+                                 '(default: full)')
+        parser.add_argument('--keep', action='store_true', default=False,
+                            help=f'Keep the synced "{STUB_NAME_PREFIX} ..." species instead of deleting them')
+        parser.add_argument('--min-records-per-second', type=float, metavar='N',
+                            help='Fail if any pass syncs fewer records per second')
+        parser.add_argument('--max-queries-per-record', type=float, metavar='N',
+                            help='Fail if any pass runs more database queries per record')
+
+    def handle(self, *args, **options):
+        if options['species'] < 1 or options['page_size'] < 1 or options['latency'] < 0:
+            raise CommandError('--species and --page-size must be at least 1 and --latency not negative')
+        existing = Species.objects.filter(name__startswith=STUB_NAME_PREFIX + ' ').count()
+        if existing:
+            # left by an earlier --keep run - the initial pass must create the whole catalog
+            self.stdout.write(self.style.WARNING(f'Deleting {existing} "{STUB_NAME_PREFIX} ..." species left by an earlier run'))
+            self.delete_stub_species()
+
+        catalog = SyntheticCatalog(options['species'])
+        server = StubSite2Server(catalog, latency=options['latency'] / 1000, page_size=options['page_size']).start()
+        self.stdout.write(f'Synthetic Site2: {catalog.size} species, page size {server.page_size}, '
+                          f'latency {options["latency"]:g} ms at {server.url}, {options["mode"]} sync\n')
+
+        # per-species log lines would dominate the timings
+        sync_logger = logging.getLogger('species.services.species_sync')
+        log_level = sync_logger.level
+        sync_logger.setLevel(logging.WARNING)
+        # no outer transaction: every batch pays its own commit, as in production
+        self.sequence = 0
+        try:
+            results = [self.run_pass(server, catalog, revision, options['mode']) for _, revision in PASSES]
+        finally:
+            sync_logger.setLevel(log_level)
+            server.stop()
+            if not options['keep']:
+                self.delete_stub_species()
+
+        self.stdout.write(f'{"Pass":<24} {"Fetched":>8} {"Seconds":>8} {"Records/s":>10} {"Queries/rec":>12} '
+                          f'{"Peak MB":>8} {"KB/rec":>7}  created/updated/skipped/errors')
+        for (label, _), result in zip(PASSES, results):
+            stats = result['stats']
+            self.stdout.write(
+                f'{label:<24} {stats["fetched"]:>8} {result["seconds"]:>8.2f} {result["rate"]:>10.1f} '
+                f'{result["queries_per_record"]:>12.3f} {result["peak_mb"]:>8.1f} {result["kb_per_record"]:>7.2f}  '
+                f'{stats["created"]}/{stats["updated"]}/{stats["skipped"]}/{stats["errors"]}')
+        self.stdout.write('')
+        self.check_thresholds(results, options)
+
+    def run_pass(self, server, catalog, revision, mode):
+        catalog.revision = revision
+        server.reset_counters()
+        service = SpeciesSyncService(target_url=server.url)
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                if mode == 'manifest':
+                    stats = service.sync_manifest()
+                elif mode == 'changes':
+                    stats = service.sync_changes(self.sequence)
+                    self.sequence = stats.pop('sequence')
+                else:
+                    stats = service.sync()
+                seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # rates are per catalog record covered - manifest and changes syncs skip unchanged ones without fetching
+        records = catalog.size
+        return {
+            'stats': stats,
+            'seconds': seconds,
+            'rate': records / seconds if seconds else float('inf'),
+            'queries_per_record': len(queries) / records,
+            'peak_mb': peak / (1024 * 1024),
+            'kb_per_record': server.bytes_sent / 1024 / records,
+        }
+
+    def delete_stub_species(self):
+        """Delete the synthetic species and their change log entries (the deletions are logged too)."""
+        Species.objects.filter(name__startswith=STUB_NAME_PREFIX + ' ').delete()
+        SpeciesChangeLog.objects.filter(species_name__startswith=STUB_NAME_PREFIX + ' ').delete()
+
+    def check_thresholds(self, results, options):
+        failures = []
+        # (created, updated) each pass must end with - the catalog is new, then unchanged, then all changed
+        expected = [(options['species'], 0), (0, 0), (0, options['species'])]
+        for (label, _), result, counts in zip(PASSES, results, expected):
+            if result['stats']['errors']:
+                failures.append(f'{label}: {result["stats"]["errors"]} sync error(s)')
+            if (result['stats']['created'], result['stats']['updated']) != counts:
+                failures.append(f'{label}: created/updated {result["stats"]["created"]}/{result["stats"]["updated"]}, '
+                                f'expected {counts[0]}/{counts[1]}')
+            minimum = options['min_records_per_second']
+            if minimum is not None and result['rate'] < minimum:
+                failures.append(f'{label}: {result["rate"]:.1f} records/s is below {minimum:g}')
+            maximum = options['max_queries_per_record']
+            if maximum is not None and result['queries_per_record'] > maximum:
+                failures.append(f'{label}: {result["queries_per_record"]:.3f} queries/record exceeds {maximum:g}')
+        if failures:
+            raise CommandError('Sync benchmark failed:\n  ' + '\n  '.join(failures))
+        self.stdout.write(self.style.SUCCESS('Sync benchmark passed'))
@@ -43,6 +43,8 @@ class Command(BaseCommand):
         self.stdout.write(f'  email   : {email}')
         self.stdout.write(f'  username: {user.username}')
         self.stdout.write(f'  is_staff: {user.is_staff}')
+        key_source = 'API_SERVICE_KEY' if getattr(settings, 'API_SERVICE_KEY', '') else 'derived from API_SERVICE_PASSWORD'
+        self.stdout.write(f'  signing : HMAC-signed requests enabled (key {key_source})')
         self.stdout.write(self.style.WARNING(
             'Remember to set a secure password via the API_SERVICE_PASSWORD environment variable '
             'before deploying to production.'
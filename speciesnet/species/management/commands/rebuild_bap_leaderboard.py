@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+from species.models import AquaristClub
+from species.services.bap_leaderboard import rebuild_bap_leaderboard
+
+
+class Command(BaseCommand):
+    help = 'Rebuild BAP leaderboard entries from approved BAP submissions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--club',
+            type=int,
+            default=None,
+            help='Only rebuild the leaderboard for the AquaristClub with this id',
+        )
+
+    def handle(self, *args, **options):
+        club = None
+        if options['club'] is not None:
+            try:
+                club = AquaristClub.objects.get(pk=options['club'])
+            except AquaristClub.DoesNotExist:
+                raise CommandError(f"AquaristClub {options['club']} does not exist")
+
+        count = rebuild_bap_leaderboard(club=club)
+        scope = club.name if club else 'all clubs'
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt BAP leaderboard for {scope}: {count} entries'))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from species.services.species_search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the species search token index from the current Species records'
+
+    def handle(self, *args, **options):
+        count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt search index for {count} species'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from species.models import Species
+from species.services.species_counts import refresh_species_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute the aquarist species counters cached on Species from their SpeciesInstances'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--species',
+            type=int,
+            default=None,
+            help='Only rebuild the counters of the Species with this id',
+        )
+
+    def handle(self, *args, **options):
+        species_ids = None
+        if options['species'] is not None:
+            if not Species.objects.filter(pk=options['species']).exists():
+                raise CommandError(f"Species {options['species']} does not exist")
+            species_ids = [options['species']]
+
+        corrected = refresh_species_counts(species_ids=species_ids)
+        scope = f"species {options['species']}" if species_ids else 'all species'
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt species instance counters for {scope}: {corrected} corrected'))
@@ -0,0 +1,53 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.db.utils import OperationalError
+from species.services.background_jobs import run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs (csv imports and species data aggregation)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run the jobs currently queued and exit instead of polling',
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='Exit after running this many jobs',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between polls of an empty queue (default: 5)',
+        )
+
+    def handle(self, *args, **options):
+        max_jobs = options['max_jobs']
+        total = 0
+
+        if not options['once']:
+            self.stdout.write('Background job worker started')
+
+        while True:
+            close_old_connections()
+            remaining = None if max_jobs is None else max_jobs - total
+            try:
+                count = run_pending_jobs(max_jobs=remaining)
+            except OperationalError as e:
+                # database restarting or unreachable - keep the worker alive and poll again
+                self.stderr.write(f'Database error while polling job queue: {e}')
+                count = 0
+            total += count
+
+            if options['once'] or (max_jobs is not None and total >= max_jobs):
+                break
+            if count == 0:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f'Ran {total} background job(s)'))
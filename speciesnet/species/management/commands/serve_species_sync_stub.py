@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+from species.services.species_sync_stub import StubSite2Server, SyntheticCatalog
+
+
+class Command(BaseCommand):
+    help = ('Serve a synthetic Site2 species-sync API locally (no database access), '
+            'to run sync_species against without a second deployment')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+        parser.add_argument('--port', type=int, default=8001,
+                            help='Port to listen on (default: 8001, the default TARGET_API_URL)')
+        parser.add_argument('--species', type=int, default=1000, help='Number of CARES species served (default: 1000)')
+        parser.add_argument('--latency', type=float, default=0, metavar='MS',
+                            help='Milliseconds added to every response (default: 0)')
+        parser.add_argument('--page-size', type=int, default=100, help='Species per page (default: 100)')
+        parser.add_argument('--revision', type=int, default=0,
+                            help='Catalog revision - serve a higher one to make the next sync update every species')
+
+    def handle(self, *args, **options):
+        if options['species'] < 0 or options['page_size'] < 1 or options['latency'] < 0:
+            raise CommandError('--species, --page-size and --latency must not be negative (--page-size at least 1)')
+        catalog = SyntheticCatalog(options['species'], revision=options['revision'])
+        try:
+            server = StubSite2Server(catalog, host=options['host'], port=options['port'],
+                                     latency=options['latency'] / 1000, page_size=options['page_size'])
+        except OSError as e:
+            raise CommandError(f'Cannot listen on {options["host"]}:{options["port"]}: {e}')
+
+        self.stdout.write(f'Serving {catalog.size} synthetic CARES species at {server.url}/api/species-sync/ '
+                          f'(page size {server.page_size}, latency {options["latency"]:g} ms)')
+        self.stdout.write(f'Sync from it with TARGET_API_URL={server.url} python manage.py sync_species --full')
+        self.stdout.write('Press Ctrl+C to stop')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        self.stdout.write(f'Stopped after {server.requests} requests ({server.bytes_sent / 1024:.0f} KB)')
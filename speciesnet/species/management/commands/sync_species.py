@@ -1,8 +1,7 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from django.utils import timezone
 from django.utils.dateparse import parse_date
 from species.services.species_sync import SpeciesSyncService
 
@@ -10,7 +9,8 @@ logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
-    help = 'Synchronize CARES species from Site2 to Site1 via REST API (Site1 only)'
+    help = ('Synchronize CARES species from Site2 to Site1 via REST API (Site1 only). '
+            'Only species changed since the last successful sync are transferred unless --full is given')
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -30,6 +30,18 @@ class Command(BaseCommand):
             default=False,
             help='Shortcut: sync species updated in the last 7 days',
         )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            default=False,
+            help='Sync all CARES species, ignoring the last successful sync',
+        )
+        parser.add_argument(
+            '--manifest',
+            action='store_true',
+            default=False,
+            help='Compare all CARES species by content hash and download only those that differ',
+        )
 
     def handle(self, *args, **options):
         site_id = getattr(settings, 'SITE_ID', 1)
@@ -39,18 +51,24 @@ class Command(BaseCommand):
             )
 
         dry_run = options['dry_run']
+        full = options['full']
+        manifest = options['manifest']
         since = None
 
-        if options['last_week']:
-            since = datetime.now(tz=timezone.utc) - timedelta(days=7)
+        if manifest:
+            if options['last_week'] or options['since']:
+                raise CommandError('--manifest compares every CARES species and cannot be combined with --since/--last-week')
+            self.stdout.write('Comparing all CARES species by content hash (manifest)')
+        elif options['last_week']:
+            since = datetime.now(tz=dt_timezone.utc) - timedelta(days=7)
             self.stdout.write(f'Syncing species updated in the last 7 days (since {since.date()})')
         elif options['since']:
             parsed = parse_date(options['since'])
             if parsed is None:
                 raise CommandError(f'Invalid date format: {options["since"]}. Use YYYY-MM-DD.')
-            since = datetime(parsed.year, parsed.month, parsed.day, tzinfo=timezone.utc)
+            since = datetime(parsed.year, parsed.month, parsed.day, tzinfo=dt_timezone.utc)
             self.stdout.write(f'Syncing species updated since {parsed}')
-        else:
+        elif full:
             self.stdout.write('Syncing all CARES species')
 
         if dry_run:
@@ -59,7 +77,14 @@ class Command(BaseCommand):
         service = SpeciesSyncService()
         self.stdout.write(f'Connecting to Site2 at: {service.target_url}')
 
-        stats = service.sync(since=since, dry_run=dry_run)
+        stats = service.sync_incremental(since=since, full=full, dry_run=dry_run, manifest=manifest)
+        if since is None and not full and not manifest:
+            if stats['sequence'] is not None:
+                self.stdout.write(f'Change feed sync: Site2 changes after sequence {stats["sequence"]}')
+            elif stats['since']:
+                self.stdout.write(f'Incremental sync: species updated since {stats["since"]} (last successful sync)')
+            else:
+                self.stdout.write('No previous successful sync – syncing all CARES species')
 
         self.stdout.write('')
         self.stdout.write('=== Sync Results ===')
@@ -67,7 +92,12 @@ class Command(BaseCommand):
         self.stdout.write(f'  Created : {stats["created"]}')
         self.stdout.write(f'  Updated : {stats["updated"]}')
         self.stdout.write(f'  Skipped : {stats["skipped"]}')
+        self.stdout.write(f'  Removed : {stats["removed"]}')
         self.stdout.write(f'  Errors  : {stats["errors"]}')
+        metrics = service.metrics
+        self.stdout.write(f'  Pages   : {metrics["pages"]} ({metrics["bytes"] / 1024:.0f} KB)')
+        self.stdout.write(f'  Timings : fetch {metrics["fetch_seconds"]:.1f}s, waiting for pages '
+                          f'{metrics["wait_seconds"]:.1f}s, writing {metrics["write_seconds"]:.1f}s')
 
         if stats['errors']:
             self.stdout.write(self.style.ERROR(f'Sync completed with {stats["errors"]} error(s)'))
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:05
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_fulltext_indexes(apps, schema_editor):
+    # FULLTEXT indexes are MySQL/MariaDB only - other databases search via SpeciesSearchToken
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute('CREATE FULLTEXT INDEX species_species_ft_names ON species_species (name, alt_name, common_name)')
+    schema_editor.execute('CREATE FULLTEXT INDEX species_species_ft_all ON species_species (name, alt_name, common_name, local_distribution, description)')
+
+
+def drop_fulltext_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute('DROP INDEX species_species_ft_names ON species_species')
+    schema_editor.execute('DROP INDEX species_species_ft_all ON species_species')
+
+
+def populate_search_tokens(apps, schema_editor):
+    # same tokens and weights as species.services.species_search (kept inline so the migration stays stable)
+    field_weights = {'name': 10, 'alt_name': 6, 'common_name': 6, 'local_distribution': 3, 'description': 1}
+    token_re = re.compile(r'[^\W_]+')
+
+    def build_search_tokens(values):
+        tokens = {}
+        for field, weight in field_weights.items():
+            for token in set(token[:64] for token in token_re.findall((values.get(field) or '').lower())):
+                tokens[token] = tokens.get(token, 0) + weight
+        return tokens
+
+    Species = apps.get_model('species', 'Species')
+    SpeciesSearchToken = apps.get_model('species', 'SpeciesSearchToken')
+    batch = []
+    for species in Species.objects.only('pk', *field_weights).iterator(chunk_size=500):
+        values = {field: getattr(species, field) for field in field_weights}
+        for token, weight in build_search_tokens(values).items():
+            batch.append(SpeciesSearchToken(token=token, species_id=species.pk, weight=weight))
+    SpeciesSearchToken.objects.bulk_create(batch, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0012_species_feedback_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpeciesSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(db_index=True, max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('species', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='species.species')),
+            ],
+            options={
+                'unique_together': {('token', 'species')},
+            },
+        ),
+        migrations.RunPython(populate_search_tokens, migrations.RunPython.noop),
+        migrations.RunPython(create_fulltext_indexes, drop_fulltext_indexes),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:11
+
+from django.db import migrations, models
+
+
+def populate_genus(apps, schema_editor):
+    # same derivation as species.models.genus_from_name (kept inline so the migration stays stable)
+    def genus_from_name(name):
+        genus_name = (name or '').lstrip()
+        if ' ' in genus_name:
+            genus_name = genus_name.split(' ')[0]
+        return genus_name
+
+    for model_name in ('Species', 'BapSpecies'):
+        model = apps.get_model('species', model_name)
+        batch = []
+        for obj in model.objects.only('pk', 'name').iterator(chunk_size=500):
+            obj.genus = genus_from_name(obj.name)
+            batch.append(obj)
+        model.objects.bulk_update(batch, ['genus'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0013_species_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bapspecies',
+            name='genus',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=240),
+        ),
+        migrations.AddField(
+            model_name='species',
+            name='genus',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=240),
+        ),
+        migrations.RunPython(populate_genus, migrations.RunPython.noop),
+    ]
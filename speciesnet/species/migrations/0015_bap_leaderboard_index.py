@@ -0,0 +1,41 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:15
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def rebuild_leaderboard(apps, schema_editor):
+    # entries were previously regenerated on every page view - seed the incrementally maintained table once
+    BapSubmission = apps.get_model('species', 'BapSubmission')
+    BapLeaderboard = apps.get_model('species', 'BapLeaderboard')
+    totals = (BapSubmission.objects.filter(status='APRV', club__isnull=False, aquarist__isnull=False)
+              .values('club_id', 'club__name', 'year', 'aquarist_id', 'aquarist__username')
+              .annotate(species_count=Count('id'),
+                        cares_species_count=Count('id', filter=Q(speciesInstance__species__render_cares=True)),
+                        points=Sum('points'))
+              .filter(points__gt=0)
+              .order_by())
+    BapLeaderboard.objects.all().delete()
+    BapLeaderboard.objects.bulk_create([
+        BapLeaderboard(
+            name=f"{row['year']} - {row['club__name']} - {row['aquarist__username']}",
+            club_id=row['club_id'], year=row['year'], aquarist_id=row['aquarist_id'],
+            species_count=row['species_count'], cares_species_count=row['cares_species_count'], points=row['points'],
+        )
+        for row in totals
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0014_species_genus_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bapleaderboard',
+            index=models.Index(fields=['club', 'year', '-points'], name='bap_leaderboard_club_year_idx'),
+        ),
+        migrations.RunPython(rebuild_leaderboard, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:26
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0015_bap_leaderboard_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_type', models.CharField(choices=[('STAGE', 'CARES Species Staging Import'), ('REFL', 'Species Reference Link Import'), ('BAPG', 'BAP Genus Import'), ('AGGR', 'Species Data Aggregation')], max_length=5)),
+                ('status', models.CharField(choices=[('PEND', 'Pending'), ('RUN', 'Running'), ('DONE', 'Done'), ('FAIL', 'Failed')], default='PEND', max_length=4)),
+                ('progress_current', models.PositiveIntegerField(default=0)),
+                ('progress_total', models.PositiveIntegerField(default=0)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=1)),
+                ('last_error', models.TextField(blank=True)),
+                ('result_summary', models.JSONField(blank=True, default=dict)),
+                ('output_file', models.FileField(blank=True, null=True, upload_to='uploads/%Y/%m/%d/')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('heartbeat', models.DateTimeField(blank=True, null=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('started', models.DateTimeField(blank=True, null=True)),
+                ('finished', models.DateTimeField(blank=True, null=True)),
+                ('club', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='background_jobs', to='species.aquaristclub')),
+                ('import_archive', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='species.importarchive')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='background_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='background_job_queue_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0016_background_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpeciesAggregationResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('row_number', models.PositiveIntegerField()),
+                ('species_name', models.CharField(max_length=240)),
+                ('enriched_row', models.JSONField(default=dict)),
+                ('error_reason', models.CharField(blank=True, max_length=240)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('import_archive', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aggregation_results', to='species.importarchive')),
+            ],
+            options={
+                'ordering': ['import_archive', 'row_number'],
+                'unique_together': {('import_archive', 'row_number')},
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0017_species_aggregation_checkpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpeciesSyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_url', models.CharField(max_length=400, unique=True)),
+                ('synced_until', models.DateTimeField(blank=True, null=True)),
+                ('last_run_started', models.DateTimeField(blank=True, null=True)),
+                ('last_run_finished', models.DateTimeField(blank=True, null=True)),
+                ('last_run_duration', models.FloatField(blank=True, null=True)),
+                ('last_run_since', models.DateTimeField(blank=True, null=True)),
+                ('last_run_stats', models.JSONField(blank=True, default=dict)),
+                ('last_run_succeeded', models.BooleanField(default=False)),
+                ('last_success', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0018_species_sync_state'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='species',
+            index=models.Index(fields=['lastUpdated', 'id'], name='species_sync_cursor_idx'),
+        ),
+    ]
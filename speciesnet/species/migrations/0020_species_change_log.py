@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0019_species_sync_cursor_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpeciesChangeLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('species_name', models.CharField(max_length=240)),
+                ('species_ref', models.BigIntegerField(blank=True, null=True)),
+                ('action', models.CharField(choices=[('C', 'Created'), ('U', 'Updated'), ('D', 'Deleted')], max_length=1)),
+                ('render_cares', models.BooleanField(default=False)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 09:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0020_species_change_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='speciessyncstate',
+            name='change_sequence',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
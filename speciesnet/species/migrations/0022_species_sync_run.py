@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0021_species_sync_change_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpeciesSyncRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_url', models.CharField(max_length=400)),
+                ('mode', models.CharField(choices=[('full', 'Full'), ('incremental', 'Incremental (since)'), ('changes', 'Change feed'), ('manifest', 'Manifest')], max_length=12)),
+                ('dry_run', models.BooleanField(default=False)),
+                ('started', models.DateTimeField()),
+                ('finished', models.DateTimeField()),
+                ('duration', models.FloatField(default=0)),
+                ('since', models.DateTimeField(blank=True, null=True)),
+                ('sequence', models.BigIntegerField(blank=True, null=True)),
+                ('succeeded', models.BooleanField(default=False)),
+                ('fetched', models.PositiveIntegerField(default=0)),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('updated', models.PositiveIntegerField(default=0)),
+                ('skipped', models.PositiveIntegerField(default=0)),
+                ('removed', models.PositiveIntegerField(default=0)),
+                ('errors', models.PositiveIntegerField(default=0)),
+                ('pages', models.PositiveIntegerField(default=0)),
+                ('bytes_received', models.BigIntegerField(default=0)),
+                ('fetch_seconds', models.FloatField(default=0)),
+                ('wait_seconds', models.FloatField(default=0)),
+                ('write_seconds', models.FloatField(default=0)),
+            ],
+            options={
+                'ordering': ['-started'],
+                'indexes': [models.Index(fields=['target_url', '-started'], name='species_sync_run_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.9 on 2026-10-18 10:18
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def seed_species_counters(apps, schema_editor):
+    # counters are maintained incrementally from here on - seed them once from the existing aquarist species
+    Species = apps.get_model('species', 'Species')
+    SpeciesInstance = apps.get_model('species', 'SpeciesInstance')
+    totals = (SpeciesInstance.objects.values('species_id')
+              .annotate(species_instance_count=Count('id'),
+                        aquarist_count=Count('user', distinct=True),
+                        currently_kept_count=Count('id', filter=Q(currently_keep=True)),
+                        spawned_count=Count('id', filter=Q(have_spawned=True)))
+              .order_by())
+    for row in totals:
+        species_id = row.pop('species_id')
+        Species.objects.filter(pk=species_id).update(**row)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0022_species_sync_run'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='species',
+            name='aquarist_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='species',
+            name='currently_kept_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='species',
+            name='spawned_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='species',
+            name='species_instance_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(seed_species_counters, migrations.RunPython.noop),
+    ]
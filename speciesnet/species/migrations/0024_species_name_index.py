@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 11:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('species', '0023_species_instance_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='species',
+            name='name',
+            field=models.CharField(db_index=True, max_length=240),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import DatabaseError, models, transaction
 #from enum import Enum
 #from django.contrib.auth.models import User
 from django.contrib.auth.base_user import BaseUserManager
@@ -119,11 +119,48 @@ class UserEmail (models.Model):
         return self.name
 
 
+### Genus key (indexed lookups replacing name__regex=r'^genus\s')
+
+def genus_from_name (name):
+    genus_name = (name or '').lstrip()   # strips any leading space characters
+    if ' ' in genus_name:
+        genus_name = genus_name.split(' ')[0]
+    return genus_name
+
+# Species fields maintained from its SpeciesInstances (services/species_counts) and never written by Species.save()
+SPECIES_COUNTER_FIELDS = ('species_instance_count', 'aquarist_count', 'currently_kept_count', 'spawned_count')
+
+class GenusQuerySet (models.QuerySet):
+    # bulk operations bypass save() so the genus key is derived here as well
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.genus = genus_from_name(obj.name)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        fields = list(fields)
+        if 'name' in fields:
+            for obj in objs:
+                obj.genus = genus_from_name(obj.name)
+            if 'genus' not in fields:
+                fields.append('genus')
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs):
+        if 'name' in kwargs and 'genus' not in kwargs and isinstance(kwargs['name'], str):
+            kwargs['genus'] = genus_from_name(kwargs['name'])
+        return super().update(**kwargs)
+
+
 ### Species (Species Profile)
 
 class Species (models.Model):
 
-    name                      = models.CharField (max_length=240)
+    name                      = models.CharField (max_length=240, db_index=True)    # looked up by name in imports and species sync
+    genus                     = models.CharField (max_length=240, blank=True, db_index=True, editable=False)  # derived from name on save
     alt_name                  = models.CharField (max_length=240, blank=True)
     common_name               = models.CharField (max_length=240, blank=True)
     description               = models.TextField (blank=True, max_length=2500)
@@ -226,26 +263,52 @@ class Species (models.Model):
     cares_classification      = models.CharField (max_length=4, choices=CaresStatus.choices, default=CaresStatus.NOT_CARES_SPECIES)    
     cares_assessment_date     = models.DateField (null=True, blank=True)    
     render_cares              = models.BooleanField (default=False)           # cached value to speed rendering N species
-    #species_instance_count    = models.PositiveIntegerField (default=0)      # use as cached value to eliminate N+1 queries in speciesSearch list view (or remove)
+    # cached SpeciesInstance counts (eliminate N+1 queries in list views) - maintained by services/species_counts
+    species_instance_count    = models.PositiveIntegerField (default=0, editable=False)   # aquarist species entries
+    aquarist_count            = models.PositiveIntegerField (default=0, editable=False)   # distinct aquarists with an entry
+    currently_kept_count      = models.PositiveIntegerField (default=0, editable=False)   # entries with currently_keep
+    spawned_count             = models.PositiveIntegerField (default=0, editable=False)   # entries with have_spawned
 
     created                   = models.DateTimeField (auto_now_add=True)      # updated only at 1st save
     created_by                = models.ForeignKey(User, on_delete=models.SET_NULL, editable=False, null=True, related_name='user_created_species') 
     lastUpdated               = models.DateTimeField (auto_now=True)          # updated every DB FSpec save
     last_edited_by            = models.ForeignKey(User, on_delete=models.SET_NULL, editable=False, null=True, related_name='user_last_edited_species') 
 
+    objects = GenusQuerySet.as_manager()
+
     class Meta:
         ordering = ['name'] # sorts in alphabetical order
         verbose_name = 'Species Profile'
+        indexes = [models.Index(fields=['lastUpdated', 'id'], name='species_sync_cursor_idx')]  # species-sync changes feed
 
     @property
     def genus_name (self):
-        genus_name = self.name.lstrip()   # strips any leading space characters
-        if ' ' in genus_name:
-            genus_name = genus_name.split(' ')[0] 
-        else:
+        genus_name = genus_from_name(self.name)
+        if genus_name == self.name.lstrip():
             print ('Species name failed to resolve to genus name for species: ' + self.name)
         return genus_name
 
+    def save(self, *args, **kwargs):
+        self.genus = genus_from_name(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None and not self._state.adding and not kwargs.get('force_insert'):
+            # counters are moved with F() updates as SpeciesInstances change - never write back a stale copy
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields
+                                       if not field.primary_key and field.attname not in deferred and field.name not in SPECIES_COUNTER_FIELDS]
+            try:
+                with transaction.atomic(using=kwargs.get('using')):
+                    super().save(*args, **kwargs)
+                return
+            except DatabaseError:
+                if Species.objects.filter(pk=self.pk).exists():
+                    raise
+            # the row was deleted - a full save inserts it again, as it would without update_fields
+            del kwargs['update_fields']
+        if update_fields is not None and 'name' in update_fields and 'genus' not in update_fields:
+            kwargs['update_fields'] = list(update_fields) + ['genus']
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name
 
@@ -277,6 +340,19 @@ class SpeciesReferenceLink (models.Model):
     def __str__(self):
         return self.name
 
+class SpeciesSearchToken (models.Model):
+
+    # inverted index for species search - rebuilt from Species text fields on every save (see species/signals.py)
+    token                     = models.CharField (max_length=64, db_index=True)
+    species                   = models.ForeignKey(Species, on_delete=models.CASCADE, null=False, related_name='search_tokens')
+    weight                    = models.PositiveIntegerField (default=1)      # summed field weights used for relevance ranking
+
+    class Meta:
+        unique_together = [['token', 'species']]
+
+    def __str__(self):
+        return self.token
+
 
 ### SpeciesInstance (Aquarist Species)
 
@@ -324,6 +400,9 @@ class SpeciesInstance (models.Model):
         verbose_name = 'Aquarist Species'
         verbose_name_plural = "Aquarist Species"
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():      # the Species counters (signals) commit with the row - deletes are atomic already
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
@@ -551,6 +630,9 @@ class BapLeaderboard (models.Model):
     created                   = models.DateTimeField(auto_now_add=True)
     lastUpdated               = models.DateTimeField(auto_now=True)  # compare dates of aquarist BAP submissions and only update when needed
 
+    # recomputed per aquarist as BapSubmissions change (species/signals.py) - rebuild with manage.py rebuild_bap_leaderboard
+    class Meta:
+        indexes = [models.Index(fields=['club', 'year', '-points'], name='bap_leaderboard_club_year_idx')]
 
     def __str__(self):
         return self.name    
@@ -578,16 +660,26 @@ class BapGenus (models.Model):
 class BapSpecies (models.Model):
 
     name                      = models.CharField (max_length=240)
+    genus                     = models.CharField (max_length=240, blank=True, db_index=True, editable=False)  # derived from name on save
     species                   = models.ForeignKey(Species, on_delete=models.CASCADE, null=True, related_name='bap_species') # deletes ALL instances referencing any deleted species
     club                      = models.ForeignKey(AquaristClub, on_delete=models.SET_NULL, null=True, related_name='club_bap_species') 
     points                    = models.IntegerField(validators=[MinValueValidator(0), MaxValueValidator(100)], default=0)
     created                   = models.DateTimeField(auto_now_add=True)
     lastUpdated               = models.DateTimeField(auto_now=True)      # updated every save
 
+    objects = GenusQuerySet.as_manager()
+
     class Meta:
         ordering = ['name'] # sorts in alphabetical order    
         verbose_name_plural = "BapSpecies"
 
+    def save(self, *args, **kwargs):
+        self.genus = genus_from_name(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields and 'genus' not in update_fields:
+            kwargs['update_fields'] = list(update_fields) + ['genus']
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.name            
 
@@ -674,6 +766,160 @@ class SpeciesImportStaging (models.Model):
         return f"Staging: {self.new_name} ({self.get_action_display()})"
 
 
+### SpeciesAggregationResult - per-row checkpoint of a species data aggregation run (resumed after failures)
+
+class SpeciesAggregationResult (models.Model):
+
+    import_archive    = models.ForeignKey(ImportArchive, on_delete=models.CASCADE, related_name='aggregation_results')
+    row_number        = models.PositiveIntegerField ()                          # 1-based data row in the import csv
+    species_name      = models.CharField (max_length=240)                       # as read from the csv 'Species' column
+    enriched_row      = models.JSONField (default=dict)
+    error_reason      = models.CharField (max_length=240, blank=True)
+    created           = models.DateTimeField (auto_now_add=True)
+
+    class Meta:
+        ordering = ['import_archive', 'row_number']
+        unique_together = ['import_archive', 'row_number']
+
+    def __str__(self):
+        return f"{self.import_archive} row {self.row_number}: {self.species_name}"
+
+
+### BackgroundJob - DB-backed queue for long-running imports and data aggregation (run by manage.py run_jobs)
+
+class BackgroundJob (models.Model):
+
+    class JobType (models.TextChoices):
+        SPECIES_STAGING     = 'STAGE', _('CARES Species Staging Import')
+        REFERENCE_LINKS     = 'REFL',  _('Species Reference Link Import')
+        BAP_GENUS           = 'BAPG',  _('BAP Genus Import')
+        SPECIES_AGGREGATION = 'AGGR',  _('Species Data Aggregation')
+
+    class JobStatus (models.TextChoices):
+        PENDING  = 'PEND', _('Pending')
+        RUNNING  = 'RUN',  _('Running')
+        DONE     = 'DONE', _('Done')
+        FAILED   = 'FAIL', _('Failed')
+
+    job_type          = models.CharField (max_length=5, choices=JobType.choices)
+    status            = models.CharField (max_length=4, choices=JobStatus.choices, default=JobStatus.PENDING)
+    import_archive    = models.ForeignKey(ImportArchive, on_delete=models.CASCADE, related_name='jobs')
+    requested_by      = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='background_jobs')
+    club              = models.ForeignKey(AquaristClub, on_delete=models.CASCADE, null=True, blank=True, related_name='background_jobs') # BAP genus imports only
+    progress_current  = models.PositiveIntegerField (default=0)                     # rows processed so far
+    progress_total    = models.PositiveIntegerField (default=0)                     # rows in the import csv
+    attempts          = models.PositiveIntegerField (default=0)
+    max_attempts      = models.PositiveIntegerField (default=1)
+    last_error        = models.TextField (blank=True)
+    result_summary    = models.JSONField (default=dict, blank=True)
+    output_file       = models.FileField (upload_to="uploads/%Y/%m/%d/", null=True, blank=True) # aggregation csv output
+    run_after         = models.DateTimeField (default=timezone.now)                 # pushed back on retry
+    heartbeat         = models.DateTimeField (null=True, blank=True)                # touched on progress; stale RUNNING jobs are requeued
+    created           = models.DateTimeField (auto_now_add=True)
+    started           = models.DateTimeField (null=True, blank=True)
+    finished          = models.DateTimeField (null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created']
+        indexes = [models.Index(fields=['status', 'run_after'], name='background_job_queue_idx')]
+
+    def __str__(self):
+        return f"{self.get_job_type_display()} #{self.pk} ({self.get_status_display()})"
+
+    @property
+    def is_active(self):
+        return self.status in (self.JobStatus.PENDING, self.JobStatus.RUNNING)
+
+    @property
+    def progress_percent(self):
+        if not self.progress_total:
+            return 0
+        return min(100, int(self.progress_current * 100 / self.progress_total))
+
+
+### SpeciesSyncState - per-target high-water mark for incremental CARES species sync (manage.py sync_species)
+
+class SpeciesSyncState (models.Model):
+    target_url          = models.CharField (max_length=400, unique=True)
+    synced_until        = models.DateTimeField (null=True, blank=True)   # Site2 server_time at the start of the last successful run
+    last_run_started    = models.DateTimeField (null=True, blank=True)
+    last_run_finished   = models.DateTimeField (null=True, blank=True)
+    last_run_duration   = models.FloatField (null=True, blank=True)      # seconds
+    last_run_since      = models.DateTimeField (null=True, blank=True)   # since filter used (None: full sync)
+    last_run_stats      = models.JSONField (default=dict, blank=True)    # fetched/created/updated/skipped/errors
+    last_run_succeeded  = models.BooleanField (default=False)
+    last_success        = models.DateTimeField (null=True, blank=True)
+    change_sequence     = models.BigIntegerField (null=True, blank=True) # last Site2 change feed sequence applied
+
+    def __str__(self):
+        return f"Species sync state for {self.target_url}"
+
+
+### SpeciesSyncRun - one row per sync_species run with counts and per-phase timings, to track sync duration trends
+
+class SpeciesSyncRun (models.Model):
+
+    class Mode (models.TextChoices):
+        FULL        = 'full', _('Full')
+        INCREMENTAL = 'incremental', _('Incremental (since)')
+        CHANGES     = 'changes', _('Change feed')
+        MANIFEST    = 'manifest', _('Manifest')
+
+    target_url          = models.CharField (max_length=400)
+    mode                = models.CharField (max_length=12, choices=Mode.choices)
+    dry_run             = models.BooleanField (default=False)
+    started             = models.DateTimeField ()
+    finished            = models.DateTimeField ()
+    duration            = models.FloatField (default=0)                   # seconds
+    since               = models.DateTimeField (null=True, blank=True)   # since filter used (incremental mode)
+    sequence            = models.BigIntegerField (null=True, blank=True) # change feed sequence synced from (changes mode)
+    succeeded           = models.BooleanField (default=False)
+    fetched             = models.PositiveIntegerField (default=0)
+    created             = models.PositiveIntegerField (default=0)
+    updated             = models.PositiveIntegerField (default=0)
+    skipped             = models.PositiveIntegerField (default=0)
+    removed             = models.PositiveIntegerField (default=0)
+    errors              = models.PositiveIntegerField (default=0)
+    pages               = models.PositiveIntegerField (default=0)         # API responses received
+    bytes_received      = models.BigIntegerField (default=0)              # response bytes as transferred (gzip compressed)
+    fetch_seconds       = models.FloatField (default=0)                   # spent in API requests (prefetch thread)
+    wait_seconds        = models.FloatField (default=0)                   # sync blocked waiting for the next page
+    write_seconds       = models.FloatField (default=0)                   # comparing and writing batches
+
+    class Meta:
+        ordering = ['-started']
+        indexes = [models.Index (fields=['target_url', '-started'], name='species_sync_run_idx')]
+
+    @property
+    def records_per_second(self):
+        return round (self.fetched / self.duration, 1) if self.duration else None
+
+    def __str__(self):
+        return f"{self.get_mode_display()} sync of {self.target_url} at {self.started:%Y-%m-%d %H:%M}"
+
+
+### SpeciesChangeLog - append-only species change feed; the id is the sequence number Site1 syncs from
+
+class SpeciesChangeLog (models.Model):
+
+    class Action (models.TextChoices):
+        CREATED = 'C', _('Created')
+        UPDATED = 'U', _('Updated')
+        DELETED = 'D', _('Deleted')     # also recorded for the old name when a species is renamed
+
+    species_name      = models.CharField (max_length=240)
+    species_ref       = models.BigIntegerField (null=True, blank=True)   # Species id at the time - not a FK so deletions keep their entry
+    action            = models.CharField (max_length=1, choices=Action.choices)
+    render_cares      = models.BooleanField (default=False)              # CARES flag after the change
+    created           = models.DateTimeField (auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"#{self.pk} {self.get_action_display()} {self.species_name}"
+
+
 ### Species Feedback
 
 class SpeciesFeedback(models.Model):
@@ -0,0 +1,242 @@
+import csv
+import logging
+import time
+import traceback
+from datetime import timedelta
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from species.models import BackgroundJob, ImportArchive, SpeciesImportStaging
+from species.asn_tools.asn_csv_tools import (import_csv_species_to_staging, import_csv_species_reference_links,
+                                              import_csv_bap_genus)
+from species.asn_tools.asn_species_aggregation import collect_species_data
+
+logger = logging.getLogger(__name__)
+
+# FishBase lookups fail transiently (timeouts, throttling); csv imports fail on bad data, where a retry does not help
+JOB_MAX_ATTEMPTS = {
+    BackgroundJob.JobType.SPECIES_AGGREGATION: 3,
+}
+
+RETRY_BASE_DELAY_SECONDS = 60      # doubled on each further attempt
+PROGRESS_SAVE_INTERVAL = 2.0       # seconds between progress writes
+
+
+def _stale_after():
+    """A RUNNING job whose heartbeat is older than this is assumed to have lost its worker."""
+    return timedelta(seconds=getattr(settings, 'BACKGROUND_JOB_STALE_SECONDS', 900))
+
+
+def enqueue_job(job_type, import_archive, requested_by, club=None):
+    """
+    Queue a job for the run_jobs worker.
+
+    Args:
+        job_type: BackgroundJob.JobType value
+        import_archive: ImportArchive holding the uploaded csv
+        requested_by: User the job runs as
+        club: AquaristClub (BAP genus imports only)
+
+    Returns:
+        BackgroundJob: the pending job
+    """
+    job = BackgroundJob.objects.create(
+        job_type=job_type,
+        import_archive=import_archive,
+        requested_by=requested_by,
+        club=club,
+        max_attempts=JOB_MAX_ATTEMPTS.get(job_type, 1),
+    )
+    logger.info('Queued background job %s (%s) for import archive %s', job.pk, job.job_type, import_archive.pk)
+    return job
+
+
+def count_csv_rows(import_archive):
+    """Number of data rows in the archive's csv (header excluded)."""
+    with open(import_archive.import_csv_file.path, 'r', encoding='utf-8') as csv_file:
+        return sum(1 for _ in csv.DictReader(csv_file))
+
+
+class JobProgress:
+    """Progress callback handed to the import functions; writes at most every PROGRESS_SAVE_INTERVAL seconds."""
+
+    def __init__(self, job):
+        self.job = job
+        self.last_saved = 0.0
+
+    def __call__(self, current, total=None):
+        self.job.progress_current = current
+        if total is not None:
+            self.job.progress_total = total
+        now = time.monotonic()
+        if now - self.last_saved >= PROGRESS_SAVE_INTERVAL:
+            self.save()
+            self.last_saved = now
+
+    def save(self):
+        BackgroundJob.objects.filter(pk=self.job.pk).update(
+            progress_current=self.job.progress_current,
+            progress_total=self.job.progress_total,
+            heartbeat=timezone.now(),
+        )
+
+
+### Job handlers - each returns a JSON-serializable summary stored on the job
+
+def _run_species_staging(job, progress):
+    # a retried job starts over - drop staging rows left by the failed attempt
+    SpeciesImportStaging.objects.filter(import_archive=job.import_archive).delete()
+    return import_csv_species_to_staging(job.import_archive, job.requested_by, progress=progress)
+
+
+def _run_reference_links(job, progress):
+    summary = import_csv_species_reference_links(job.import_archive, job.requested_by, progress=progress)
+    return {'success_count': summary['success_count'], 'error_count': summary['error_count']}
+
+
+def _run_bap_genus(job, progress):
+    import_csv_bap_genus(job.import_archive, job.requested_by, job.club, progress=progress)
+    return {}
+
+
+def _run_species_aggregation(job, progress):
+    # while retries remain, FishBase outages fail the attempt; completed rows are checkpointed
+    # so the retry only fetches the missing species
+    output_csv = collect_species_data(job.import_archive, job.requested_by, progress=progress,
+                                      raise_on_unavailable=job.attempts < job.max_attempts)
+    output_filename = job.requested_by.username + "_species_data_collection.csv"
+    job.output_file.save(output_filename, ContentFile(output_csv.encode('utf-8')), save=False)
+    BackgroundJob.objects.filter(pk=job.pk).update(output_file=job.output_file.name)
+    return {}
+
+
+JOB_HANDLERS = {
+    BackgroundJob.JobType.SPECIES_STAGING:     _run_species_staging,
+    BackgroundJob.JobType.REFERENCE_LINKS:     _run_reference_links,
+    BackgroundJob.JobType.BAP_GENUS:           _run_bap_genus,
+    BackgroundJob.JobType.SPECIES_AGGREGATION: _run_species_aggregation,
+}
+
+
+### Worker
+
+def requeue_stale_jobs():
+    """
+    Return RUNNING jobs whose worker stopped sending heartbeats to the queue
+    (or fail them when they are out of attempts).  Returns the number of jobs touched.
+    """
+    cutoff = timezone.now() - _stale_after()
+    stale = BackgroundJob.objects.filter(status=BackgroundJob.JobStatus.RUNNING).filter(
+        Q(heartbeat__lt=cutoff) | Q(heartbeat__isnull=True, started__lt=cutoff))
+    count = 0
+    for job in stale:
+        _record_failure(job, 'Worker stopped responding')
+        count += 1
+    return count
+
+
+def claim_next_job():
+    """
+    Claim the oldest runnable PENDING job for this worker.
+
+    Uses SELECT ... FOR UPDATE SKIP LOCKED where the database supports it, and a
+    conditional status update so two workers can never run the same job.
+
+    Returns:
+        BackgroundJob or None
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        candidates = BackgroundJob.objects.filter(status=BackgroundJob.JobStatus.PENDING, run_after__lte=now)
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        job = candidates.order_by('run_after', 'id').first()
+        if job is None:
+            return None
+        claimed = BackgroundJob.objects.filter(pk=job.pk, status=BackgroundJob.JobStatus.PENDING).update(
+            status=BackgroundJob.JobStatus.RUNNING,
+            attempts=job.attempts + 1,
+            started=now,
+            heartbeat=now,
+            finished=None,
+        )
+        if not claimed:
+            return None
+    job.refresh_from_db()
+    return job
+
+
+def _record_failure(job, error_text):
+    now = timezone.now()
+    if job.attempts < job.max_attempts:
+        delay = RETRY_BASE_DELAY_SECONDS * (2 ** max(job.attempts - 1, 0))
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            status=BackgroundJob.JobStatus.PENDING,
+            run_after=now + timedelta(seconds=delay),
+            last_error=error_text,
+        )
+        logger.warning('Background job %s failed (attempt %d of %d), retrying in %ds',
+                       job.pk, job.attempts, job.max_attempts, delay)
+    else:
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            status=BackgroundJob.JobStatus.FAILED,
+            finished=now,
+            last_error=error_text,
+        )
+        ImportArchive.objects.filter(pk=job.import_archive_id).update(import_status=ImportArchive.ImportStatus.FAIL)
+        logger.error('Background job %s failed after %d attempt(s)', job.pk, job.attempts)
+
+
+def run_job(job):
+    """
+    Execute a claimed job and record the outcome: DONE with its summary, or
+    back to PENDING with an exponential backoff until max_attempts is reached.
+
+    Returns:
+        bool: True when the job completed
+    """
+    progress = JobProgress(job)
+    try:
+        if job.requested_by is None:
+            raise ValueError('The user who requested this job no longer exists')
+        if job.progress_total == 0:
+            job.progress_total = count_csv_rows(job.import_archive)
+            progress.save()
+        handler = JOB_HANDLERS[job.job_type]
+        summary = handler(job, progress)
+    except Exception as e:
+        logger.exception('Background job %s (%s) raised an exception', job.pk, job.job_type)
+        _record_failure(job, f'{e}\n\n{traceback.format_exc()}')
+        return False
+
+    BackgroundJob.objects.filter(pk=job.pk).update(
+        status=BackgroundJob.JobStatus.DONE,
+        progress_current=job.progress_total,
+        progress_total=job.progress_total,
+        result_summary=summary or {},
+        last_error='',
+        heartbeat=timezone.now(),
+        finished=timezone.now(),
+    )
+    logger.info('Background job %s (%s) completed', job.pk, job.job_type)
+    return True
+
+
+def run_pending_jobs(max_jobs=None):
+    """
+    Run queued jobs until the queue is empty (or max_jobs have run).
+
+    Returns:
+        int: number of jobs run (completed or failed)
+    """
+    requeue_stale_jobs()
+    count = 0
+    while max_jobs is None or count < max_jobs:
+        job = claim_next_job()
+        if job is None:
+            break
+        run_job(job)
+        count += 1
+    return count
@@ -0,0 +1,53 @@
+import logging
+from django.db import transaction
+from django.db.models import Count, Min
+from species.models import BapGenus, Species
+
+logger = logging.getLogger(__name__)
+
+
+@transaction.atomic
+def sync_bap_genus_list(club):
+    """
+    Bring a club's BapGenus list in line with the genera in the Species catalog.
+
+    Distinct genera and their species counts come from a single aggregate query
+    over the indexed Species.genus column.  Missing genera are added with the
+    club's default points via bulk_create; species counts of existing entries
+    are refreshed via bulk_update.  Points already configured are never changed.
+
+    Species names without a space (no binomial) are ignored.
+
+    Args:
+        club: AquaristClub whose BapGenus list is built or updated
+
+    Returns:
+        list: names of the genera added, in alphabetical order
+    """
+    genus_totals = (Species.objects.filter(name__contains=' ').exclude(genus='')
+                    .values('genus')
+                    .annotate(species_count=Count('id'), example_species_id=Min('id'))
+                    .order_by('genus'))
+
+    existing = {bap_genus.name: bap_genus for bap_genus in BapGenus.objects.filter(club=club)}
+    new_entries = []
+    changed_entries = []
+    for row in genus_totals:
+        bap_genus = existing.get(row['genus'])
+        if bap_genus is None:
+            new_entries.append(BapGenus(
+                name=row['genus'],
+                club=club,
+                example_species_id=row['example_species_id'],
+                points=club.bap_default_points,
+                species_count=row['species_count'],
+            ))
+        elif bap_genus.species_count != row['species_count']:
+            bap_genus.species_count = row['species_count']
+            changed_entries.append(bap_genus)
+
+    BapGenus.objects.bulk_create(new_entries, batch_size=500)
+    BapGenus.objects.bulk_update(changed_entries, ['species_count'], batch_size=500)
+    logger.info('BapGenus list synced for %s: %d added, %d species counts updated',
+                club.name, len(new_entries), len(changed_entries))
+    return [bap_genus.name for bap_genus in new_entries]
@@ -0,0 +1,111 @@
+import logging
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from species.models import BapLeaderboard, BapSubmission
+
+logger = logging.getLogger(__name__)
+
+
+def submission_contribution(submission):
+    """
+    Return what a BapSubmission adds to its aquarist's leaderboard entry.
+
+    Only approved submissions count.  The result is a tuple
+    (club_id, year, aquarist_id, cares, points) or None if the submission
+    does not contribute.
+    """
+    if submission is None or submission.status != BapSubmission.BapSubmissionStatus.APPROVED:
+        return None
+    if submission.club_id is None or submission.aquarist_id is None:
+        return None
+    cares = False
+    if submission.speciesInstance_id is not None:
+        cares = bool(submission.speciesInstance.species.render_cares)
+    return (submission.club_id, submission.year, submission.aquarist_id, cares, submission.points)
+
+
+def _approved_totals(submissions):
+    """Aggregate approved submissions into one leaderboard row per (club, year, aquarist)."""
+    return (submissions.filter(status=BapSubmission.BapSubmissionStatus.APPROVED,
+                               club__isnull=False, aquarist__isnull=False)
+            .values('club_id', 'club__name', 'year', 'aquarist_id', 'aquarist__username')
+            .annotate(species_count=Count('id'),
+                      cares_species_count=Count('id', filter=Q(speciesInstance__species__render_cares=True)),
+                      points=Sum('points'))
+            .filter(points__gt=0)
+            .order_by())
+
+
+def _entry_fields(row):
+    return {
+        'name': f"{row['year']} - {row['club__name']} - {row['aquarist__username']}",
+        'species_count': row['species_count'],
+        'cares_species_count': row['cares_species_count'],
+        'points': row['points'],
+    }
+
+
+def _recompute(club_id, year, aquarist_id):
+    # lock the entry first so concurrent changes for the same aquarist recompute one after the other
+    entries = BapLeaderboard.objects.filter(club_id=club_id, year=year, aquarist_id=aquarist_id)
+    entry = entries.select_for_update().order_by('pk').first()
+    totals = _approved_totals(BapSubmission.objects.filter(club_id=club_id, year=year, aquarist_id=aquarist_id))
+    row = next(iter(totals), None)
+    if row is None:
+        # entries without points are not shown on the leaderboard
+        entries.delete()
+        return
+    if entry is None:
+        BapLeaderboard.objects.create(club_id=club_id, year=year, aquarist_id=aquarist_id, **_entry_fields(row))
+    else:
+        entries.filter(pk=entry.pk).update(**_entry_fields(row))
+        entries.exclude(pk=entry.pk).delete()
+
+
+@transaction.atomic
+def apply_submission_change(before, after):
+    """
+    Recompute the leaderboard entries a submission change touches.
+
+    Each affected (club, year, aquarist) entry is rebuilt from its approved
+    submissions with the same aggregate rebuild_bap_leaderboard uses, so the
+    CARES count follows the species' current render_cares flag.
+
+    Args:
+        before: contribution tuple for the stored row before the change (or None)
+        after: contribution tuple for the row after the change (or None)
+    """
+    if before == after:
+        return
+    keys = {contribution[:3] for contribution in (before, after) if contribution is not None}
+    for club_id, year, aquarist_id in sorted(keys):
+        _recompute(club_id, year, aquarist_id)
+
+
+@transaction.atomic
+def rebuild_bap_leaderboard(club=None):
+    """
+    Rebuild leaderboard entries from approved BAP submissions in one aggregate query.
+
+    Args:
+        club: optional AquaristClub; rebuilds every club when None
+
+    Returns:
+        int: number of leaderboard entries written
+    """
+    submissions = BapSubmission.objects.all()
+    entries = BapLeaderboard.objects.all()
+    if club is not None:
+        submissions = submissions.filter(club=club)
+        entries = entries.filter(club=club)
+
+    totals = _approved_totals(submissions)
+
+    entries.delete()
+    BapLeaderboard.objects.bulk_create([
+        BapLeaderboard(club_id=row['club_id'], year=row['year'], aquarist_id=row['aquarist_id'], **_entry_fields(row))
+        for row in totals
+    ])
+    count = entries.count()
+    logger.info('Rebuilt BAP leaderboard: %d entries', count)
+    return count
@@ -0,0 +1,128 @@
+import logging
+import random
+import threading
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Transient responses worth retrying - rate limiting and gateway / server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with random jitter added to the exponential backoff.
+
+    The jitter keeps concurrent workers that failed together (e.g. a FishBase
+    or Site2 restart) from retrying in lock step.  urllib3 2.x has this built in
+    as backoff_jitter; the pinned urllib3 1.26 does not.
+    """
+
+    def __init__(self, *args, backoff_jitter=0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.backoff_jitter = backoff_jitter
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.backoff_jitter = self.backoff_jitter
+        return retry
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff and self.backoff_jitter:
+            backoff += random.uniform(0, self.backoff_jitter)
+        return min(backoff, self.DEFAULT_BACKOFF_MAX)
+
+
+def retry_delay(attempt, response=None):
+    """
+    Seconds to wait before retry number `attempt` (1 for the first retry) when a
+    caller retries itself: the session's jittered exponential backoff, or the
+    response's Retry-After if that is longer.
+    """
+    backoff = getattr(settings, 'HTTP_CLIENT_BACKOFF', 0.5) * (2 ** (attempt - 1))
+    jitter = getattr(settings, 'HTTP_CLIENT_BACKOFF_JITTER', 0.5)
+    if jitter:
+        backoff += random.uniform(0, jitter)
+    retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+    if retry_after.isdigit():
+        backoff = max(backoff, int(retry_after))
+    return min(backoff, Retry.DEFAULT_BACKOFF_MAX)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter applying a default (connect, read) timeout when the caller passes none."""
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def build_session(retries=True):
+    """
+    Build a requests.Session with pooled keep-alive connections, bounded retries
+    (exponential backoff with jitter) and default timeouts, all from settings.
+
+    Retries cover connection errors and RETRY_STATUS_CODES for idempotent methods
+    only, honouring Retry-After.  Once retries are exhausted the last response is
+    returned rather than raised, so callers keep their own status code handling.
+    With retries=False every request is sent once and the caller retries (see
+    retry_delay) - for clients that must rate limit each attempt.
+    """
+    retry = 0 if not retries else JitteredRetry(
+        total=getattr(settings, 'HTTP_CLIENT_RETRIES', 3),
+        backoff_factor=getattr(settings, 'HTTP_CLIENT_BACKOFF', 0.5),
+        backoff_jitter=getattr(settings, 'HTTP_CLIENT_BACKOFF_JITTER', 0.5),
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+    pool_size = getattr(settings, 'HTTP_CLIENT_POOL_SIZE', 10)
+    adapter = TimeoutHTTPAdapter(
+        timeout=(getattr(settings, 'HTTP_CLIENT_CONNECT_TIMEOUT', 5), getattr(settings, 'HTTP_CLIENT_READ_TIMEOUT', 30)),
+        max_retries=retry,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(name='default', retries=True):
+    """
+    Return the process-wide session for an outbound client ('fishbase', 'species_sync', ...).
+
+    Sessions are created on first use and shared by all threads of the process,
+    so connections to a host are reused across requests and worker threads.
+    `retries` is passed to build_session when the session is created.
+    """
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = build_session(retries=retries)
+            _sessions[name] = session
+            logger.debug('Created outbound HTTP session %s', name)
+        return session
+
+
+def close_sessions():
+    """Close and forget every shared session (their connection pools are released)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,70 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from species.models import SpeciesChangeLog
+
+logger = logging.getLogger(__name__)
+
+CHANGE_FEED_LIMIT = 1000          # default entries per feed request
+CHANGE_FEED_MAX_LIMIT = 5000
+
+
+def record_species_change(species, action, name=None):
+    """Append one entry to the species change log once the current transaction commits (called from the Species signals)."""
+    entry = SpeciesChangeLog(
+        species_name=name or species.name,
+        species_ref=species.pk,
+        action=action,
+        render_cares=bool(species.render_cares) and action != SpeciesChangeLog.Action.DELETED,
+    )
+    transaction.on_commit(entry.save)
+
+
+def record_species_changes(species_list, action):
+    """Append change log entries for species written in bulk (bulk_create / QuerySet.update skip the signals)."""
+    entries = [
+        SpeciesChangeLog(species_name=species.name, species_ref=species.pk, action=action,
+                         render_cares=bool(species.render_cares))
+        for species in species_list
+    ]
+    if entries:
+        transaction.on_commit(lambda: SpeciesChangeLog.objects.bulk_create(entries, batch_size=1000))
+
+
+def _settled_entries():
+    """
+    Change log entries old enough to be read by the feed.
+
+    Ids are assigned at insert but transactions commit in any order, so the newest
+    entries are held back for SPECIES_CHANGE_FEED_SETTLE_SECONDS: a reader that has
+    moved past sequence N must not later find an entry below N appear.  Entries are
+    written in their own short transaction after the species data commits
+    (transaction.on_commit), so a long import cannot hold low ids open past the
+    window; only the entry insert itself has to commit within it.
+    """
+    settle_seconds = getattr(settings, 'SPECIES_CHANGE_FEED_SETTLE_SECONDS', 5)
+    entries = SpeciesChangeLog.objects.all()
+    if settle_seconds:
+        entries = entries.filter(created__lte=timezone.now() - timedelta(seconds=settle_seconds))
+    return entries
+
+
+def change_feed_head():
+    """Sequence number of the newest readable change log entry (0 when empty)."""
+    # walks the primary key backwards past the unsettled entries - created is not indexed
+    return _settled_entries().order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def read_change_feed(after, limit=CHANGE_FEED_LIMIT):
+    """
+    Return (entries, more) - up to limit readable change log entries with sequence > after.
+
+    Args:
+        after: last sequence number the reader has applied
+        limit: maximum entries returned (capped at CHANGE_FEED_MAX_LIMIT)
+    """
+    limit = max(1, min(limit, CHANGE_FEED_MAX_LIMIT))
+    entries = list(_settled_entries().filter(id__gt=after).order_by('id')[:limit + 1])
+    return entries[:limit], len(entries) > limit
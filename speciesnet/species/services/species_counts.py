@@ -0,0 +1,112 @@
+import logging
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
+from species.models import SPECIES_COUNTER_FIELDS, Species, SpeciesInstance
+
+logger = logging.getLogger(__name__)
+
+
+def instance_contribution(species_instance):
+    """
+    Return what a SpeciesInstance adds to its Species counters.
+
+    The result is a tuple (species_id, user_id, currently_keep, have_spawned)
+    or None if there is no instance.
+    """
+    if species_instance is None or species_instance.species_id is None:
+        return None
+    return (species_instance.species_id, species_instance.user_id,
+            bool(species_instance.currently_keep), bool(species_instance.have_spawned))
+
+
+def _shift(field, delta):
+    # drifted counters are clamped at 0 rather than violating the unsigned column
+    return F(field) + delta if delta >= 0 else Greatest(F(field) + delta, 0)
+
+
+def _apply(contribution, sign, instance_pk):
+    species_id, user_id, currently_keep, have_spawned = contribution
+    changes = {'species_instance_count': _shift('species_instance_count', sign)}
+    # aquarist_count counts distinct aquarists - only a user's first or last entry for the species moves it
+    other_entries = SpeciesInstance.objects.filter(species_id=species_id, user_id=user_id).exclude(pk=instance_pk)
+    if not other_entries.exists():
+        changes['aquarist_count'] = _shift('aquarist_count', sign)
+    if currently_keep:
+        changes['currently_kept_count'] = _shift('currently_kept_count', sign)
+    if have_spawned:
+        changes['spawned_count'] = _shift('spawned_count', sign)
+    Species.objects.filter(pk=species_id).update(**changes)
+
+
+@transaction.atomic
+def apply_instance_change(before, after, instance_pk):
+    """
+    Move a SpeciesInstance's contribution from its previous state to its current one.
+
+    Counters change with single UPDATE ... SET count = count + n statements, so
+    concurrent changes to the same species do not lose updates.
+
+    Args:
+        before: contribution tuple for the stored row before the change (or None)
+        after: contribution tuple for the row after the change (or None)
+        instance_pk: the SpeciesInstance id, excluded when looking for the aquarist's other entries
+    """
+    if before == after:
+        return
+    if before is not None and after is not None and before[:2] == after[:2]:
+        # same species and aquarist - only the kept / spawned flags changed
+        changes = {}
+        for field, was, now in (('currently_kept_count', before[2], after[2]), ('spawned_count', before[3], after[3])):
+            if was != now:
+                changes[field] = _shift(field, int(now) - int(was))
+        Species.objects.filter(pk=before[0]).update(**changes)
+        return
+    if before is not None:
+        _apply(before, -1, instance_pk)
+    if after is not None:
+        _apply(after, 1, instance_pk)
+
+
+@transaction.atomic
+def refresh_species_counts(species_ids=None):
+    """
+    Recompute the Species counters from their SpeciesInstances in one aggregate query.
+
+    Used after bulk writes (bulk_create skips the signals) and by
+    manage.py rebuild_species_counts to repair drift.
+
+    Args:
+        species_ids: optional species ids to refresh; refreshes every species when None
+
+    Returns:
+        int: number of species whose counters were corrected
+    """
+    instances = SpeciesInstance.objects.all()
+    species_list = Species.objects.only('pk', *SPECIES_COUNTER_FIELDS)
+    if species_ids is not None:
+        species_ids = list(species_ids)
+        instances = instances.filter(species_id__in=species_ids)
+        species_list = species_list.filter(pk__in=species_ids)
+
+    totals = {
+        row['species_id']: row
+        for row in (instances.values('species_id')
+                    .annotate(species_instance_count=Count('id'),
+                              aquarist_count=Count('user', distinct=True),
+                              currently_kept_count=Count('id', filter=Q(currently_keep=True)),
+                              spawned_count=Count('id', filter=Q(have_spawned=True)))
+                    .order_by())
+    }
+    corrected = []
+    for species in species_list.order_by().iterator(chunk_size=2000):
+        row = totals.get(species.pk, {})
+        counts = {field: row.get(field, 0) for field in SPECIES_COUNTER_FIELDS}
+        if any(getattr(species, field) != value for field, value in counts.items()):
+            for field, value in counts.items():
+                setattr(species, field, value)
+            corrected.append(species)
+    Species.objects.bulk_update(corrected, SPECIES_COUNTER_FIELDS, batch_size=500)
+    if corrected:
+        logger.info('Refreshed species instance counters: %d species corrected', len(corrected))
+    return len(corrected)
@@ -0,0 +1,163 @@
+import logging
+import re
+from django.conf import settings
+from django.db import connection
+from django.db.models import OuterRef, Q, Subquery, Sum, Value
+from django.db.models.expressions import RawSQL
+from species.models import Species, SpeciesSearchToken
+
+logger = logging.getLogger(__name__)
+
+# Species text fields covered by search, with the weight each contributes to relevance.
+# A match on the species name outranks a match buried in the description.
+SEARCH_FIELD_WEIGHTS = {
+    'name': 10,
+    'alt_name': 6,
+    'common_name': 6,
+    'local_distribution': 3,
+    'description': 1,
+}
+
+# Column lists for the MySQL/MariaDB FULLTEXT indexes created in migration 0013.
+# MATCH() must name exactly the columns of an existing FULLTEXT index.
+FULLTEXT_NAME_COLUMNS = ('name', 'alt_name', 'common_name')
+FULLTEXT_ALL_COLUMNS = ('name', 'alt_name', 'common_name', 'local_distribution', 'description')
+
+# InnoDB ignores terms shorter than innodb_ft_min_token_size (default 3); those
+# queries are answered from the token table instead, as are queries containing
+# InnoDB default stopwords (a required '+stopword' term would never match).
+FULLTEXT_MIN_TOKEN_LEN = 3
+FULLTEXT_STOPWORDS = {
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for', 'from', 'how', 'i', 'in',
+    'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what', 'when', 'where', 'who',
+    'will', 'with', 'und', 'www',
+}
+
+MAX_TOKEN_LEN = 64
+MAX_QUERY_TERMS = 8
+
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens (letters and digits only)."""
+    if not text:
+        return []
+    return [token[:MAX_TOKEN_LEN] for token in TOKEN_RE.findall(text.lower())]
+
+
+def build_search_tokens(values):
+    """
+    Build the weighted token map for one species.
+
+    Args:
+        values: dict of field name -> text for the fields in SEARCH_FIELD_WEIGHTS
+
+    Returns:
+        dict: token -> summed weight of the fields the token appears in
+    """
+    tokens = {}
+    for field, weight in SEARCH_FIELD_WEIGHTS.items():
+        for token in set(tokenize(values.get(field))):
+            tokens[token] = tokens.get(token, 0) + weight
+    return tokens
+
+
+def index_species(species):
+    """Rebuild the search tokens for a single species."""
+    values = {field: getattr(species, field) for field in SEARCH_FIELD_WEIGHTS}
+    tokens = build_search_tokens(values)
+    SpeciesSearchToken.objects.filter(species_id=species.pk).delete()
+    SpeciesSearchToken.objects.bulk_create(
+        [SpeciesSearchToken(token=token, species_id=species.pk, weight=weight) for token, weight in tokens.items()]
+    )
+
+
+def index_species_ids(species_ids):
+    """Rebuild the search tokens for the given species ids (used after QuerySet.update / bulk writes)."""
+    species_ids = list(species_ids)
+    SpeciesSearchToken.objects.filter(species_id__in=species_ids).delete()
+    batch = []
+    for species in Species.objects.filter(pk__in=species_ids).only('pk', *SEARCH_FIELD_WEIGHTS).iterator(chunk_size=500):
+        values = {field: getattr(species, field) for field in SEARCH_FIELD_WEIGHTS}
+        for token, weight in build_search_tokens(values).items():
+            batch.append(SpeciesSearchToken(token=token, species_id=species.pk, weight=weight))
+    SpeciesSearchToken.objects.bulk_create(batch, batch_size=2000)
+
+
+def rebuild_search_index():
+    """Rebuild the search tokens for every species. Returns the number of species indexed."""
+    SpeciesSearchToken.objects.all().delete()
+    count = 0
+    batch = []
+    for species in Species.objects.only('pk', *SEARCH_FIELD_WEIGHTS).iterator(chunk_size=500):
+        values = {field: getattr(species, field) for field in SEARCH_FIELD_WEIGHTS}
+        for token, weight in build_search_tokens(values).items():
+            batch.append(SpeciesSearchToken(token=token, species_id=species.pk, weight=weight))
+        if len(batch) >= 2000:
+            SpeciesSearchToken.objects.bulk_create(batch)
+            batch = []
+        count += 1
+    if batch:
+        SpeciesSearchToken.objects.bulk_create(batch)
+    logger.info('Rebuilt species search index for %d species', count)
+    return count
+
+
+def _use_fulltext(terms):
+    if not getattr(settings, 'SPECIES_SEARCH_USE_FULLTEXT', True):
+        return False
+    if connection.vendor != 'mysql':
+        return False
+    return all(len(term) >= FULLTEXT_MIN_TOKEN_LEN and term not in FULLTEXT_STOPWORDS for term in terms)
+
+
+def _fulltext_search(queryset, terms):
+    """Filter and rank using the MySQL/MariaDB FULLTEXT indexes (boolean mode, prefix match on every term)."""
+    boolean_query = ' '.join('+' + term + '*' for term in terms)
+    match_names = 'MATCH (%s) AGAINST (%%s IN BOOLEAN MODE)' % ', '.join(FULLTEXT_NAME_COLUMNS)
+    match_all = 'MATCH (%s) AGAINST (%%s IN BOOLEAN MODE)' % ', '.join(FULLTEXT_ALL_COLUMNS)
+    queryset = queryset.annotate(
+        search_rank=RawSQL('(4 * ' + match_names + ') + ' + match_all, (boolean_query, boolean_query))
+    )
+    return queryset.filter(search_rank__gt=0).order_by('-search_rank', 'name')
+
+
+def _token_search(queryset, terms):
+    """Filter and rank using the SpeciesSearchToken inverted index (prefix match on every term)."""
+    any_term = Q()
+    for term in terms:
+        queryset = queryset.filter(pk__in=SpeciesSearchToken.objects.filter(token__startswith=term).values('species_id'))
+        any_term |= Q(token__startswith=term)
+    rank = (SpeciesSearchToken.objects.filter(any_term, species=OuterRef('pk'))
+            .values('species').annotate(total=Sum('weight')).values('total'))
+    return queryset.annotate(search_rank=Subquery(rank)).order_by('-search_rank', 'name')
+
+
+def search_species(queryset, query_text):
+    """
+    Restrict a Species queryset to those matching query_text, ordered by relevance.
+
+    Every word in the query must match the start of a word in one of the
+    SEARCH_FIELD_WEIGHTS fields.  On MySQL/MariaDB the FULLTEXT indexes are used;
+    other databases (and terms too short for FULLTEXT) use the token table.
+    Only when that finds nothing are species whose name or alt_name contains
+    the query returned instead (the search's behaviour before the index, e.g.
+    'chromis' finding 'Pseudochromis fridmani'), with search_rank 0 - the
+    unindexed substring scan is not paid by queries the index answers.
+
+    Returns:
+        QuerySet annotated with search_rank, highest first.
+    """
+    terms = list(dict.fromkeys(tokenize(query_text)))[:MAX_QUERY_TERMS]
+    if not terms:
+        return queryset.none()
+    if _use_fulltext(terms):
+        results = _fulltext_search(queryset, terms)
+    else:
+        results = _token_search(queryset, terms)
+    if results.exists():
+        return results
+    query_text = query_text.strip()
+    return (queryset.filter(Q(name__icontains=query_text) | Q(alt_name__icontains=query_text))
+            .annotate(search_rank=Value(0)).order_by('name'))
@@ -1,13 +1,34 @@
+import hashlib
+import json
 import logging
+import queue
+import threading
+import time
+from datetime import timedelta, timezone as dt_timezone
+from urllib.parse import urlencode
 from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 import requests
-from requests.auth import HTTPBasicAuth
-from species.models import Species
+from species.api.authentication import ServiceSignatureAuth, service_signing_key
+from species.models import Species, SpeciesChangeLog, SpeciesSyncRun, SpeciesSyncState
+from species.services.species_changes import record_species_changes
+from species.services.http_client import get_session
+from species.services.species_search import index_species_ids
 
 logger = logging.getLogger(__name__)
 
+# Remote records compared and written per database round trip
+SYNC_BATCH_SIZE = 500
+
+# Pages downloaded ahead of the page being applied (bounds memory use while streaming)
+SYNC_PREFETCH_PAGES = 2
+_END_OF_PAGES = object()
+
+# Incremental syncs re-request this much before the high-water mark, covering Site2
+# saves that committed after the previous run read its server_time
+SYNC_HIGH_WATER_OVERLAP = timedelta(minutes=5)
+
 # Fields synced from Site2 to Site1
 SYNC_FIELDS = [
     'alt_name',
@@ -19,6 +40,23 @@ SYNC_FIELDS = [
     'cares_classification',
 ]
 
+# Species names per ?name= request when fetching manifest mismatches (keeps urls short)
+MANIFEST_FETCH_CHUNK = 50
+
+# SpeciesSyncRun rows kept per target (older runs are pruned after each run)
+SYNC_RUN_HISTORY = 1000
+
+
+def sync_content_hash(values):
+    """
+    Content hash of the SYNC_FIELDS of one species, from a dict of field values.
+
+    Computed identically by the manifest endpoint on Site2 and for local records
+    on Site1, so equal hashes mean _fields_match() would skip the species.
+    """
+    payload = json.dumps([values.get(field) or '' for field in SYNC_FIELDS], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
 
 class SpeciesSyncService:
     """
@@ -33,20 +71,126 @@ class SpeciesSyncService:
         self.target_url = (target_url or getattr(settings, 'TARGET_API_URL', 'http://localhost:8001')).rstrip('/')
         self.email = email or getattr(settings, 'API_SERVICE_EMAIL', 'api_service@localhost')
         self.password = password or getattr(settings, 'API_SERVICE_PASSWORD', 'changeme_in_production')
-        self.auth = HTTPBasicAuth(self.email, self.password)
+        # signed requests: the server verifies an HMAC instead of hashing the password on every page
+        self.auth = ServiceSignatureAuth(self.email, service_signing_key(self.password))
+        self.session = get_session('species_sync')
+        # request url -> (ETag, body kept for the 304 or None) of responses already applied
+        self.etags = {}
+        self._metrics_lock = threading.Lock()
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        """Zero the transfer counters and phase timings recorded in SpeciesSyncRun."""
+        self.metrics = {'pages': 0, 'bytes': 0, 'fetch_seconds': 0.0, 'wait_seconds': 0.0, 'write_seconds': 0.0}
+
+    def _add_metrics(self, **amounts):
+        # pages are fetched on the prefetch thread while batches are written on the caller's
+        with self._metrics_lock:
+            for key, amount in amounts.items():
+                self.metrics[key] += amount
 
     def _build_url(self, path):
         return f'{self.target_url}{path}'
 
-    def _fetch_page(self, url, params=None):
-        """Fetch a single page from the API, returning the parsed JSON response."""
+    def _fetch_page(self, url, params=None, keep_body=False):
+        """
+        Fetch a single page from the API, returning the parsed JSON response.
+
+        The shared session keeps the connection to Site2 alive between pages and
+        retries connection errors and 429/5xx responses with backoff before the
+        error is raised here.
+
+        The ETag of every response is remembered per request url and sent back
+        as If-None-Match.  A 304 Not Modified returns the body kept from the
+        earlier response when keep_body was set, otherwise None - meaning the
+        records behind the url are unchanged since they were last applied.
+        """
+        key = url + ('?' + urlencode(params, doseq=True) if params else '')
+        known = self.etags.get(key)
+        headers = {'If-None-Match': known[0]} if known else None
+        start = time.monotonic()
         try:
-            response = requests.get(url, auth=self.auth, params=params, timeout=30)
+            response = self.session.get(url, auth=self.auth, params=params, headers=headers)
             response.raise_for_status()
-            return response.json()
+            data = known[1] if response.status_code == 304 and known else response.json()
         except requests.RequestException as exc:
             logger.error('Failed to fetch from %s: %s', url, exc)
             raise
+        finally:
+            self._add_metrics(fetch_seconds=time.monotonic() - start)
+        # Content-Length is the transferred (compressed) size when the response was gzipped
+        size = int(response.headers.get('Content-Length') or len(response.content))
+        self._add_metrics(pages=1, bytes=size)
+        if response.status_code != 304 and response.headers.get('ETag'):
+            self.etags[key] = (response.headers['ETag'], data if keep_body else None)
+        return data
+
+    def fetch_pages(self, since=None):
+        """
+        Fetch all CARES species from Site2 API page by page, following pagination.
+
+        Pages come from the cursor-paginated changes feed, ordered by (lastUpdated, id),
+        so an incremental pull only touches the rows changed since `since`.
+
+        A background thread downloads pages while the caller works on the current
+        one, staying at most SYNC_PREFETCH_PAGES pages ahead so memory is bounded
+        regardless of the catalog size.  A fetch error is raised to the caller
+        once the pages fetched before it have been consumed.
+
+        Args:
+            since: optional datetime to filter species updated after this time
+
+        Yields:
+            list: serialized species dicts of one page
+        """
+        params = {}
+        if since is not None:
+            params['since'] = since.isoformat()
+
+        pages = queue.Queue(maxsize=SYNC_PREFETCH_PAGES)
+        stop = threading.Event()
+
+        def put(item):
+            # give up once the consumer has stopped reading, instead of blocking forever
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce():
+            url = self._build_url('/api/species-sync/changes/')
+            query = params
+            try:
+                while url and not stop.is_set():
+                    data = self._fetch_page(url, params=query)
+                    if data is None:
+                        break   # 304: the species behind this url are unchanged since they were applied
+                    query = {}  # params only needed for first request; pagination URLs include them
+                    results = data.get('results', data) if isinstance(data, dict) else data
+                    url = data.get('next') if isinstance(data, dict) else None
+                    if isinstance(results, list):
+                        put(results)
+            except Exception as exc:
+                put(exc)
+            put(_END_OF_PAGES)
+
+        producer = threading.Thread(target=produce, name='species-sync-prefetch', daemon=True)
+        producer.start()
+        try:
+            while True:
+                wait_start = time.monotonic()
+                page = pages.get()
+                self._add_metrics(wait_seconds=time.monotonic() - wait_start)
+                if page is _END_OF_PAGES:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            stop.set()
+            producer.join()
 
     def fetch_species(self, since=None):
         """
@@ -58,19 +202,33 @@ class SpeciesSyncService:
         Yields:
             dict: serialized species data for each species
         """
-        params = {}
-        if since is not None:
-            params['since'] = since.isoformat()
+        for page in self.fetch_pages(since=since):
+            yield from page
+
+    def fetch_manifest(self):
+        """Fetch the name -> content hash manifest of all CARES species from Site2."""
+        data = self._fetch_page(self._build_url('/api/species-sync/manifest/'), keep_body=True)
+        return data.get('species', {})
+
+    def fetch_named_species(self, names):
+        """
+        Fetch the full records of the named species from Site2 API.
 
-        url = self._build_url('/api/species-sync/')
-        while url:
-            data = self._fetch_page(url, params=params)
-            params = {}  # params only needed for first request; pagination URLs include them
-            results = data.get('results', data) if isinstance(data, dict) else data
-            if isinstance(results, list):
-                yield from results
-            next_url = data.get('next') if isinstance(data, dict) else None
-            url = next_url
+        Yields:
+            dict: serialized species data for each species found
+        """
+        for start in range(0, len(names), MANIFEST_FETCH_CHUNK):
+            url = self._build_url('/api/species-sync/')
+            params = {'name': names[start:start + MANIFEST_FETCH_CHUNK]}
+            while url:
+                data = self._fetch_page(url, params=params)
+                if data is None:
+                    break   # 304: unchanged since applied
+                params = {}  # pagination URLs include the names
+                results = data.get('results', data) if isinstance(data, dict) else data
+                if isinstance(results, list):
+                    yield from results
+                url = data.get('next') if isinstance(data, dict) else None
 
     def get_stats(self, since=None):
         """Fetch sync statistics from Site2 API."""
@@ -95,7 +253,13 @@ class SpeciesSyncService:
         Species are matched by name only.  Database IDs are not used because they
         are assigned independently on each site and cannot be relied upon.
 
-        All database writes are performed inside a single transaction.
+        Remote records are processed in batches of SYNC_BATCH_SIZE: the local
+        species for a whole batch are loaded with one query, differences are
+        computed in memory and the writes are applied with bulk_create /
+        bulk_update inside one transaction per batch.
+        Pages are streamed from Site2 (see fetch_pages), so batches are written
+        while later pages download.  If a page cannot be fetched the batches
+        already received are still applied and the failure counts as one error.
         In dry_run mode, no database changes are made.
 
         Args:
@@ -103,40 +267,290 @@ class SpeciesSyncService:
             dry_run: if True, simulate the sync without writing to the database
 
         Returns:
-            dict with keys: fetched, created, updated, skipped, errors
+            dict with keys: fetched, created, updated, skipped, removed, errors
+        """
+        stats = {'fetched': 0, 'created': 0, 'updated': 0, 'skipped': 0, 'removed': 0, 'errors': 0}
+        self._sync_stream(lambda: self.fetch_species(since=since), stats, dry_run)
+        logger.info(
+            'Sync complete: fetched=%d created=%d updated=%d skipped=%d errors=%d',
+            stats['fetched'], stats['created'], stats['updated'],
+            stats['skipped'], stats['errors'],
+        )
+        return stats
+
+    def sync_manifest(self, dry_run=False):
         """
-        stats = {'fetched': 0, 'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
+        Synchronize all CARES species, downloading full records only where content differs.
+
+        Site2's manifest lists a content hash of the SYNC_FIELDS of every CARES
+        species.  The same hash is computed for the local species (a local species
+        without render_cares never matches), and only the missing or differing
+        species are fetched by name and synced like sync() does.  Species whose
+        hashes match are counted as skipped without being downloaded.
 
+        Args:
+            dry_run: if True, simulate the sync without writing to the database
+
+        Returns:
+            dict with keys: fetched, created, updated, skipped, removed, errors
+        """
+        stats = {'fetched': 0, 'created': 0, 'updated': 0, 'skipped': 0, 'removed': 0, 'errors': 0}
         try:
-            remote_species_list = list(self.fetch_species(since=since))
+            manifest = self.fetch_manifest()
         except Exception as exc:
-            logger.error('Could not fetch species from Site2: %s', exc)
+            logger.error('Could not fetch species manifest from Site2: %s', exc)
             stats['errors'] += 1
             return stats
 
-        stats['fetched'] = len(remote_species_list)
-        logger.info('Fetched %d species from Site2', stats['fetched'])
-
-        for remote in remote_species_list:
-            name = remote.get('name', '').strip()
-            if not name:
-                logger.warning('Skipping species with empty name: %s', remote)
-                stats['errors'] += 1
-                continue
+        local_hashes = {}
+        for row in Species.objects.order_by().values('name', 'render_cares', *SYNC_FIELDS).iterator(chunk_size=2000):
+            # duplicate local names never match, so the batch sync reports them
+            duplicate = row['name'] in local_hashes
+            local_hashes[row['name']] = sync_content_hash(row) if row['render_cares'] and not duplicate else None
 
-            try:
-                self._sync_one(remote, name, stats, dry_run)
-            except Exception as exc:
-                logger.error('Error syncing species "%s": %s', name, exc)
-                stats['errors'] += 1
+        mismatched = [name for name, content_hash in manifest.items() if local_hashes.get(name) != content_hash]
+        stats['skipped'] = len(manifest) - len(mismatched)
+        logger.info('Manifest lists %d species: %d differ from Site1', len(manifest), len(mismatched))
 
+        self._sync_stream(lambda: self.fetch_named_species(mismatched), stats, dry_run)
         logger.info(
-            'Sync complete: fetched=%d created=%d updated=%d skipped=%d errors=%d',
+            'Manifest sync complete: fetched=%d created=%d updated=%d skipped=%d errors=%d',
             stats['fetched'], stats['created'], stats['updated'],
             stats['skipped'], stats['errors'],
         )
         return stats
 
+    def fetch_changes(self, after):
+        """
+        Fetch the Site2 species change log after sequence number `after`, page by page.
+
+        Yields:
+            (list of change entries, last sequence number of the page)
+        """
+        url = self._build_url('/api/species-sync/feed/')
+        while True:
+            data = self._fetch_page(url, params={'after': after})
+            entries = data.get('results', [])
+            after = data.get('last_sequence', after)
+            if entries:
+                yield entries, after
+            if not entries or not data.get('more'):
+                return
+
+    def sync_changes(self, after, dry_run=False):
+        """
+        Replicate the Site2 species change log from sequence number `after`.
+
+        Each page of change entries is reduced to the latest entry per species name.
+        Species still CARES on Site2 are fetched by name and synced like sync() does;
+        species deleted on Site2 or no longer CARES are removed from CARES on Site1
+        (render_cares=False).  Local species are never deleted - aquarists' species
+        instances, BAP submissions and comments may refer to them.
+
+        Work is proportional to the number of changes, not the catalog size.
+
+        Args:
+            after: last change sequence number applied (SpeciesSyncState.change_sequence)
+            dry_run: if True, simulate the sync without writing to the database
+
+        Returns:
+            dict with keys: fetched, created, updated, skipped, removed, errors and
+            sequence - the last sequence number fully applied
+        """
+        stats = {'fetched': 0, 'created': 0, 'updated': 0, 'skipped': 0, 'removed': 0, 'errors': 0, 'sequence': after}
+        try:
+            for entries, last_sequence in self.fetch_changes(after):
+                latest = {entry['name']: entry for entry in entries}
+                upserts = [name for name, entry in latest.items()
+                           if entry['action'] != SpeciesChangeLog.Action.DELETED and entry['render_cares']]
+                removals = [name for name in latest if name not in upserts]
+                errors_before = stats['errors']
+                self._sync_stream(lambda: self.fetch_named_species(upserts), stats, dry_run)
+                self._remove_species(removals, stats, dry_run)
+                if stats['errors'] != errors_before:
+                    break   # replay this page next time
+                stats['sequence'] = last_sequence
+        except Exception as exc:
+            logger.error('Could not fetch species changes from Site2: %s', exc)
+            stats['errors'] += 1
+
+        logger.info(
+            'Change sync complete: sequence=%d fetched=%d created=%d updated=%d skipped=%d removed=%d errors=%d',
+            stats['sequence'], stats['fetched'], stats['created'], stats['updated'],
+            stats['skipped'], stats['removed'], stats['errors'],
+        )
+        return stats
+
+    def _remove_species(self, names, stats, dry_run):
+        """Clear render_cares on local species removed from CARES (or deleted) on Site2."""
+        start = time.monotonic()
+        removed = list(Species.objects.filter(name__in=names, render_cares=True).only('pk', 'name', 'render_cares'))
+        for species in removed:
+            logger.info('[%s] Removed species "%s" from CARES (deleted or not CARES on Site2)',
+                        'DRY-RUN' if dry_run else 'SYNC', species.name)
+        if removed and not dry_run:
+            with transaction.atomic():
+                Species.objects.filter(pk__in=[species.pk for species in removed]).update(render_cares=False)
+                for species in removed:
+                    species.render_cares = False
+                record_species_changes(removed, SpeciesChangeLog.Action.UPDATED)
+        stats['removed'] += len(removed)
+        self._add_metrics(write_seconds=time.monotonic() - start)
+
+    def _sync_stream(self, fetch, stats, dry_run):
+        """
+        Sync the records returned by fetch() in batches of SYNC_BATCH_SIZE as they arrive.
+
+        A fetch error counts as one error; batches already received are still applied.
+        The remembered ETags are dropped after a dry run or a run with errors, so
+        the next run does not take a 304 for records that were never applied.
+        """
+        errors_before = stats['errors']
+        batch = []
+        try:
+            for remote in fetch():
+                stats['fetched'] += 1
+                batch.append(remote)
+                if len(batch) >= SYNC_BATCH_SIZE:
+                    self._apply_batch(batch, stats, dry_run)
+                    batch = []
+        except Exception as exc:
+            logger.error('Could not fetch species from Site2: %s', exc)
+            stats['errors'] += 1
+        if batch:
+            self._apply_batch(batch, stats, dry_run)
+        if dry_run or stats['errors'] != errors_before:
+            self.etags.clear()
+
+    def sync_incremental(self, since=None, full=False, dry_run=False, manifest=False):
+        """
+        Sync only the species changed on Site2 since the last successful sync.
+
+        Once a run has completed, Site2's species change feed is replayed from the
+        stored sequence number (sync_changes), which also carries deletions.  Until
+        then - or when since, full or manifest is given - the species are compared
+        instead, and the feed head read beforehand becomes the stored sequence.
+
+        The time high-water mark is kept alongside in SpeciesSyncState: Site2's
+        server_time is read from the stats endpoint before fetching, and becomes
+        the new mark once a run completes without errors.  Using Site2's own
+        clock keeps the mark independent of clock skew between the sites.
+
+        Args:
+            since: optional explicit datetime overriding the stored mark
+            full: ignore the stored mark and sync every CARES species
+            dry_run: simulate the sync; the sync state is not changed
+            manifest: compare every CARES species by content hash (sync_manifest) instead
+
+        Every run, dry runs included, is recorded as a SpeciesSyncRun with the
+        transfer counters and phase timings from self.metrics.
+
+        Returns:
+            dict: the sync() stats plus 'since' - the filter used (None for a full sync)
+            and 'sequence' - the change feed sequence synced from (None if not used)
+        """
+        self.reset_metrics()
+        if full:
+            self.etags.clear()     # --full re-applies every CARES species
+        state, _ = SpeciesSyncState.objects.get_or_create(target_url=self.target_url)
+        use_feed = since is None and not full and not manifest and state.change_sequence is not None
+        if manifest or use_feed:
+            since = None
+        elif since is None and not full and state.synced_until is not None:
+            since = state.synced_until - SYNC_HIGH_WATER_OVERLAP
+
+        started = timezone.now()
+        start_time = time.monotonic()
+        try:
+            remote_stats = self.get_stats()
+            server_time = self._parse_remote_dt(remote_stats.get('server_time'))
+            change_sequence = remote_stats.get('change_sequence')   # None: Site2 predates the change feed
+        except Exception as exc:
+            logger.error('Could not read server_time from Site2: %s', exc)
+            server_time = change_sequence = None
+
+        if use_feed and change_sequence is None and server_time is not None:
+            # Site2 no longer serves the feed - fall back to the time high-water mark
+            use_feed = False
+            if state.synced_until is not None:
+                since = state.synced_until - SYNC_HIGH_WATER_OVERLAP
+
+        if use_feed:
+            stats = self.sync_changes(state.change_sequence, dry_run=dry_run)
+            sequence = stats.pop('sequence')
+            stats['sequence'] = state.change_sequence
+        elif manifest:
+            stats = self.sync_manifest(dry_run=dry_run)
+            sequence = change_sequence
+        else:
+            stats = self.sync(since=since, dry_run=dry_run)
+            sequence = change_sequence
+        if server_time is None:
+            stats['errors'] += 1
+        stats['since'] = since.isoformat() if since else None
+        stats.setdefault('sequence', None)
+        finished = timezone.now()
+        duration = time.monotonic() - start_time
+        succeeded = stats['errors'] == 0
+        if use_feed:
+            mode = SpeciesSyncRun.Mode.CHANGES
+        elif manifest:
+            mode = SpeciesSyncRun.Mode.MANIFEST
+        else:
+            mode = SpeciesSyncRun.Mode.INCREMENTAL if since else SpeciesSyncRun.Mode.FULL
+        self._record_run(mode, dry_run, started, finished, duration, since, stats, succeeded)
+        if dry_run:
+            return stats
+
+        state.last_run_started = started
+        state.last_run_finished = finished
+        state.last_run_duration = duration
+        state.last_run_since = since
+        state.last_run_stats = {key: stats.get(key, 0) for key in ('fetched', 'created', 'updated', 'skipped', 'removed', 'errors')}
+        state.last_run_succeeded = succeeded
+        if use_feed:
+            state.change_sequence = sequence    # pages applied so far, even when a later one failed
+        if succeeded:
+            state.last_success = state.last_run_finished
+            # only advance the mark when this run covered everything since the previous one - a first
+            # run with an explicit since (--last-week) must not hide the CARES species updated before it
+            if since is None or (state.synced_until is not None and since <= state.synced_until):
+                state.synced_until = server_time
+                if not use_feed and sequence is not None:
+                    state.change_sequence = sequence
+        state.save()
+        return stats
+
+    def _record_run(self, mode, dry_run, started, finished, duration, since, stats, succeeded):
+        """Save the SpeciesSyncRun history row of one run and prune the oldest beyond SYNC_RUN_HISTORY."""
+        run = SpeciesSyncRun.objects.create(
+            target_url=self.target_url,
+            mode=mode,
+            dry_run=dry_run,
+            started=started,
+            finished=finished,
+            duration=duration,
+            since=since,
+            sequence=stats['sequence'],
+            succeeded=succeeded,
+            fetched=stats['fetched'],
+            created=stats['created'],
+            updated=stats['updated'],
+            skipped=stats['skipped'],
+            removed=stats.get('removed', 0),
+            errors=stats['errors'],
+            pages=self.metrics['pages'],
+            bytes_received=self.metrics['bytes'],
+            fetch_seconds=self.metrics['fetch_seconds'],
+            wait_seconds=self.metrics['wait_seconds'],
+            write_seconds=self.metrics['write_seconds'],
+        )
+        history = SpeciesSyncRun.objects.filter(target_url=self.target_url)
+        expired = list(history.values_list('pk', flat=True)[SYNC_RUN_HISTORY:])
+        if expired:
+            history.filter(pk__in=expired).delete()
+        return run
+
     def _parse_remote_dt(self, value):
         """Parse a datetime string from the remote API into an aware datetime."""
         if value is None:
@@ -144,7 +558,7 @@ class SpeciesSyncService:
         from django.utils.dateparse import parse_datetime
         dt = parse_datetime(value)
         if dt is not None and timezone.is_naive(dt):
-            dt = timezone.make_aware(dt, timezone.utc)
+            dt = timezone.make_aware(dt, dt_timezone.utc)
         return dt
 
     def _fields_match(self, local, remote):
@@ -170,67 +584,132 @@ class SpeciesSyncService:
             return False
         return True
 
-    @transaction.atomic
-    def _sync_one(self, remote, name, stats, dry_run):
-        """Process a single species record from Site2."""
+    def _apply_batch(self, batch, stats, dry_run):
+        """Sync one batch, counting every record of a failed batch as an error."""
+        start = time.monotonic()
         try:
-            local = Species.objects.get(name=name)
-        except Species.DoesNotExist:
-            local = None
-
-        if local is None:
-            # Species does not exist on Site1 at all – create it unconditionally.
-            if not dry_run:
-                self._create_species(remote, name)
-            logger.info('[%s] Created species "%s" (new – not found in Site1)', 'DRY-RUN' if dry_run else 'SYNC', name)
-            stats['created'] += 1
-            return
-
-        # Species found in Site1 – compare field values to decide whether to update.
-        # Timestamp comparison is intentionally avoided: Species.lastUpdated uses
-        # auto_now=True, so any previous save could have set it to the save time
-        # rather than the Site2 value, causing perpetual skips even when fields differ.
-        logger.info('"%s" already exists in Site1 – comparing fields', name)
-        if self._fields_match(local, remote):
-            logger.info('Skipping "%s": all fields already match Site2', name)
-            stats['skipped'] += 1
-            return
-
-        if not dry_run:
-            self._update_species(local, remote)
-        logger.info('[%s] Updated species "%s" (fields differ from Site2)', 'DRY-RUN' if dry_run else 'SYNC', name)
-        stats['updated'] += 1
-
-    def _create_species(self, remote, name):
-        """Create a new Species record from remote data."""
+            self._sync_batch(batch, stats, dry_run)
+        except Exception as exc:
+            logger.error('Error syncing batch of %d species: %s', len(batch), exc)
+            stats['errors'] += len(batch)
+        finally:
+            self._add_metrics(write_seconds=time.monotonic() - start)
+
+    def _sync_batch(self, batch, stats, dry_run):
+        """
+        Create, update or skip one batch of Site2 records with a handful of queries.
+
+        Stats are only added once the batch is written, so a failed batch is
+        counted as errors by the caller without double counting.
+        """
+        remote_by_name = {}
+        errors = 0
+        skipped = 0
+        for remote in batch:
+            name = (remote.get('name') or '').strip()
+            if not name:
+                logger.warning('Skipping species with empty name: %s', remote)
+                errors += 1
+                continue
+            if name in remote_by_name:
+                logger.warning('Duplicate species "%s" in Site2 data - last record used', name)
+                skipped += 1
+            remote_by_name[name] = remote
+
+        local_by_name = {}
+        for local in Species.objects.filter(name__in=list(remote_by_name)):
+            local_by_name.setdefault(local.name, []).append(local)
+
+        mode = 'DRY-RUN' if dry_run else 'SYNC'
+        new_species = []
+        changed_species = []
+        changed_fields = set()
+        for name, remote in remote_by_name.items():
+            matches = local_by_name.get(name, [])
+            if len(matches) > 1:
+                logger.error('Error syncing species "%s": %d local species share this name', name, len(matches))
+                errors += 1
+                continue
+
+            if not matches:
+                # Species does not exist on Site1 at all – create it unconditionally.
+                new_species.append(self._new_species(remote, name))
+                logger.info('[%s] Created species "%s" (new – not found in Site1)', mode, name)
+                continue
+
+            # Species found in Site1 – compare field values to decide whether to update.
+            # Timestamp comparison is intentionally avoided: Species.lastUpdated uses
+            # auto_now=True, so any previous save could have set it to the save time
+            # rather than the Site2 value, causing perpetual skips even when fields differ.
+            local = matches[0]
+            if self._fields_match(local, remote):
+                logger.debug('Skipping "%s": all fields already match Site2', name)
+                skipped += 1
+                continue
+            changed_fields.update(self._apply_remote(local, remote))
+            changed_species.append(local)
+            logger.info('[%s] Updated species "%s" (fields differ from Site2)', mode, name)
+
+        if not dry_run and (new_species or changed_species):
+            self._write_batch(new_species, changed_species, changed_fields)
+
+        stats['created'] += len(new_species)
+        stats['updated'] += len(changed_species)
+        stats['skipped'] += skipped
+        stats['errors'] += errors
+
+    @transaction.atomic
+    def _write_batch(self, new_species, changed_species, changed_fields):
+        """Apply one batch of creates and updates and refresh their search index and change log entries."""
+        changed_ids = [species.pk for species in changed_species]
+        if changed_species:
+            # bulk_update does not apply auto_now, so the remote lastUpdated is preserved
+            Species.objects.bulk_update(changed_species, sorted(changed_fields), batch_size=SYNC_BATCH_SIZE)
+            record_species_changes(changed_species, SpeciesChangeLog.Action.UPDATED)
+
+        if new_species:
+            remote_last_updated = {species.name: species.lastUpdated for species in new_species}
+            Species.objects.bulk_create(new_species, batch_size=SYNC_BATCH_SIZE)
+            # bulk_create applies auto_now and may not return ids (MySQL) - reload the new rows
+            # by name and write back the remote lastUpdated so future syncs compare correctly
+            created = list(Species.objects.filter(name__in=list(remote_last_updated))
+                           .only('pk', 'name', 'render_cares', 'lastUpdated'))
+            for species in created:
+                if remote_last_updated[species.name] is not None:
+                    species.lastUpdated = remote_last_updated[species.name]
+            Species.objects.bulk_update(created, ['lastUpdated'], batch_size=SYNC_BATCH_SIZE)
+            changed_ids.extend(species.pk for species in created)
+            record_species_changes(created, SpeciesChangeLog.Action.CREATED)
+
+        # bulk writes skip post_save, so refresh the search index (and the change log above) explicitly.
+        index_species_ids(changed_ids)
+
+    def _new_species(self, remote, name):
+        """Build an unsaved Species from remote data (lastUpdated carries the remote value)."""
         kwargs = {'name': name}
         for field in SYNC_FIELDS:
             if field in remote and remote[field] is not None:
                 kwargs[field] = remote[field]
         # render_cares=True since we only receive CARES species from Site2
         kwargs['render_cares'] = True
-        species = Species.objects.create(**kwargs)
-        # Preserve the remote lastUpdated so future syncs compare correctly.
-        # Species.lastUpdated uses auto_now=True which would otherwise overwrite
-        # the timestamp with the sync time, causing every subsequent sync to skip
-        # this species (since the local timestamp would always be newer).
-        remote_last_updated = self._parse_remote_dt(remote.get('lastUpdated'))
-        if remote_last_updated is not None:
-            Species.objects.filter(pk=species.pk).update(lastUpdated=remote_last_updated)
+        species = Species(**kwargs)
+        species.lastUpdated = self._parse_remote_dt(remote.get('lastUpdated'))
+        return species
 
-    def _update_species(self, local, remote):
-        """Update an existing Species record from remote data."""
-        update_kwargs = {}
+    def _apply_remote(self, local, remote):
+        """Copy differing remote values onto local in memory and return the changed field names."""
+        changed = []
         for field in SYNC_FIELDS:
             if field in remote and remote[field] is not None:
                 if getattr(local, field) != remote[field]:
-                    update_kwargs[field] = remote[field]
+                    setattr(local, field, remote[field])
+                    changed.append(field)
         if not local.render_cares:
-            update_kwargs['render_cares'] = True
-        # Preserve the remote lastUpdated via QuerySet.update() which bypasses
-        # auto_now, so future syncs can correctly detect whether Site2 is newer.
+            local.render_cares = True
+            changed.append('render_cares')
+        # Preserve the remote lastUpdated so future syncs can correctly detect whether Site2 is newer.
         remote_last_updated = self._parse_remote_dt(remote.get('lastUpdated'))
         if remote_last_updated is not None:
-            update_kwargs['lastUpdated'] = remote_last_updated
-        if update_kwargs:
-            Species.objects.filter(pk=local.pk).update(**update_kwargs)
+            local.lastUpdated = remote_last_updated
+            changed.append('lastUpdated')
+        return changed
@@ -0,0 +1,213 @@
+"""
+Local stand-in for the Site2 species-sync API, used to benchmark SpeciesSyncService.
+
+StubSite2Server serves a synthetic catalog of CARES species over HTTP with the
+same endpoints, response shapes and pagination the real API uses - list,
+changes, manifest, feed and stats - so every sync mode runs end to end (HTTP
+client, prefetch thread, batched writes) without a second deployment.  Records are generated on demand from their index, so
+catalogs of any size use no memory on the server side.  Authentication is
+not checked.
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+from species.models import Species, SpeciesChangeLog
+from species.services.species_sync import sync_content_hash
+
+logger = logging.getLogger(__name__)
+
+STUB_NAME_PREFIX = 'Syncbench'
+STUB_EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+STUB_MAX_PAGE_SIZE = 1000     # as SpeciesSyncCursorPagination.max_page_size
+STUB_FEED_LIMIT = 1000        # as species_changes.CHANGE_FEED_LIMIT
+
+
+class SyntheticCatalog:
+    """
+    Deterministic catalog of `size` CARES species.
+
+    Record i is updated i minutes after STUB_EPOCH, so the ?since= filter maps
+    to an index.  Bumping `revision` changes every description and moves every
+    lastUpdated on by a day - the next sync then updates the whole catalog.
+
+    The change feed has one entry per record and revision: sequence
+    revision * size + i + 1 created (revision 0) or updated record i.
+    """
+
+    def __init__(self, size, revision=0):
+        self.size = size
+        self.revision = revision
+        self.regions = Species.GlobalRegion.values
+        self.families = Species.CaresFamily.values
+        self.iucn = Species.IucnRedList.values
+        self.classifications = Species.CaresStatus.values
+
+    def name(self, index):
+        return f'{STUB_NAME_PREFIX} species{index:07d}'
+
+    def index_of(self, name):
+        """Index of the record called `name`, or None if it is not in the catalog."""
+        prefix = f'{STUB_NAME_PREFIX} species'
+        if not name.startswith(prefix) or not name[len(prefix):].isdigit():
+            return None
+        index = int(name[len(prefix):])
+        return index if index < self.size else None
+
+    def last_updated(self, index):
+        return STUB_EPOCH + timedelta(days=self.revision, minutes=index)
+
+    def first_updated_since(self, since):
+        """Index of the first record with lastUpdated >= since."""
+        minutes = (since - self.last_updated(0)).total_seconds() / 60
+        return min(max(0, math.ceil(minutes)), self.size)
+
+    @property
+    def change_sequence(self):
+        """Sequence number of the newest change feed entry."""
+        return self.size * (self.revision + 1)
+
+    def change(self, sequence):
+        revision, index = divmod(sequence - 1, self.size)
+        action = SpeciesChangeLog.Action.CREATED if revision == 0 else SpeciesChangeLog.Action.UPDATED
+        return {'sequence': sequence, 'name': self.name(index), 'action': action, 'render_cares': True}
+
+    def record(self, index):
+        return {
+            'name': self.name(index),
+            'alt_name': '',
+            'description': f'Synthetic species {index} for sync benchmarks (revision {self.revision})',
+            'global_region': self.regions[index % len(self.regions)],
+            'local_distribution': f'River system {index % 97}',
+            'cares_family': self.families[index % len(self.families)],
+            'iucn_red_list': self.iucn[index % len(self.iucn)],
+            'cares_classification': self.classifications[index % len(self.classifications)],
+            'render_cares': True,
+            'created': STUB_EPOCH.isoformat(),
+            'lastUpdated': self.last_updated(index).isoformat(),
+        }
+
+
+class StubSite2Handler(BaseHTTPRequestHandler):
+    """Answers the species-sync endpoints SpeciesSyncService calls, after the configured latency."""
+    protocol_version = 'HTTP/1.1'       # keep-alive, as gunicorn behind nginx
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if url.path in ('/api/species-sync/', '/api/species-sync/changes/'):
+            self.send_json(200, self.species_page(url.path, query))
+        elif url.path == '/api/species-sync/manifest/':
+            catalog = server.catalog
+            self.send_json(200, {
+                'server_time': datetime.now(dt_timezone.utc).isoformat(),
+                'species': {catalog.name(i): sync_content_hash(catalog.record(i)) for i in range(catalog.size)},
+            })
+        elif url.path == '/api/species-sync/feed/':
+            self.send_json(200, self.feed_page(query))
+        elif url.path == '/api/species-sync/stats/':
+            self.send_json(200, {
+                'total_cares_species': server.catalog.size,
+                'server_time': datetime.now(dt_timezone.utc).isoformat(),
+                'change_sequence': server.catalog.change_sequence,
+            })
+        else:
+            self.send_json(404, {'detail': 'Not found.'})
+
+    def species_page(self, path, query):
+        catalog = self.server.catalog
+        try:
+            page_size = min(int(query.get('page_size', [self.server.page_size])[0]), STUB_MAX_PAGE_SIZE)
+        except ValueError:
+            page_size = self.server.page_size
+        if 'name' in query:
+            indexes = sorted(i for i in map(catalog.index_of, query['name']) if i is not None)
+            return {'next': None, 'previous': None, 'results': [catalog.record(i) for i in indexes]}
+
+        if 'cursor' in query:
+            start = int(query['cursor'][0])
+        elif 'since' in query:
+            start = catalog.first_updated_since(datetime.fromisoformat(query['since'][0]))
+        else:
+            start = 0
+        end = min(start + page_size, catalog.size)
+        next_url = None
+        if end < catalog.size:
+            next_url = f'http://{self.headers["Host"]}{path}?' + urlencode({'cursor': end, 'page_size': page_size})
+        return {'next': next_url, 'previous': None, 'results': [catalog.record(i) for i in range(start, end)]}
+
+    def feed_page(self, query):
+        catalog = self.server.catalog
+        try:
+            after = int(query.get('after', [0])[0])
+            limit = min(int(query.get('limit', [STUB_FEED_LIMIT])[0]), STUB_FEED_LIMIT)
+        except ValueError:
+            after, limit = 0, STUB_FEED_LIMIT
+        end = min(max(after, 0) + limit, catalog.change_sequence)
+        results = [catalog.change(sequence) for sequence in range(max(after, 0) + 1, end + 1)]
+        return {'results': results, 'last_sequence': end if results else after, 'more': end < catalog.change_sequence}
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.count_response(len(body))
+
+    def log_message(self, format, *args):
+        logger.debug('stub Site2: ' + format, *args)
+
+
+class StubSite2Server(ThreadingHTTPServer):
+    """
+    Threaded HTTP server for a SyntheticCatalog.
+
+    Usage:
+        server = StubSite2Server(SyntheticCatalog(10000), latency=0.05).start()
+        SpeciesSyncService(target_url=server.url).sync()
+        server.stop()
+    """
+    daemon_threads = True
+
+    def __init__(self, catalog, host='127.0.0.1', port=0, latency=0.0, page_size=100):
+        super().__init__((host, port), StubSite2Handler)
+        self.catalog = catalog
+        self.latency = latency
+        self.page_size = page_size
+        self.requests = 0
+        self.bytes_sent = 0
+        self._counter_lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def count_response(self, size):
+        with self._counter_lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+    def reset_counters(self):
+        with self._counter_lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def start(self):
+        """Serve from a background thread; returns the server."""
+        threading.Thread(target=self.serve_forever, name='stub-site2', daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
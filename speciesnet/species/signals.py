@@ -0,0 +1,92 @@
+"""
+Model signal handlers for the species app - connected in SpeciesConfig.ready()
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from species.models import BapSubmission, Species, SpeciesChangeLog, SpeciesInstance
+from species.services.bap_leaderboard import apply_submission_change, submission_contribution
+from species.services.species_changes import record_species_change
+from species.services.species_counts import apply_instance_change, instance_contribution
+from species.services.species_search import SEARCH_FIELD_WEIGHTS, index_species
+
+
+### Species search index
+
+@receiver(post_save, sender=Species)
+def update_species_search_index(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return  # loaddata - rebuild with manage.py rebuild_search_index
+    if update_fields is not None and not set(update_fields) & set(SEARCH_FIELD_WEIGHTS):
+        return  # no searchable text changed
+    index_species(instance)
+
+
+### Species change log - feed consumed by sync_species on Site1
+
+@receiver(pre_save, sender=Species)
+def remember_species_name(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        instance._changelog_old_name = None
+        return
+    instance._changelog_old_name = Species.objects.filter(pk=instance.pk).values_list('name', flat=True).first()
+
+@receiver(post_save, sender=Species)
+def record_species_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    old_name = getattr(instance, '_changelog_old_name', None)
+    if old_name and old_name != instance.name:
+        # renamed - the old name disappears from the CARES list
+        record_species_change(instance, SpeciesChangeLog.Action.DELETED, name=old_name)
+    record_species_change(instance, SpeciesChangeLog.Action.CREATED if created else SpeciesChangeLog.Action.UPDATED)
+    instance._changelog_old_name = None
+
+@receiver(post_delete, sender=Species)
+def record_species_delete(sender, instance, **kwargs):
+    record_species_change(instance, SpeciesChangeLog.Action.DELETED)
+
+
+### BAP leaderboard - incremental updates as submissions change
+
+@receiver(pre_save, sender=BapSubmission)
+def remember_bap_submission_contribution(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        instance._leaderboard_before = None
+        return
+    stored = BapSubmission.objects.select_related('speciesInstance__species').filter(pk=instance.pk).first()
+    instance._leaderboard_before = submission_contribution(stored)
+
+@receiver(post_save, sender=BapSubmission)
+def update_bap_leaderboard_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return  # loaddata - rebuild with manage.py rebuild_bap_leaderboard
+    apply_submission_change(getattr(instance, '_leaderboard_before', None), submission_contribution(instance))
+    instance._leaderboard_before = None
+
+@receiver(post_delete, sender=BapSubmission)
+def update_bap_leaderboard_on_delete(sender, instance, **kwargs):
+    apply_submission_change(submission_contribution(instance), None)
+
+
+### Species instance counters - aquarist / kept / spawned counts cached on Species
+
+@receiver(pre_save, sender=SpeciesInstance)
+def remember_species_instance_contribution(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        instance._counters_before = None
+        return
+    stored = SpeciesInstance.objects.filter(pk=instance.pk).only(
+        'species_id', 'user_id', 'currently_keep', 'have_spawned').first()
+    instance._counters_before = instance_contribution(stored)
+
+@receiver(post_save, sender=SpeciesInstance)
+def update_species_counters_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return  # loaddata - rebuild with manage.py rebuild_species_counts
+    apply_instance_change(getattr(instance, '_counters_before', None), instance_contribution(instance), instance.pk)
+    instance._counters_before = None
+
+@receiver(post_delete, sender=SpeciesInstance)
+def update_species_counters_on_delete(sender, instance, **kwargs):
+    apply_instance_change(instance_contribution(instance), None, instance.pk)
@@ -1,14 +1,19 @@
 """
 Tests for the CARES species-sync REST API endpoints and sync service.
 """
+import time
+from io import StringIO
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta, timezone as dt_timezone
-from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APIClient
-from species.models import User, Species
-from species.services.species_sync import SpeciesSyncService, SYNC_FIELDS
+from species.models import User, Species, SpeciesChangeLog, SpeciesSyncRun, SpeciesSyncState
+from species.services.species_sync import SpeciesSyncService, SYNC_FIELDS, SYNC_HIGH_WATER_OVERLAP, sync_content_hash
+from species.services.species_sync_stub import STUB_NAME_PREFIX, StubSite2Server, SyntheticCatalog
 from . import BaseTestCase, MinimalTestCase
 
 
@@ -182,6 +187,334 @@ class SpeciesSyncAPITest(BaseTestCase):
         self.assertNotIn('created_by', record)
 
 
+class SpeciesSyncChangesFeedTest(MinimalTestCase):
+    """Test the cursor-paginated changes feed, ETags and compression."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.staff_user = User.objects.create_user(
+            email='feed_staff@example.com', username='feed_staff', password='staffpass123', is_staff=True)
+        self.client.force_authenticate(user=self.staff_user)
+        base = timezone.now() - timedelta(days=5)
+        for i in range(5):
+            species = Species.objects.create(name=f'Nothobranchius feed{i}', render_cares=True,
+                                             description='Killifish ' * 30)
+            Species.objects.filter(pk=species.pk).update(lastUpdated=base + timedelta(days=i))
+
+    def test_changes_pages_follow_last_updated_order(self):
+        """Cursor pages walk species in (lastUpdated, id) order without offsets."""
+        names = []
+        url = '/api/species-sync/changes/?page_size=2'
+        while url:
+            data = self.client.get(url).json()
+            self.assertNotIn('count', data)
+            names += [species['name'] for species in data['results']]
+            url = data['next']
+        self.assertEqual(names, [f'Nothobranchius feed{i}' for i in range(5)])
+
+    def test_changes_since_filter(self):
+        """?since limits the feed to species changed after the given time."""
+        since = (timezone.now() - timedelta(days=2, hours=12)).isoformat().replace('+00:00', 'Z')
+        data = self.client.get(f'/api/species-sync/changes/?since={since}').json()
+        self.assertEqual([species['name'] for species in data['results']],
+                         ['Nothobranchius feed3', 'Nothobranchius feed4'])
+
+    def test_unchanged_poll_returns_304(self):
+        """A matching If-None-Match gets 304 until a species changes."""
+        for url in ('/api/species-sync/', '/api/species-sync/changes/'):
+            with self.subTest(url=url):
+                first = self.client.get(url)
+                self.assertEqual(first.status_code, 200)
+                etag = first['ETag']
+                with self.assertNumQueries(1):
+                    second = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(second.status_code, 304)
+                self.assertEqual(second.content, b'')
+
+        etag = self.client.get('/api/species-sync/changes/')['ETag']
+        Species.objects.filter(name='Nothobranchius feed0').update(description='Changed', lastUpdated=timezone.now())
+        self.assertEqual(self.client.get('/api/species-sync/changes/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_gzipped_etag_returns_304(self):
+        """The weak ETag of a compressed response matches on the next request."""
+        for url in ('/api/species-sync/', '/api/species-sync/changes/', '/api/species-sync/manifest/'):
+            with self.subTest(url=url):
+                first = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+                self.assertEqual(first['Content-Encoding'], 'gzip')
+                self.assertTrue(first['ETag'].startswith('W/'))
+                second = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=first['ETag'])
+                self.assertEqual(second.status_code, 304)
+
+    def test_client_sends_etag_and_treats_304_as_unchanged(self):
+        """SpeciesSyncService sends the ETag back per url; a 304 means nothing to apply."""
+        service = SpeciesSyncService(target_url='http://site2')
+        url = 'http://site2/api/species-sync/changes/'
+        since = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+        changed = MagicMock(status_code=200, headers={'ETag': 'W/"abc"', 'Content-Length': '20'})
+        changed.json.return_value = {'results': [{'name': 'Nothobranchius feed0'}], 'next': None}
+        unchanged = MagicMock(status_code=304, headers={'ETag': 'W/"abc"'}, content=b'')
+        with patch.object(service, 'session') as session:
+            session.get.return_value = changed
+            self.assertEqual(len(service._fetch_page(url, params={'since': since.isoformat()})['results']), 1)
+            self.assertIsNone(session.get.call_args.kwargs['headers'])
+            session.get.return_value = unchanged
+            self.assertIsNone(service._fetch_page(url, params={'since': since.isoformat()}))
+            self.assertEqual(session.get.call_args.kwargs['headers'], {'If-None-Match': 'W/"abc"'})
+            self.assertEqual(list(service.fetch_species(since=since)), [])
+            # a different url is not conditional
+            session.get.return_value = changed
+            service._fetch_page(url)
+            self.assertIsNone(session.get.call_args.kwargs['headers'])
+
+    def test_stats_never_cached(self):
+        """Stats carry no ETag - server_time and the change feed head are always current."""
+        response = self.client.get('/api/species-sync/stats/', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+
+    def test_responses_gzipped_when_accepted(self):
+        """The API compresses responses for clients sending Accept-Encoding: gzip."""
+        import gzip
+        import json
+        response = self.client.get('/api/species-sync/changes/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))['results']), 5)
+
+
+class SpeciesSyncManifestTest(MinimalTestCase):
+    """Test the content-hash manifest endpoint and manifest sync mode."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='manifest@example.com', username='manifest_user', password='testpass123', is_staff=True)
+
+    def _remote(self, name, **kwargs):
+        data = {'name': name, 'alt_name': '', 'description': '', 'global_region': 'AFR', 'local_distribution': '',
+                'cares_family': 'CIC', 'iucn_red_list': 'CR', 'cares_classification': 'CEND', 'render_cares': True}
+        data.update(kwargs)
+        return data
+
+    def test_manifest_hashes_match_records(self):
+        """The manifest lists every CARES species with the hash of its synced fields."""
+        Species.objects.create(name='Nothobranchius guentheri', description='Zanzibar', render_cares=True)
+        Species.objects.create(name='Aulonocara baenschi', render_cares=False)
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        data = client.get('/api/species-sync/manifest/').json()
+        record = client.get('/api/species-sync/?name=Nothobranchius guentheri').json()['results'][0]
+        self.assertIn('server_time', data)
+        self.assertEqual(data['species'], {'Nothobranchius guentheri': sync_content_hash(record)})
+
+    def test_list_filters_by_repeated_name(self):
+        """?name= may be repeated to fetch several named species."""
+        for name in ('Nothobranchius guentheri', 'Nothobranchius rachovii', 'Nothobranchius kirki'):
+            Species.objects.create(name=name, render_cares=True)
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        data = client.get('/api/species-sync/', {'name': ['Nothobranchius kirki', 'Nothobranchius rachovii']}).json()
+        self.assertEqual([s['name'] for s in data['results']], ['Nothobranchius kirki', 'Nothobranchius rachovii'])
+
+    def test_manifest_sync_fetches_only_differences(self):
+        """Matching species are skipped without download; differing and missing ones are synced."""
+        remote = {
+            'Nothobranchius guentheri': self._remote('Nothobranchius guentheri'),
+            'Nothobranchius rachovii': self._remote('Nothobranchius rachovii', description='New'),
+            'Nothobranchius kirki': self._remote('Nothobranchius kirki'),
+            'Nothobranchius eggersi': self._remote('Nothobranchius eggersi'),
+        }
+        Species.objects.create(name='Nothobranchius guentheri', render_cares=True, **{
+            field: remote['Nothobranchius guentheri'][field] for field in SYNC_FIELDS})
+        Species.objects.create(name='Nothobranchius rachovii', render_cares=True, description='Old')
+        Species.objects.create(name='Nothobranchius eggersi', render_cares=False, **{
+            field: remote['Nothobranchius eggersi'][field] for field in SYNC_FIELDS})
+        service = SpeciesSyncService()
+        manifest = {name: sync_content_hash(data) for name, data in remote.items()}
+        with patch.object(service, 'fetch_manifest', return_value=manifest), \
+             patch.object(service, 'fetch_named_species',
+                          side_effect=lambda names: [remote[name] for name in names]) as fetch_named:
+            stats = service.sync_manifest(dry_run=False)
+        self.assertEqual(sorted(fetch_named.call_args.args[0]),
+                         ['Nothobranchius eggersi', 'Nothobranchius kirki', 'Nothobranchius rachovii'])
+        self.assertEqual((stats['fetched'], stats['created'], stats['updated'], stats['skipped'], stats['errors']),
+                         (3, 1, 2, 1, 0))
+        self.assertEqual(Species.objects.get(name='Nothobranchius rachovii').description, 'New')
+        self.assertTrue(Species.objects.get(name='Nothobranchius eggersi').render_cares)
+
+        # everything matches now - the next manifest sync downloads nothing
+        with patch.object(service, 'fetch_manifest', return_value=manifest), \
+             patch.object(service, 'fetch_named_species', side_effect=lambda names: []) as fetch_named:
+            stats = service.sync_manifest(dry_run=False)
+        self.assertEqual(fetch_named.call_args.args[0], [])
+        self.assertEqual(stats['skipped'], 4)
+
+
+
+@override_settings(SPECIES_CHANGE_FEED_SETTLE_SECONDS=0)
+class SpeciesChangeFeedTest(MinimalTestCase):
+    """Test the species change log, its feed endpoint and change feed sync."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='feed@example.com', username='feed_user', password='testpass123', is_staff=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _log(self):
+        return list(SpeciesChangeLog.objects.values_list('species_name', 'action', 'render_cares'))
+
+    def test_species_writes_are_logged(self):
+        """Creates, updates, renames and deletes each append to the change log."""
+        with self.captureOnCommitCallbacks(execute=True):
+            species = Species.objects.create(name='Nothobranchius guentheri', render_cares=True)
+            species.description = 'Zanzibar'
+            species.save()
+            species.name = 'Nothobranchius guentheri Zanzibar'
+            species.save()
+            species.delete()
+        self.assertEqual(self._log(), [
+            ('Nothobranchius guentheri', 'C', True),
+            ('Nothobranchius guentheri', 'U', True),
+            ('Nothobranchius guentheri', 'D', False),
+            ('Nothobranchius guentheri Zanzibar', 'U', True),
+            ('Nothobranchius guentheri Zanzibar', 'D', False),
+        ])
+
+    def test_entries_written_after_commit(self):
+        """Entries get their ids only after the species data commits, not inside a long transaction."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            Species.objects.create(name='Nothobranchius guentheri', render_cares=True)
+            self.assertEqual(self._log(), [])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self._log(), [('Nothobranchius guentheri', 'C', True)])
+
+    def test_feed_endpoint_pages_by_sequence(self):
+        """The feed returns entries after ?after= in sequence order, limit at a time."""
+        with self.captureOnCommitCallbacks(execute=True):
+            for name in ('Nothobranchius guentheri', 'Nothobranchius rachovii', 'Nothobranchius kirki'):
+                Species.objects.create(name=name, render_cares=True)
+        first = SpeciesChangeLog.objects.first().id
+        data = self.client.get('/api/species-sync/feed/', {'after': first, 'limit': 1}).json()
+        self.assertEqual([e['name'] for e in data['results']], ['Nothobranchius rachovii'])
+        self.assertEqual(data['last_sequence'], first + 1)
+        self.assertTrue(data['more'])
+        data = self.client.get('/api/species-sync/feed/', {'after': data['last_sequence']}).json()
+        self.assertEqual([e['name'] for e in data['results']], ['Nothobranchius kirki'])
+        self.assertFalse(data['more'])
+        self.assertEqual(self.client.get('/api/species-sync/stats/').json()['change_sequence'], first + 2)
+        self.assertEqual(self.client.get('/api/species-sync/feed/', {'after': 'x'}).status_code, 400)
+
+    @override_settings(SPECIES_CHANGE_FEED_SETTLE_SECONDS=60)
+    def test_feed_holds_back_unsettled_entries(self):
+        """Entries younger than the settle window are not served yet."""
+        with self.captureOnCommitCallbacks(execute=True):
+            Species.objects.create(name='Nothobranchius guentheri', render_cares=True)
+        data = self.client.get('/api/species-sync/feed/').json()
+        self.assertEqual((data['results'], data['last_sequence']), ([], 0))
+
+    def test_sync_changes_applies_upserts_and_removals(self):
+        """Changed CARES species are fetched by name; deleted or de-listed ones lose render_cares."""
+        Species.objects.create(name='Nothobranchius rachovii', render_cares=True, description='Old')
+        Species.objects.create(name='Nothobranchius kirki', render_cares=True)
+        Species.objects.create(name='Nothobranchius eggersi', render_cares=True)
+        feed = {'results': [
+            {'sequence': 11, 'name': 'Nothobranchius rachovii', 'action': 'U', 'render_cares': True},
+            {'sequence': 12, 'name': 'Nothobranchius kirki', 'action': 'D', 'render_cares': False},
+            {'sequence': 13, 'name': 'Nothobranchius eggersi', 'action': 'U', 'render_cares': False},
+            {'sequence': 14, 'name': 'Nothobranchius guentheri', 'action': 'D', 'render_cares': False},
+            {'sequence': 15, 'name': 'Nothobranchius guentheri', 'action': 'C', 'render_cares': True},
+        ], 'last_sequence': 15, 'more': False}
+        remote = {name: {'name': name, 'global_region': 'AFR', 'description': 'New', 'render_cares': True}
+                  for name in ('Nothobranchius rachovii', 'Nothobranchius guentheri')}
+        service = SpeciesSyncService()
+        with patch.object(service, '_fetch_page', return_value=feed) as fetch_page, \
+             patch.object(service, 'fetch_named_species',
+                          side_effect=lambda names: [remote[name] for name in names]) as fetch_named:
+            stats = service.sync_changes(10, dry_run=False)
+        self.assertEqual(fetch_page.call_args.kwargs['params'], {'after': 10})
+        self.assertEqual(sorted(fetch_named.call_args.args[0]), ['Nothobranchius guentheri', 'Nothobranchius rachovii'])
+        self.assertEqual((stats['created'], stats['updated'], stats['removed'], stats['errors'], stats['sequence']),
+                         (1, 1, 2, 0, 15))
+        self.assertEqual(Species.objects.get(name='Nothobranchius rachovii').description, 'New')
+        self.assertFalse(Species.objects.get(name='Nothobranchius kirki').render_cares)
+        self.assertFalse(Species.objects.get(name='Nothobranchius eggersi').render_cares)
+
+    def test_sync_incremental_switches_to_change_feed(self):
+        """A completed sync stores the feed head; the next run replays the feed from it."""
+        service = SpeciesSyncService(target_url='http://site2')
+        server_time = datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc).isoformat()
+        with patch.object(service, 'get_stats', return_value={'server_time': server_time, 'change_sequence': 42}), \
+             patch.object(service, 'fetch_species', return_value=[]):
+            stats = service.sync_incremental()
+        self.assertIsNone(stats['sequence'])
+        self.assertEqual(SpeciesSyncState.objects.get().change_sequence, 42)
+
+        with patch.object(service, 'get_stats', return_value={'server_time': server_time, 'change_sequence': 43}), \
+             patch.object(service, 'fetch_species') as fetch_species, \
+             patch.object(service, '_fetch_page', return_value={'results': [
+                 {'sequence': 43, 'name': 'Nothobranchius kirki', 'action': 'D', 'render_cares': False},
+             ], 'last_sequence': 43, 'more': False}):
+            stats = service.sync_incremental()
+        fetch_species.assert_not_called()
+        self.assertEqual(stats['sequence'], 42)
+        self.assertEqual(SpeciesSyncState.objects.get().change_sequence, 43)
+
+
+class ServiceSignatureAuthenticationTest(MinimalTestCase):
+    """Test HMAC-signed requests from the API service account."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.service_user = User.objects.create_user(
+            email='api_service@localhost', username='api_service', password='SyncPass123!', is_staff=True)
+        Species.objects.create(name='Nothobranchius guentheri', render_cares=True)
+
+    def _signed_header(self, path, **kwargs):
+        import requests
+        with self.settings(API_SERVICE_PASSWORD='SyncPass123!', **kwargs):
+            service = SpeciesSyncService(target_url='http://testserver')
+        prepared = requests.Request('GET', f'http://testserver{path}', auth=service.auth).prepare()
+        return prepared.headers['Authorization']
+
+    def test_service_signed_request_accepted_without_password_hashing(self):
+        """SpeciesSyncService signatures authenticate without running the password hasher."""
+        header = self._signed_header('/api/species-sync/changes/?since=2000-01-01T00:00:00Z')
+        self.assertTrue(header.startswith('SpeciesSync-HMAC '))
+        with self.settings(API_SERVICE_PASSWORD='SyncPass123!'), \
+             patch('django.contrib.auth.hashers.PBKDF2PasswordHasher.verify') as verify:
+            response = self.client.get('/api/species-sync/changes/?since=2000-01-01T00:00:00Z', HTTP_AUTHORIZATION=header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 1)
+        verify.assert_not_called()
+
+    def test_tampered_or_foreign_signatures_rejected(self):
+        """Signatures over another path, with another key or for another account get 401."""
+        header = self._signed_header('/api/species-sync/stats/')
+        with self.settings(API_SERVICE_PASSWORD='SyncPass123!'):
+            other_path = self.client.get('/api/species-sync/manifest/', HTTP_AUTHORIZATION=header)
+            other_account = self.client.get('/api/species-sync/stats/',
+                                            HTTP_AUTHORIZATION=header.replace('api_service@localhost', 'x@example.com'))
+        with self.settings(API_SERVICE_PASSWORD='changed'):
+            other_key = self.client.get('/api/species-sync/stats/', HTTP_AUTHORIZATION=header)
+        for response in (other_path, other_account, other_key):
+            self.assertEqual(response.status_code, 401)
+
+    def test_expired_signature_rejected(self):
+        """Signatures older than API_SIGNATURE_MAX_AGE are refused."""
+        with patch('species.api.authentication.time.time', return_value=time.time() - 600):
+            header = self._signed_header('/api/species-sync/stats/')
+        with self.settings(API_SERVICE_PASSWORD='SyncPass123!'):
+            response = self.client.get('/api/species-sync/stats/', HTTP_AUTHORIZATION=header)
+        self.assertEqual(response.status_code, 401)
+
+    def test_explicit_api_service_key(self):
+        """API_SERVICE_KEY, when set, is used instead of the password-derived key."""
+        header = self._signed_header('/api/species-sync/stats/', API_SERVICE_KEY='shared-secret')
+        with self.settings(API_SERVICE_KEY='shared-secret', API_SERVICE_PASSWORD='unrelated'):
+            response = self.client.get('/api/species-sync/stats/', HTTP_AUTHORIZATION=header)
+        self.assertEqual(response.status_code, 200)
+
+
 class SpeciesSyncServiceTest(MinimalTestCase):
     """Test SpeciesSyncService logic."""
 
@@ -532,6 +865,284 @@ class SpeciesSyncServiceTest(MinimalTestCase):
         local.refresh_from_db()
         self.assertEqual(local.description, 'Updated description on Site2')
 
+    @patch.object(SpeciesSyncService, 'fetch_species')
+    def test_sync_batch_uses_constant_queries(self, mock_fetch):
+        """A page of creates and updates costs a fixed number of queries, not one per species."""
+        for i in range(20):
+            Species.objects.create(name=f'Nothobranchius local{i}', description='Old', global_region='AFR',
+                                   render_cares=True, created_by=self.user)
+        remote = [self._make_remote(f'Nothobranchius local{i}', description='New') for i in range(20)]
+        remote += [self._make_remote(f'Nothobranchius remote{i}') for i in range(20)]
+        mock_fetch.return_value = remote
+        service = SpeciesSyncService()
+        # savepoint, select, bulk update, bulk insert, reload, lastUpdated update, search index delete/select/insert
+        with self.assertNumQueries(10):
+            stats = service.sync(dry_run=False)
+        self.assertEqual((stats['created'], stats['updated'], stats['errors']), (20, 20, 0))
+        self.assertEqual(Species.objects.filter(description='New').count(), 20)
+        self.assertEqual(Species.objects.get(name='Nothobranchius remote3').genus, 'Nothobranchius')
+
+    @patch.object(SpeciesSyncService, 'fetch_species')
+    def test_sync_refreshes_search_index(self, mock_fetch):
+        """Bulk-written species are searchable without a post_save signal."""
+        from species.services.species_search import search_species
+        mock_fetch.return_value = [self._make_remote('Nothobranchius guentheri', alt_name='Zanzibar killifish')]
+        SpeciesSyncService().sync(dry_run=False)
+        self.assertEqual([s.name for s in search_species(Species.objects.all(), 'zanzibar')], ['Nothobranchius guentheri'])
+
+    @patch.object(SpeciesSyncService, 'fetch_species')
+    def test_sync_records_change_log_entries(self, mock_fetch):
+        """Bulk creates and updates are logged like removals, for sites reading this site's feed."""
+        Species.objects.create(name='Nothobranchius rachovii', description='Old', global_region='AFR',
+                               render_cares=True, created_by=self.user)
+        SpeciesChangeLog.objects.all().delete()
+        mock_fetch.return_value = [self._make_remote('Nothobranchius guentheri'),
+                                   self._make_remote('Nothobranchius rachovii', description='New')]
+        with self.captureOnCommitCallbacks(execute=True):
+            SpeciesSyncService().sync(dry_run=False)
+        self.assertEqual(sorted(SpeciesChangeLog.objects.values_list('species_name', 'action', 'render_cares')),
+                         [('Nothobranchius guentheri', 'C', True), ('Nothobranchius rachovii', 'U', True)])
+
+    @patch.object(SpeciesSyncService, 'fetch_species')
+    def test_sync_duplicate_local_names_counted_as_errors(self, mock_fetch):
+        """An ambiguous local name is reported without blocking the rest of the batch."""
+        for _ in range(2):
+            Species.objects.create(name='Nothobranchius guentheri', global_region='AFR', created_by=self.user)
+        mock_fetch.return_value = [self._make_remote('Nothobranchius guentheri'),
+                                   self._make_remote('Nothobranchius rachovii')]
+        stats = SpeciesSyncService().sync(dry_run=False)
+        self.assertEqual((stats['created'], stats['errors']), (1, 1))
+        self.assertTrue(Species.objects.filter(name='Nothobranchius rachovii').exists())
+
+
+class SpeciesSyncStreamingTest(MinimalTestCase):
+    """Test sync streams pages from Site2 while earlier batches are written."""
+
+    def _pages(self, count, per_page=2, fail_at=None):
+        """Fake _fetch_page serving `count` linked pages, recording each request in self.events."""
+        self.events = []
+
+        def fetch_page(url, params=None):
+            number = int(url.rsplit('=', 1)[1]) if 'page=' in url else 1
+            self.events.append(f'fetch {number}')
+            if number == fail_at:
+                raise ConnectionError('Site2 went away')
+            results = [{'name': f'Nothobranchius page{number} n{i}', 'global_region': 'AFR'} for i in range(per_page)]
+            next_url = f'http://site2/api/species-sync/?page={number + 1}' if number < count else None
+            return {'results': results, 'next': next_url}
+        return fetch_page
+
+    def test_batches_written_before_all_pages_fetched(self):
+        """Writes start after the first batch, and fetching stays a bounded number of pages ahead."""
+        service = SpeciesSyncService()
+        original_sync_batch = service._sync_batch
+
+        def sync_batch(batch, stats, dry_run):
+            self.events.append('write')
+            original_sync_batch(batch, stats, dry_run)
+
+        with patch.object(service, '_fetch_page', side_effect=self._pages(6)), \
+             patch.object(service, '_sync_batch', side_effect=sync_batch), \
+             patch('species.services.species_sync.SYNC_BATCH_SIZE', 2):
+            stats = service.sync(dry_run=False)
+        self.assertEqual((stats['fetched'], stats['created'], stats['errors']), (12, 12, 0))
+        self.assertLess(self.events.index('write'), self.events.index('fetch 5'))
+        self.assertEqual(Species.objects.filter(name__startswith='Nothobranchius page').count(), 12)
+
+    def test_fetch_failure_keeps_received_pages(self):
+        """Species from pages received before a fetch error are still synced."""
+        service = SpeciesSyncService()
+        with patch.object(service, '_fetch_page', side_effect=self._pages(4, fail_at=3)):
+            stats = service.sync(dry_run=False)
+        self.assertEqual((stats['fetched'], stats['created'], stats['errors']), (4, 4, 1))
+        self.assertNotIn('fetch 4', self.events)
+
+    def test_fetch_species_follows_pagination(self):
+        """fetch_species yields every record of every page in order."""
+        service = SpeciesSyncService()
+        with patch.object(service, '_fetch_page', side_effect=self._pages(3, per_page=1)):
+            names = [species['name'] for species in service.fetch_species()]
+        self.assertEqual(names, ['Nothobranchius page1 n0', 'Nothobranchius page2 n0', 'Nothobranchius page3 n0'])
+
+
+@patch.object(SpeciesSyncService, 'fetch_species')
+@patch.object(SpeciesSyncService, 'get_stats')
+class SpeciesSyncIncrementalTest(MinimalTestCase):
+    """Test the persisted high-water mark used for incremental syncs."""
+
+    SERVER_TIME = datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+    def test_first_run_is_full_and_records_server_time(self, mock_stats, mock_fetch):
+        """Without a previous sync everything is fetched and Site2's server_time becomes the mark."""
+        mock_stats.return_value = {'server_time': self.SERVER_TIME.isoformat()}
+        mock_fetch.return_value = [{'name': 'Nothobranchius guentheri', 'global_region': 'AFR'}]
+        stats = SpeciesSyncService(target_url='http://site2').sync_incremental()
+        mock_fetch.assert_called_once_with(since=None)
+        self.assertIsNone(stats['since'])
+        state = SpeciesSyncState.objects.get(target_url='http://site2')
+        self.assertEqual(state.synced_until, self.SERVER_TIME)
+        self.assertTrue(state.last_run_succeeded)
+        self.assertEqual(state.last_run_stats['created'], 1)
+        self.assertIsNotNone(state.last_run_duration)
+
+    def test_next_run_fetches_changes_since_mark(self, mock_stats, mock_fetch):
+        """A later run only asks Site2 for species changed since the mark (less a safety overlap)."""
+        SpeciesSyncState.objects.create(target_url='http://site2', synced_until=self.SERVER_TIME)
+        later = self.SERVER_TIME + timedelta(days=1)
+        mock_stats.return_value = {'server_time': later.isoformat()}
+        mock_fetch.return_value = []
+        SpeciesSyncService(target_url='http://site2').sync_incremental()
+        mock_fetch.assert_called_once_with(since=self.SERVER_TIME - SYNC_HIGH_WATER_OVERLAP)
+        self.assertEqual(SpeciesSyncState.objects.get().synced_until, later)
+
+    def test_failed_run_keeps_mark(self, mock_stats, mock_fetch):
+        """Errors leave the mark in place so the next run retries the same window."""
+        SpeciesSyncState.objects.create(target_url='http://site2', synced_until=self.SERVER_TIME)
+        mock_stats.return_value = {'server_time': (self.SERVER_TIME + timedelta(days=1)).isoformat()}
+        mock_fetch.side_effect = Exception('Connection refused')
+        SpeciesSyncService(target_url='http://site2').sync_incremental()
+        state = SpeciesSyncState.objects.get()
+        self.assertEqual(state.synced_until, self.SERVER_TIME)
+        self.assertFalse(state.last_run_succeeded)
+
+    def test_first_run_with_since_sets_no_mark(self, mock_stats, mock_fetch):
+        """An explicit since on a fresh target leaves the mark and sequence unset, so the next run is full."""
+        mock_stats.return_value = {'server_time': self.SERVER_TIME.isoformat(), 'change_sequence': 42}
+        mock_fetch.return_value = []
+        service = SpeciesSyncService(target_url='http://site2')
+        service.sync_incremental(since=self.SERVER_TIME - timedelta(days=7))
+        state = SpeciesSyncState.objects.get()
+        self.assertTrue(state.last_run_succeeded)
+        self.assertIsNone(state.synced_until)
+        self.assertIsNone(state.change_sequence)
+        mock_fetch.reset_mock()
+        service.sync_incremental()
+        mock_fetch.assert_called_once_with(since=None)
+        self.assertEqual(SpeciesSyncState.objects.get().change_sequence, 42)
+
+    def test_dry_run_and_full_flags(self, mock_stats, mock_fetch):
+        """--full ignores the mark; --dry-run leaves the sync state untouched."""
+        SpeciesSyncState.objects.create(target_url='http://localhost:8001', synced_until=self.SERVER_TIME)
+        mock_stats.return_value = {'server_time': (self.SERVER_TIME + timedelta(days=1)).isoformat()}
+        mock_fetch.return_value = []
+        with self.settings(SITE_ID=1, TARGET_API_URL='http://localhost:8001'):
+            call_command('sync_species', '--full', '--dry-run', stdout=StringIO())
+        mock_fetch.assert_called_once_with(since=None)
+        self.assertEqual(SpeciesSyncState.objects.get().synced_until, self.SERVER_TIME)
+
+
+
+class SpeciesSyncBenchmarkTest(MinimalTestCase):
+    """Test the synthetic Site2 server and the sync benchmark command."""
+
+    def setUp(self):
+        self.catalog = SyntheticCatalog(25)
+        self.server = StubSite2Server(self.catalog, page_size=10).start()
+        self.addCleanup(self.server.stop)
+
+    def test_stub_serves_paginated_catalog(self):
+        """The real sync client reads every page, and ?since= skips older records."""
+        service = SpeciesSyncService(target_url=self.server.url)
+        names = [species['name'] for species in service.fetch_species()]
+        self.assertEqual(names, [self.catalog.name(i) for i in range(25)])
+        since = self.catalog.last_updated(20)
+        self.assertEqual(len(list(service.fetch_species(since=since))), 5)
+        self.assertEqual(service.get_stats()['total_cares_species'], 25)
+
+    def test_stub_catalog_syncs_into_site1(self):
+        """Synthetic records pass the sync validation; a new revision updates every species."""
+        service = SpeciesSyncService(target_url=self.server.url)
+        self.assertEqual(service.sync()['created'], 25)
+        self.catalog.revision = 1
+        stats = service.sync()
+        self.assertEqual((stats['updated'], stats['errors']), (25, 0))
+
+    def test_stub_serves_manifest_and_feed(self):
+        """Manifest and change feed sync modes run against the stub too."""
+        service = SpeciesSyncService(target_url=self.server.url)
+        self.assertEqual(service.get_stats()['change_sequence'], 25)
+        self.assertEqual(service.sync_manifest()['created'], 25)
+        self.assertEqual(service.sync_manifest()['skipped'], 25)
+        self.catalog.revision = 1
+        stats = service.sync_changes(25)
+        self.assertEqual((stats['updated'], stats['errors'], stats['sequence']), (25, 0, 50))
+
+    def test_benchmark_modes(self):
+        """Every benchmarked sync mode passes the created/updated checks of each pass."""
+        for mode in ('manifest', 'changes'):
+            with self.subTest(mode=mode):
+                out = StringIO()
+                call_command('benchmark_species_sync', '--species', '30', '--page-size', '10', '--mode', mode,
+                             stdout=out)
+                self.assertIn('Sync benchmark passed', out.getvalue())
+                self.assertFalse(Species.objects.filter(name__startswith=STUB_NAME_PREFIX).exists())
+
+    def test_benchmark_reports_and_cleans_up(self):
+        """The benchmark reports rate, queries and memory per pass and leaves no species behind."""
+        out = StringIO()
+        call_command('benchmark_species_sync', '--species', '30', '--page-size', '10', stdout=out)
+        output = out.getvalue()
+        self.assertIn('Records/s', output)
+        self.assertIn('resync (all changed)', output)
+        self.assertIn('Sync benchmark passed', output)
+        self.assertFalse(Species.objects.filter(name__startswith=STUB_NAME_PREFIX).exists())
+
+    def test_benchmark_thresholds_fail_the_command(self):
+        """Exceeding --max-queries-per-record raises CommandError for CI."""
+        with self.assertRaisesMessage(CommandError, 'queries/record exceeds'):
+            call_command('benchmark_species_sync', '--species', '10', '--max-queries-per-record', '0.01',
+                         stdout=StringIO())
+
+
+
+class SpeciesSyncRunHistoryTest(MinimalTestCase):
+    """Test each sync run is recorded with its metrics and served as JSON."""
+
+    def setUp(self):
+        self.server = StubSite2Server(SyntheticCatalog(25), page_size=10).start()
+        self.addCleanup(self.server.stop)
+        self.service = SpeciesSyncService(target_url=self.server.url)
+
+    def test_run_recorded_with_counts_and_timings(self):
+        """A run stores its stats, pages, bytes and phase timings; the next one replays the change feed."""
+        self.service.sync_incremental()
+        run = SpeciesSyncRun.objects.get()
+        self.assertEqual((run.mode, run.succeeded, run.dry_run), (SpeciesSyncRun.Mode.FULL, True, False))
+        self.assertEqual((run.fetched, run.created, run.errors), (25, 25, 0))
+        self.assertEqual(run.pages, 4)      # stats + 3 species pages
+        self.assertEqual(run.bytes_received, self.server.bytes_sent)
+        self.assertGreater(run.write_seconds, 0)
+        self.assertGreaterEqual(run.duration, run.write_seconds)
+
+        self.service.sync_incremental(dry_run=True)
+        latest = SpeciesSyncRun.objects.first()
+        self.assertEqual((latest.mode, latest.dry_run), (SpeciesSyncRun.Mode.CHANGES, True))
+
+    def test_history_pruned_per_target(self):
+        """Only the newest SYNC_RUN_HISTORY runs are kept."""
+        with patch('species.services.species_sync.SYNC_RUN_HISTORY', 2):
+            for _ in range(3):
+                self.service.sync_incremental(full=True)
+        self.assertEqual(SpeciesSyncRun.objects.count(), 2)
+
+    def test_runs_endpoint(self):
+        """Staff can list runs newest first, filtered by mode; others are refused."""
+        self.service.sync_incremental()
+        self.service.sync_incremental()
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(
+            email='runs@example.com', username='runs_user', password='testpass123', is_staff=True))
+        data = client.get('/api/species-sync-runs/').json()
+        self.assertEqual([run['mode'] for run in data['results']], ['changes', 'full'])
+        self.assertEqual(data['results'][1]['fetched'], 25)
+        self.assertIn('records_per_second', data['results'][1])
+        data = client.get('/api/species-sync-runs/', {'mode': 'full'}).json()
+        self.assertEqual(data['count'], 1)
+
+        client.force_authenticate(user=User.objects.create_user(
+            email='member@example.com', username='member_user', password='testpass123'))
+        self.assertEqual(client.get('/api/species-sync-runs/').status_code, 403)
+
 
 class CreateApiUserCommandTest(MinimalTestCase):
     """Test the create_api_user management command."""
@@ -0,0 +1,138 @@
+"""
+Tests for the DB-backed background job queue (services/background_jobs.py, manage.py run_jobs)
+"""
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from species.models import BackgroundJob, ImportArchive, Species, SpeciesImportStaging, SpeciesReferenceLink, User
+from species.services.background_jobs import claim_next_job, enqueue_job, requeue_stale_jobs, run_pending_jobs
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+REFERENCE_LINK_CSV = (
+    'species,reference_url,name_prefix\n'
+    'Aulonocara jacobfreibergi,https://www.fishbase.se/summary/Aulonocara-jacobfreibergi,FishBase\n'
+    'Unknown species,https://www.fishbase.se/summary/unknown,FishBase\n'
+).encode('utf-8')
+
+STAGING_CSV = (
+    'name,category,global_region\n'
+    'Aulonocara jacobfreibergi,CIC,AFR\n'
+    'Ptychochromis insolitus,CIC,AFR\n'
+).encode('utf-8')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class BackgroundJobTestBase(TestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.admin = User.objects.create_user(email='admin@test.com', username='admin', password='testpass123')
+        self.admin.is_admin = True
+        self.admin.save()
+        Species.objects.create(name='Aulonocara jacobfreibergi', category='CIC', global_region='AFR')
+
+    def make_archive(self, content):
+        return ImportArchive.objects.create(name='import', aquarist=self.admin,
+                                            import_csv_file=SimpleUploadedFile('import.csv', content))
+
+
+class BackgroundJobRunnerTests(BackgroundJobTestBase):
+    """Test queueing, running and retrying background jobs"""
+
+    def test_queued_import_runs_with_progress_and_summary(self):
+        """Test a queued reference link import runs out of band and records progress"""
+        job = enqueue_job(BackgroundJob.JobType.REFERENCE_LINKS, self.make_archive(REFERENCE_LINK_CSV), self.admin)
+        self.assertEqual(job.status, BackgroundJob.JobStatus.PENDING)
+        self.assertEqual(SpeciesReferenceLink.objects.count(), 0)
+
+        self.assertEqual(run_pending_jobs(), 1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.JobStatus.DONE)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual((job.progress_current, job.progress_total), (2, 2))
+        self.assertEqual(job.result_summary, {'success_count': 1, 'error_count': 1})
+        self.assertIsNotNone(job.finished)
+        self.assertEqual(SpeciesReferenceLink.objects.count(), 1)
+        job.import_archive.refresh_from_db()
+        self.assertEqual(job.import_archive.import_status, ImportArchive.ImportStatus.PARTIAL)
+
+    def test_run_jobs_command_processes_queue(self):
+        """Test manage.py run_jobs --once drains the queue"""
+        enqueue_job(BackgroundJob.JobType.SPECIES_STAGING, self.make_archive(STAGING_CSV), self.admin)
+        out = StringIO()
+        call_command('run_jobs', '--once', stdout=out)
+        self.assertIn('Ran 1 background job(s)', out.getvalue())
+        self.assertEqual(SpeciesImportStaging.objects.count(), 2)
+        self.assertFalse(BackgroundJob.objects.exclude(status=BackgroundJob.JobStatus.DONE).exists())
+
+    def test_failed_job_is_retried_with_backoff_then_failed(self):
+        """Test a failing job goes back to the queue until max_attempts, then fails the import archive"""
+        job = enqueue_job(BackgroundJob.JobType.REFERENCE_LINKS, self.make_archive(REFERENCE_LINK_CSV), self.admin)
+        BackgroundJob.objects.filter(pk=job.pk).update(max_attempts=2, requested_by=None)
+
+        run_pending_jobs()
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.JobStatus.PENDING)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn('no longer exists', job.last_error)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIsNone(claim_next_job())        # not runnable until the backoff has passed
+
+        BackgroundJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        run_pending_jobs()
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.JobStatus.FAILED)
+        self.assertEqual(job.attempts, 2)
+        job.import_archive.refresh_from_db()
+        self.assertEqual(job.import_archive.import_status, ImportArchive.ImportStatus.FAIL)
+
+    def test_stale_running_job_is_requeued(self):
+        """Test a RUNNING job whose worker stopped sending heartbeats returns to the queue"""
+        job = enqueue_job(BackgroundJob.JobType.SPECIES_AGGREGATION, self.make_archive(STAGING_CSV), self.admin)
+        long_ago = timezone.now() - timedelta(hours=1)
+        BackgroundJob.objects.filter(pk=job.pk).update(status=BackgroundJob.JobStatus.RUNNING, attempts=1,
+                                                       started=long_ago, heartbeat=long_ago)
+        self.assertEqual(requeue_stale_jobs(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.JobStatus.PENDING)
+        self.assertEqual(job.last_error, 'Worker stopped responding')
+
+
+class BackgroundJobViewTests(BackgroundJobTestBase):
+    """Test import views queue jobs and the job status page"""
+
+    def test_staging_import_view_queues_job(self):
+        """Test uploading a staging csv queues a job instead of importing in the request"""
+        self.client.login(email='admin@test.com', password='testpass123')
+        response = self.client.post(reverse('importSpeciesToStaging'),
+                                    {'import_csv_file': SimpleUploadedFile('species.csv', STAGING_CSV)})
+        job = BackgroundJob.objects.get()
+        self.assertRedirects(response, reverse('backgroundJob', args=[job.id]))
+        self.assertEqual(job.job_type, BackgroundJob.JobType.SPECIES_STAGING)
+        self.assertEqual(job.requested_by, self.admin)
+        self.assertEqual(SpeciesImportStaging.objects.count(), 0)
+
+        run_pending_jobs()
+        response = self.client.get(reverse('backgroundJob', args=[job.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse('reviewSpeciesImport', args=[job.import_archive_id]))
+
+    def test_job_page_restricted_to_requester_and_admins(self):
+        """Test other users cannot view a job"""
+        job = enqueue_job(BackgroundJob.JobType.REFERENCE_LINKS, self.make_archive(REFERENCE_LINK_CSV), self.admin)
+        User.objects.create_user(email='other@test.com', username='other', password='testpass123')
+        self.client.login(email='other@test.com', password='testpass123')
+        response = self.client.get(reverse('backgroundJob', args=[job.id]))
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,138 @@
+"""
+Tests for the bulk CSV import engine in asn_tools/asn_csv_tools.py:
+- import_csv_species
+- import_csv_speciesInstances
+"""
+import csv
+import shutil
+import tempfile
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from species.models import ImportArchive, Species, SpeciesInstance, SpeciesSearchToken, User
+from species.asn_tools.asn_csv_tools import import_csv_species, import_csv_speciesInstances
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+SPECIES_COLUMNS = ['name', 'alt_name', 'common_name', 'description', 'species_image', 'photo_credit', 'category',
+                   'global_region', 'local_distribution', 'cares_family', 'iucn_red_list', 'cares_classification']
+
+INSTANCE_COLUMNS = ['aquarist', 'name', 'species', 'unique_traits', 'genetic_traits', 'collection_point',
+                    'year_acquired', 'aquarist_notes', 'currently_keep']
+
+
+def build_csv(columns, rows):
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({column: row.get(column, '') for column in columns})
+    return buffer.getvalue().encode('utf-8')
+
+
+def read_report(import_archive):
+    with open(import_archive.import_results_file.path, 'r', encoding='utf-8') as report_file:
+        return list(csv.reader(report_file))
+
+
+def species_row(name, **kwargs):
+    row = {'name': name, 'category': 'CIC', 'global_region': 'AFR', 'cares_family': 'UDF',
+           'iucn_red_list': 'UN', 'cares_classification': 'NOTC'}
+    row.update(kwargs)
+    return row
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class CsvImportTestBase(TestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='importer@test.com', username='importer', password='testpass123')
+
+    def make_archive(self, content):
+        return ImportArchive.objects.create(name='import', aquarist=self.user,
+                                            import_csv_file=SimpleUploadedFile('import.csv', content))
+
+
+class SpeciesCsvImportTest(CsvImportTestBase):
+    """Tests for import_csv_species"""
+
+    def test_new_species_imported_and_duplicates_reported(self):
+        """Test new rows are created while existing and repeated names are rejected"""
+        Species.objects.create(name='Aulonocara jacobfreibergi', category='CIC', global_region='AFR')
+        archive = self.make_archive(build_csv(SPECIES_COLUMNS, [
+            species_row('Aulonocara jacobfreibergi'),
+            species_row('Ptychochromis insolitus', cares_classification='CCR', cares_family='MACIC'),
+            species_row('Melanotaenia boesemani', category='RBF', global_region='AUS'),
+            species_row('Melanotaenia boesemani', category='RBF', global_region='AUS'),
+            species_row('Bad Category', category='XXX'),
+        ]))
+        import_csv_species(archive, self.user)
+
+        self.assertEqual(Species.objects.count(), 3)
+        self.assertTrue(Species.objects.get(name='Ptychochromis insolitus').render_cares)
+        self.assertEqual(Species.objects.get(name='Melanotaenia boesemani').genus, 'Melanotaenia')
+        self.assertTrue(SpeciesSearchToken.objects.filter(token='ptychochromis').exists())
+
+        archive.refresh_from_db()
+        self.assertEqual(archive.import_status, ImportArchive.ImportStatus.PARTIAL)
+        report = read_report(archive)
+        self.assertEqual(report[0], ['Species', 'Import_Status'])
+        statuses = [row[1].split(':')[0] for row in report[1:]]
+        self.assertEqual(statuses, ['ERROR', 'Validated', 'Validated', 'ERROR', 'ERROR'])
+
+    def test_all_rows_imported_is_full_import(self):
+        """Test import status is FULL when every row is added"""
+        archive = self.make_archive(build_csv(SPECIES_COLUMNS, [species_row('Betta macrostoma')]))
+        import_csv_species(archive, self.user)
+        archive.refresh_from_db()
+        self.assertEqual(archive.import_status, ImportArchive.ImportStatus.FULL)
+
+
+class SpeciesInstanceCsvImportTest(CsvImportTestBase):
+    """Tests for import_csv_speciesInstances"""
+
+    def test_instances_imported_for_current_user_only(self):
+        """Test rows are matched to species, duplicates and other aquarists' rows are skipped"""
+        species = Species.objects.create(name='Aulonocara jacobfreibergi', category='CIC', global_region='AFR')
+        SpeciesInstance.objects.create(name='Existing', user=self.user, species=species)
+        archive = self.make_archive(build_csv(INSTANCE_COLUMNS, [
+            {'aquarist': 'importer', 'name': 'Existing', 'species': species.name, 'genetic_traits': 'AS'},
+            {'aquarist': 'importer', 'name': 'New Group', 'species': species.name, 'genetic_traits': 'WC',
+             'year_acquired': '2024', 'currently_keep': 'True'},
+            {'aquarist': 'importer', 'name': 'Unknown', 'species': 'Nonexistent species', 'genetic_traits': 'AS'},
+            {'aquarist': 'someone_else', 'name': 'Not Mine', 'species': species.name, 'genetic_traits': 'AS'},
+        ]))
+        import_csv_speciesInstances(archive, self.user)
+
+        self.assertEqual(SpeciesInstance.objects.filter(user=self.user).count(), 2)
+        new_instance = SpeciesInstance.objects.get(name='New Group')
+        self.assertEqual(new_instance.species, species)
+        self.assertEqual(new_instance.genetic_traits, 'WC')
+        species.refresh_from_db()
+        self.assertEqual((species.species_instance_count, species.aquarist_count), (2, 1))   # bulk import refreshes counters
+
+        archive.refresh_from_db()
+        self.assertEqual(archive.import_status, ImportArchive.ImportStatus.PARTIAL)
+        statuses = [row[1].split(':')[0] for row in read_report(archive)[1:]]
+        self.assertEqual(statuses, ['ERROR', 'Validated', 'ERROR', 'IGNORE'])
+
+    def test_species_and_instance_names_match_case_insensitively(self):
+        """Test species names resolve and duplicate instances are caught regardless of case"""
+        species = Species.objects.create(name='Betta splendens', category='ANA', global_region='SEA')
+        SpeciesInstance.objects.create(name='Blue Line', user=self.user, species=species)
+        archive = self.make_archive(build_csv(INSTANCE_COLUMNS, [
+            {'aquarist': 'importer', 'name': 'blue line', 'species': 'betta splendens', 'genetic_traits': 'AS'},
+            {'aquarist': 'importer', 'name': 'Red Line', 'species': 'betta splendens', 'genetic_traits': 'AS'},
+            {'aquarist': 'importer', 'name': 'RED LINE', 'species': 'Betta Splendens', 'genetic_traits': 'AS'},
+        ]))
+        import_csv_speciesInstances(archive, self.user)
+
+        self.assertEqual(SpeciesInstance.objects.get(name='Red Line').species, species)
+        self.assertEqual(SpeciesInstance.objects.filter(user=self.user).count(), 2)
+        statuses = [row[1].split(':')[0] for row in read_report(archive)[1:]]
+        self.assertEqual(statuses, ['ERROR', 'Validated', 'ERROR'])
@@ -0,0 +1,88 @@
+"""
+Tests for the shared outbound HTTP client (services/http_client.py)
+Requests go to a throwaway server on localhost only
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from django.test import SimpleTestCase, override_settings
+from species.services.http_client import JitteredRetry, build_session, get_session
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answers 503 for the first `failures` requests, then 200; records each connection used"""
+    protocol_version = 'HTTP/1.1'       # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        server.connections.add(id(self.connection))
+        status = 503 if server.requests <= server.failures else 200
+        body = b'ok' if status == 200 else b'busy'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@override_settings(HTTP_CLIENT_RETRIES=3, HTTP_CLIENT_BACKOFF=0, HTTP_CLIENT_BACKOFF_JITTER=0)
+class HttpClientTest(SimpleTestCase):
+    """Test pooled sessions retry transient failures and reuse connections"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+        self.server.requests = 0
+        self.server.failures = 0
+        self.server.connections = set()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/'
+
+    def test_transient_errors_retried(self):
+        """Test 503 responses are retried until the server recovers"""
+        self.server.failures = 2
+        with build_session() as session:
+            response = session.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.requests, 3)
+
+    def test_last_response_returned_when_retries_exhausted(self):
+        """Test the final error response is returned, not raised, once retries run out"""
+        self.server.failures = 10
+        with build_session() as session:
+            response = session.get(self.url)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.requests, 4)
+
+    def test_session_without_retries_sends_once(self):
+        """Test retries=False leaves retrying to the caller"""
+        self.server.failures = 10
+        with build_session(retries=False) as session:
+            response = session.get(self.url)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_connection_reused_between_requests(self):
+        """Test sequential requests share one keep-alive connection"""
+        with build_session() as session:
+            for _ in range(3):
+                session.get(self.url)
+        self.assertEqual(self.server.requests, 3)
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_named_sessions_shared(self):
+        """Test each client name maps to one process-wide session"""
+        self.assertIs(get_session('fishbase'), get_session('fishbase'))
+        self.assertIsNot(get_session('fishbase'), get_session('species_sync'))
+
+    def test_backoff_has_bounded_jitter(self):
+        """Test jitter is added on top of the exponential backoff"""
+        retry = JitteredRetry(total=5, backoff_factor=1, backoff_jitter=0.5)
+        for _ in range(3):
+            retry = retry.increment(method='GET', url='/')
+        for _ in range(20):
+            self.assertTrue(4 <= retry.get_backoff_time() <= 4.5)
@@ -6,9 +6,13 @@ Test organization:
 - MinimalTestCase:  Used for basic CRUD tests that need clean database
 - BaseTestCase: Used for complex tests that benefit from pre-loaded data
 """
+from io import StringIO
+from django.core.management import call_command
 from django.test import TestCase
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.utils import IntegrityError
+from django.test.utils import CaptureQueriesContext
 from django.db.models import ProtectedError
 from species.models import (
     User, UserEmail, Species, SpeciesComment, SpeciesReferenceLink,
@@ -268,6 +272,24 @@ class SpeciesModelMethodsTest(BaseTestCase):
         )
         self.assertEqual(species.genus_name, 'Melanochromis')
     
+    def test_genus_key_set_on_save(self):
+        """Test genus column is derived from the name on create and rename"""
+        self.assertEqual(self.cichlid.genus, 'Aulonocara')
+        self.cichlid.name = 'Copadichromis borleyi'
+        self.cichlid.save()
+        self.assertEqual(Species.objects.get(pk=self.cichlid.pk).genus, 'Copadichromis')
+    
+    def test_genus_key_set_on_bulk_operations(self):
+        """Test genus column is kept in sync by bulk_create, bulk_update and update"""
+        created = Species.objects.bulk_create([Species(name='Betta macrostoma'), Species(name='Betta albimarginata')])
+        self.assertEqual(Species.objects.filter(genus='Betta').count(), 2)
+        created[0].name = 'Parosphromenus deissneri'
+        Species.objects.bulk_update(created[:1], ['name'])
+        self.assertEqual(Species.objects.filter(genus='Parosphromenus').count(), 1)
+        Species.objects.filter(name='Betta albimarginata').update(name='Xenotoca eiseni')
+        self.assertEqual(Species.objects.filter(genus='Xenotoca').count(), 1)
+        self.assertEqual(Species.objects.filter(genus='Betta').count(), 0)
+    
     def test_species_str_method(self):
         """Test __str__ method"""
         self.assertEqual(str(self.cichlid), 'Aulonocara jacobfreibergi')
@@ -444,6 +466,78 @@ class SpeciesInstanceModelCRUDTest(BaseTestCase):
         self.assertEqual(instances[0].name, 'Third')
 
 
+
+class SpeciesInstanceCountersTest(BaseTestCase):
+    """Test the SpeciesInstance counters cached on Species"""
+
+    def counters(self, species):
+        species.refresh_from_db()
+        return (species.species_instance_count, species.aquarist_count,
+                species.currently_kept_count, species.spawned_count)
+
+    def test_counters_follow_create_update_and_delete(self):
+        """Test counts move with each instance and count aquarists once"""
+        first = SpeciesInstance.objects.create(name='Colony A', user=self.basic_user, species=self.cichlid)
+        second = SpeciesInstance.objects.create(name='Colony B', user=self.basic_user, species=self.cichlid,
+                                                currently_keep=False)
+        SpeciesInstance.objects.create(name='Colony C', user=self.active_user, species=self.cichlid)
+        self.assertEqual(self.counters(self.cichlid), (3, 2, 2, 0))
+
+        second.have_spawned = True
+        second.save()
+        self.assertEqual(self.counters(self.cichlid), (3, 2, 2, 1))
+
+        first.delete()
+        self.assertEqual(self.counters(self.cichlid), (2, 2, 1, 1))
+        second.delete()
+        self.assertEqual(self.counters(self.cichlid), (1, 1, 1, 0))
+
+    def test_counters_follow_reassignment(self):
+        """Test reassigning an instance to another species moves its counts"""
+        instance = SpeciesInstance.objects.create(name='Colony', user=self.basic_user, species=self.cichlid,
+                                                  have_spawned=True)
+        instance.species = self.killifish
+        instance.save()
+        self.assertEqual(self.counters(self.cichlid), (0, 0, 0, 0))
+        self.assertEqual(self.counters(self.killifish), (1, 1, 1, 1))
+
+    def test_species_save_keeps_counters(self):
+        """Test saving a stale Species copy does not overwrite the counters"""
+        stale = Species.objects.get(pk=self.cichlid.pk)
+        SpeciesInstance.objects.create(name='Colony', user=self.basic_user, species=self.cichlid)
+        stale.description = 'Edited'
+        stale.save()
+        self.assertEqual(self.counters(self.cichlid), (1, 1, 1, 0))
+        self.assertEqual(self.cichlid.description, 'Edited')
+
+    def test_species_save_does_not_write_counters(self):
+        """Test a Species save is one UPDATE leaving the counter columns to the F() updates"""
+        stale = Species.objects.get(pk=self.cichlid.pk)
+        with CaptureQueriesContext(connection) as queries:
+            stale.save()
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('species_instance_count', updates[0])
+
+    def test_species_save_reinserts_deleted_row(self):
+        """Test saving a loaded Species whose row was deleted inserts it again"""
+        species = Species.objects.create(name='Reinserted species', created_by=self.basic_user)
+        Species.objects.filter(pk=species.pk).delete()
+        species.save()
+        self.assertTrue(Species.objects.filter(pk=species.pk, name='Reinserted species').exists())
+
+    def test_rebuild_command_repairs_drift(self):
+        """Test rebuild_species_counts recomputes drifted counters"""
+        SpeciesInstance.objects.create(name='Colony', user=self.basic_user, species=self.cichlid)
+        Species.objects.filter(pk=self.cichlid.pk).update(species_instance_count=7, aquarist_count=0)
+        Species.objects.filter(pk=self.killifish.pk).update(spawned_count=3)
+        out = StringIO()
+        call_command('rebuild_species_counts', stdout=out)
+        self.assertIn('2 corrected', out.getvalue())
+        self.assertEqual(self.counters(self.cichlid), (1, 1, 1, 0))
+        self.assertEqual(self.counters(self.killifish), (0, 0, 0, 0))
+
+
 class SpeciesCommentModelTest(BaseTestCase):
     """Test SpeciesComment model"""
     
@@ -811,6 +905,15 @@ class BapSpeciesModelTest(BaseTestCase):
         self.assertEqual(bap_species.points, 25)
         self.assertEqual(bap_species.species, self.cichlid)
     
+    def test_bap_species_genus_key(self):
+        """Test BAP species genus column is derived from the name"""
+        bap_species = BapSpecies.objects.create(
+            name='Aulonocara jacobfreibergi',
+            species=self.cichlid,
+            club=self.basic_club
+        )
+        self.assertEqual(bap_species.genus, 'Aulonocara')
+    
     def test_bap_species_cascade_on_species_delete(self):
         """Test BAP species is deleted when species is deleted"""
         temp_species = Species.objects.create(
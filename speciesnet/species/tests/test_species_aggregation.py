@@ -0,0 +1,340 @@
+"""
+Tests for the FishBase species data aggregation tool (asn_tools/asn_species_aggregation.py)
+Network access is patched out - no requests are sent to fishbase.se
+"""
+import contextlib
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from io import StringIO
+from unittest.mock import patch
+import requests
+from django.core.management import call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from species.models import ImportArchive, SpeciesAggregationResult, User
+from species.asn_tools import asn_species_aggregation
+from species.asn_tools.asn_http_cache import HttpCache
+from species.asn_tools.asn_species_aggregation import (FishBaseUnavailable, TokenBucket, collect_species_data,
+                                                       enrich_species_row, extract_fishbase_fields, fetch_fishbase_page,
+                                                       make_fishbase_soup)
+
+MEDIA_ROOT = tempfile.mkdtemp()
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), 'fishbase_corpus')
+
+
+class TokenBucketTest(SimpleTestCase):
+    """Test the per-host request rate limiter"""
+
+    def test_acquire_is_limited_to_rate_across_threads(self):
+        """Test concurrent callers together never exceed the bucket rate"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # first token is available immediately, the other five arrive at 50 per second
+        self.assertGreaterEqual(time.monotonic() - start, 5 / 50 * 0.9)
+
+    def test_rate_limiter_shared_per_host(self):
+        """Test urls on the same host share one limiter"""
+        first = asn_species_aggregation.get_rate_limiter('https://www.fishbase.se/summary/A-b')
+        second = asn_species_aggregation.get_rate_limiter('https://www.fishbase.se/summary/C-d')
+        other = asn_species_aggregation.get_rate_limiter('https://example.com/')
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+
+@override_settings(HTTP_CLIENT_RETRIES=3, HTTP_CLIENT_BACKOFF=0, HTTP_CLIENT_BACKOFF_JITTER=0)
+class FishBaseGetTest(SimpleTestCase):
+    """Test fishbase_get retries itself, taking a rate limiter token for every attempt"""
+
+    def setUp(self):
+        self.acquired = 0
+
+        class CountingLimiter:
+            def acquire(limiter):
+                self.acquired += 1
+        patcher = patch.object(asn_species_aggregation, 'get_rate_limiter', return_value=CountingLimiter())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_each_retry_takes_a_token(self):
+        """Test a 429 and a connection error are retried, each attempt throttled"""
+        url = 'https://www.fishbase.se/summary/Betta-splendens'
+        responses = [FakeResponse(url, '', 429, {'Retry-After': '0'}), requests.ConnectionError('reset'),
+                     FakeResponse(url, SPECIES_PAGE_HTML)]
+        with patch.object(asn_species_aggregation, 'get_session') as get_session:
+            get_session.return_value.get.side_effect = responses
+            response = asn_species_aggregation.fishbase_get(url, timeout=15)
+        get_session.assert_called_with('fishbase', retries=False)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.acquired, 3)
+
+    def test_last_response_returned_when_retries_exhausted(self):
+        """Test the final error response is returned once HTTP_CLIENT_RETRIES are used up"""
+        url = 'https://www.fishbase.se/summary/Betta-splendens'
+        with patch.object(asn_species_aggregation, 'get_session') as get_session:
+            get_session.return_value.get.return_value = FakeResponse(url, '', 503)
+            response = asn_species_aggregation.fishbase_get(url)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.acquired, 4)
+
+
+class FakeResponse:
+
+    def __init__(self, url, html, status_code=200, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.text = html
+        self.content = html.encode('utf-8')
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+SPECIES_PAGE_HTML = """<html><body>
+<h1>Betta splendens</h1>
+<table><tr><td><b>Distribution</b></td><td>Asia: Mekong basin in Thailand, Cambodia and Laos.</td></tr></table>
+</body></html>"""
+
+
+@override_settings(FISHBASE_CACHE_DIR='')
+class EnrichSpeciesRowTest(SimpleTestCase):
+    """Test each species page is downloaded once per enrichment"""
+
+    def test_species_page_fetched_once(self):
+        """Test the page fetched to validate the species is the one parsed"""
+        url = 'https://www.fishbase.se/summary/Betta-splendens'
+        with patch.object(asn_species_aggregation, 'fishbase_get',
+                          return_value=FakeResponse(url, SPECIES_PAGE_HTML)) as fishbase_get:
+            enriched, error = enrich_species_row({'Family': 'Osphronemidae', 'Species': 'Betta splendens'})
+        self.assertIsNone(error)
+        self.assertEqual(fishbase_get.call_count, 1)
+        self.assertEqual(enriched['FishBase URL'], url)
+        self.assertIn('Mekong', enriched['Distribution'])
+
+    def test_missing_species_not_parsed(self):
+        """Test a 404 page reports no data without a second request"""
+        with patch.object(asn_species_aggregation, 'fishbase_get',
+                          return_value=FakeResponse('https://www.fishbase.se/summary/Betta-nova', '', 404)) as fishbase_get:
+            enriched, error = enrich_species_row({'Species': 'Betta nova'})
+        self.assertEqual(error, 'No FishBase data found')
+        self.assertEqual(fishbase_get.call_count, 1)
+
+    def test_server_error_raises_unavailable(self):
+        """Test an unexpected status is raised for retry rather than reported as missing data"""
+        with patch.object(asn_species_aggregation, 'fishbase_get',
+                          return_value=FakeResponse('https://www.fishbase.se/summary/Betta-splendens', '', 503)):
+            with self.assertRaises(FishBaseUnavailable):
+                enrich_species_row({'Species': 'Betta splendens'})
+
+
+FULL_SPECIES_PAGE_HTML = """<html><head><title>Betta splendens, Siamese fighting fish : fisheries, aquarium</title>
+<script>var status = "IUCN Red List Status: Endangered (EN)";</script></head>
+<body><div><span>Territories|FAO areas|Ecosystems|Occurrences|Point map|Faunafri</span></div>
+<table><tr><td><b>Distribution</b></td><td>Asia: Mekong basin in Thailand, Cambodia and Laos. Size / Weight / Age</td></tr></table>
+<div><p>Inhabits standing and sluggish waters (Ref.12345) and feeds on zooplankton.</p></div>
+<p>Population decline due to habitat loss and pollution in the central plain.</p>
+<div><span>IUCN Red List Status (Ref. 130435)</span><span> Vulnerable (VU); Date assessed: 2011</span></div>
+</body></html>"""
+
+
+class FishBaseExtractionTest(SimpleTestCase):
+    """Test the single-pass FishBase page extractor"""
+
+    def test_all_fields_extracted_in_one_pass(self):
+        """Test every field is filled from one walk of the page, ignoring script text"""
+        fields = extract_fishbase_fields(make_fishbase_soup(FULL_SPECIES_PAGE_HTML.encode('utf-8')))
+        self.assertEqual(fields['common_name'], 'Siamese fighting fish : fisheries')
+        self.assertEqual(fields['distribution'], 'Asia: Mekong basin in Thailand, Cambodia and Laos.')
+        self.assertTrue(fields['biology'].startswith('Inhabits standing and sluggish waters and feeds on zooplankton.'))
+        self.assertEqual(fields['conservation_notes'],
+                         'Population decline due to habitat loss and pollution in the central plain.')
+        self.assertEqual(fields['iucn_status'], 'Vulnerable (VU)')
+
+    def test_empty_page_has_no_fields(self):
+        """Test a page without content yields no values"""
+        fields = extract_fishbase_fields(make_fishbase_soup(b'<html><body></body></html>'))
+        self.assertEqual(set(fields.values()), {None})
+
+
+class FishBaseCorpusTest(SimpleTestCase):
+    """Regression test the extractors against the saved FishBase page corpus (offline)"""
+
+    def test_corpus_pages_match_expected(self):
+        """Test every saved page still extracts to its recorded values"""
+        with open(os.path.join(CORPUS_DIR, 'expected.json'), 'r', encoding='utf-8') as expected_file:
+            expected = json.load(expected_file)
+        self.assertTrue(expected)
+        for filename, expected_fields in expected.items():
+            with open(os.path.join(CORPUS_DIR, filename), 'rb') as page_file:
+                content = page_file.read()
+            with contextlib.redirect_stdout(io.StringIO()):
+                fields = asn_species_aggregation.parse_fishbase_data(content)
+            with self.subTest(page=filename):
+                self.assertEqual(fields, expected_fields)
+
+    def test_benchmark_command_reports_throughput_and_accuracy(self):
+        """Test benchmark_fishbase_extraction runs offline over the corpus"""
+        out = StringIO()
+        with patch.object(asn_species_aggregation, 'fishbase_get', side_effect=AssertionError('network used')):
+            call_command('benchmark_fishbase_extraction', '--iterations', '1', stdout=out)
+        output = out.getvalue()
+        self.assertIn('pages/s', output)
+        self.assertIn('extract_iucn_from_fishbase', output)
+        self.assertIn('All fields match for 4 pages', output)
+
+
+class HttpCacheTest(SimpleTestCase):
+    """Test the on-disk FishBase response cache"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def test_put_get_and_expiry(self):
+        """Test entries round trip and expire after their TTL (negative entries sooner)"""
+        cache = HttpCache(self.directory, ttl=100, negative_ttl=10)
+        cache.put('https://www.fishbase.se/summary/A-b', 200, b'<html>page</html>', final_url='https://www.fishbase.se/s/A-b')
+        cache.put('https://www.fishbase.se/summary/C-d', 404, b'', negative=True)
+
+        page = cache.get('https://www.fishbase.se/summary/A-b')
+        self.assertEqual((page.url, page.content, page.negative), ('https://www.fishbase.se/s/A-b', b'<html>page</html>', False))
+        self.assertTrue(cache.get('https://www.fishbase.se/summary/C-d').negative)
+        self.assertIsNone(cache.get('https://www.fishbase.se/summary/E-f'))
+
+        later = time.time() + 50
+        with patch('species.asn_tools.asn_http_cache.time.time', return_value=later):
+            self.assertIsNotNone(cache.get('https://www.fishbase.se/summary/A-b'))
+            self.assertIsNone(cache.get('https://www.fishbase.se/summary/C-d'))
+
+    def test_least_recently_used_entries_evicted(self):
+        """Test the cache stays under its size cap by evicting least recently used entries"""
+        cache = HttpCache(self.directory, max_bytes=3000)
+        for name in ('a', 'b', 'c'):
+            cache.put('https://example.com/' + name, 200, b'x' * 800)
+        old = time.time() - 60
+        for name, age in (('a', 0), ('b', 30), ('c', 10)):
+            meta_path, _ = cache._paths(cache.key('https://example.com/' + name))
+            os.utime(meta_path, (old + age, old + age))
+        cache.get('https://example.com/a')                  # a becomes most recently used
+
+        cache.put('https://example.com/d', 200, b'x' * 800)
+
+        self.assertLessEqual(cache.total_bytes, 3000)
+        self.assertIsNotNone(cache.get('https://example.com/a'))
+        self.assertIsNone(cache.get('https://example.com/c'))
+        self.assertIsNotNone(cache.get('https://example.com/d'))
+
+    def test_fetch_served_from_cache(self):
+        """Test pages and not-found results are fetched from FishBase once"""
+        url = 'https://www.fishbase.se/summary/Betta-splendens'
+        with override_settings(FISHBASE_CACHE_DIR=self.directory), \
+             patch.object(asn_species_aggregation, 'fishbase_get',
+                          side_effect=[FakeResponse(url, SPECIES_PAGE_HTML),
+                                       FakeResponse('https://www.fishbase.se/summary/Betta-nova', '', 404)]) as fishbase_get:
+            first = fetch_fishbase_page('Betta splendens')
+            second = fetch_fishbase_page('Betta splendens')
+            self.assertIsNone(fetch_fishbase_page('Betta nova'))
+            self.assertIsNone(fetch_fishbase_page('Betta nova'))
+        self.assertEqual(first, second)
+        self.assertEqual(fishbase_get.call_count, 2)
+
+
+def fake_enrich_species_row(row):
+    # finish out of order so results must be put back in input order
+    name = row['Species']
+    time.sleep(0.02 if name.startswith('A') else 0)
+    enriched = row.copy()
+    if name.startswith('Bad'):
+        return enriched, 'Invalid binomial format'
+    enriched['FishBase URL'] = 'https://www.fishbase.se/summary/' + name.replace(' ', '-')
+    return enriched, None
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, FISHBASE_MAX_WORKERS=3)
+@patch.object(asn_species_aggregation, 'test_network_connectivity', lambda: None)
+@patch.object(asn_species_aggregation, 'enrich_species_row', fake_enrich_species_row)
+class CollectSpeciesDataTest(TestCase):
+    """Test concurrent enrichment keeps csv order, progress and archive status"""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    NAMES = ['Aulonocara baenschi', 'Betta splendens', 'Bad', 'Aplocheilus lineatus', 'Corydoras panda']
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='admin@test.com', username='admin', password='testpass123')
+
+    def make_archive(self, names):
+        content = 'Family,Species\n' + ''.join(f'Fish,{name}\n' for name in names)
+        return ImportArchive.objects.create(name='aggregate', aquarist=self.user,
+                                            import_csv_file=SimpleUploadedFile('species.csv', content.encode('utf-8')))
+
+    def test_concurrent_collection_preserves_row_order(self):
+        """Test output rows follow the input csv order and progress reaches the total"""
+        names = self.NAMES
+        user = self.user
+        archive = self.make_archive(names)
+        progress_calls = []
+
+        output = collect_species_data(archive, user, progress=lambda done, total: progress_calls.append((done, total)))
+
+        rows = list(csv.DictReader(StringIO(output)))
+        self.assertEqual([row['Species'] for row in rows], names)
+        self.assertEqual(rows[2]['FishBase URL'], '')
+        self.assertEqual(progress_calls[-1], (5, 5))
+        self.assertEqual(len(progress_calls), 5)
+        archive.refresh_from_db()
+        self.assertEqual(archive.import_status, ImportArchive.ImportStatus.PARTIAL)
+        self.assertEqual(SpeciesAggregationResult.objects.filter(import_archive=archive).count(), 5)
+
+    def test_rerun_resumes_from_checkpoint(self):
+        """Test unavailable species are not checkpointed and a rerun only fetches those"""
+        archive = self.make_archive(self.NAMES)
+
+        def flaky_enrich(row):
+            if row['Species'] == 'Betta splendens':
+                raise FishBaseUnavailable('HTTP 503')
+            return fake_enrich_species_row(row)
+
+        with patch.object(asn_species_aggregation, 'enrich_species_row', side_effect=flaky_enrich):
+            with self.assertRaises(FishBaseUnavailable):
+                collect_species_data(archive, self.user, raise_on_unavailable=True)
+        saved = SpeciesAggregationResult.objects.filter(import_archive=archive)
+        self.assertEqual(sorted(saved.values_list('row_number', flat=True)), [1, 3, 4, 5])
+        self.assertEqual(saved.get(row_number=3).error_reason, 'Invalid binomial format')
+
+        progress_calls = []
+        with patch.object(asn_species_aggregation, 'enrich_species_row',
+                          side_effect=fake_enrich_species_row) as enrich:
+            output = collect_species_data(archive, self.user,
+                                          progress=lambda done, total: progress_calls.append((done, total)))
+        self.assertEqual([call.args[0]['Species'] for call in enrich.call_args_list], ['Betta splendens'])
+        self.assertEqual(progress_calls, [(4, 5), (5, 5)])
+        rows = list(csv.DictReader(StringIO(output)))
+        self.assertEqual([row['Species'] for row in rows], self.NAMES)
+        self.assertEqual(rows[0]['FishBase URL'], 'https://www.fishbase.se/summary/Aulonocara-baenschi')
+        self.assertEqual(rows[2]['FishBase URL'], '')
+
+    def test_unavailable_species_reported_on_last_attempt(self):
+        """Test without raise_on_unavailable the run completes and reports the species as needing research"""
+        archive = self.make_archive(['Betta splendens'])
+        with patch.object(asn_species_aggregation, 'enrich_species_row', side_effect=FishBaseUnavailable('timeout')):
+            collect_species_data(archive, self.user)
+        archive.refresh_from_db()
+        with archive.import_results_file.open('r') as report:
+            self.assertIn('FishBase unavailable: timeout', report.read())
+        self.assertEqual(archive.import_status, ImportArchive.ImportStatus.FAIL)
+        self.assertFalse(SpeciesAggregationResult.objects.exists())
@@ -0,0 +1,132 @@
+from io import StringIO
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.core.management import call_command
+from species.models import Species, SpeciesSearchToken
+from species.services.species_search import search_species, tokenize, build_search_tokens
+
+
+@override_settings(SPECIES_SEARCH_USE_FULLTEXT=False)
+class SpeciesSearchIndexTest(TestCase):
+    """Tests for the species search token index and ranking"""
+
+    def setUp(self):
+        self.auratus = Species.objects.create(
+            name='Melanochromis auratus',
+            common_name='Golden Mbuna',
+            local_distribution='Lake Malawi',
+            description='Aggressive mbuna from rocky shorelines.',
+            category='CIC',
+            global_region='AFR',
+        )
+        self.boesemani = Species.objects.create(
+            name='Melanotaenia boesemani',
+            common_name="Boeseman's Rainbowfish",
+            local_distribution='Ayamaru Lakes, West Papua',
+            description='Often kept alongside auratus in community tanks.',
+            category='RBF',
+            global_region='AUS',
+        )
+        self.insolitus = Species.objects.create(
+            name='Ptychochromis insolitus',
+            local_distribution='Mangarahara River, Madagascar',
+            category='CIC',
+            global_region='AFR',
+            render_cares=True,
+        )
+
+    def test_tokenize_splits_and_lowercases(self):
+        """Test tokenize drops punctuation and lowercases words"""
+        self.assertEqual(tokenize("Boeseman's Rainbowfish (sp. 'Ayamaru')"),
+                         ['boeseman', 's', 'rainbowfish', 'sp', 'ayamaru'])
+        self.assertEqual(tokenize(''), [])
+
+    def test_build_search_tokens_sums_field_weights(self):
+        """Test a token found in several fields accumulates each field's weight"""
+        tokens = build_search_tokens({'name': 'Aulonocara baenschi', 'description': 'baenschi peacock'})
+        self.assertEqual(tokens['baenschi'], 11)
+        self.assertEqual(tokens['peacock'], 1)
+
+    def test_tokens_created_on_save(self):
+        """Test saving a species populates its search tokens"""
+        tokens = set(SpeciesSearchToken.objects.filter(species=self.auratus).values_list('token', flat=True))
+        self.assertIn('melanochromis', tokens)
+        self.assertIn('malawi', tokens)
+
+    def test_tokens_refreshed_on_update(self):
+        """Test editing a species replaces its old tokens"""
+        self.auratus.common_name = 'Auratus Cichlid'
+        self.auratus.save()
+        tokens = set(SpeciesSearchToken.objects.filter(species=self.auratus).values_list('token', flat=True))
+        self.assertIn('cichlid', tokens)
+        self.assertNotIn('golden', tokens)
+
+    def test_tokens_deleted_with_species(self):
+        """Test deleting a species removes its tokens"""
+        pk = self.insolitus.pk
+        self.insolitus.delete()
+        self.assertFalse(SpeciesSearchToken.objects.filter(species_id=pk).exists())
+
+    def test_prefix_match(self):
+        """Test a partial word matches the start of an indexed word"""
+        results = list(search_species(Species.objects.all(), 'melano'))
+        self.assertEqual(set(results), {self.auratus, self.boesemani})
+
+    def test_all_terms_required(self):
+        """Test every query word must match"""
+        results = list(search_species(Species.objects.all(), 'lake malawi'))
+        self.assertEqual(results, [self.auratus])
+
+    def test_name_match_ranks_above_description_match(self):
+        """Test a name match outranks a description match"""
+        results = list(search_species(Species.objects.all(), 'auratus'))
+        self.assertEqual(results, [self.auratus, self.boesemani])
+
+    def test_name_substring_fallback_when_index_finds_nothing(self):
+        """Test a query inside a name word matches only when no indexed word starts with it"""
+        fridmani = Species.objects.create(name='Pseudochromis fridmani', category='OTH', global_region='OTH')
+        results = list(search_species(Species.objects.all(), 'chromis'))
+        self.assertEqual(results, [self.auratus, fridmani, self.insolitus])
+        self.assertEqual([species.search_rank for species in results], [0, 0, 0])
+        viridis = Species.objects.create(name='Chromis viridis', category='OTH', global_region='OTH')
+        self.assertEqual(list(search_species(Species.objects.all(), 'chromis')), [viridis])
+
+    def test_punctuation_only_query_returns_nothing(self):
+        """Test a query with no searchable words returns no species"""
+        self.assertEqual(search_species(Species.objects.all(), '?!').count(), 0)
+
+    def test_rebuild_search_index_command(self):
+        """Test rebuild_search_index restores tokens"""
+        SpeciesSearchToken.objects.all().delete()
+        call_command('rebuild_search_index', stdout=StringIO())
+        results = list(search_species(Species.objects.all(), 'madagascar'))
+        self.assertEqual(results, [self.insolitus])
+
+
+@override_settings(SPECIES_SEARCH_USE_FULLTEXT=False)
+class SpeciesSearchViewTest(TestCase):
+    """Tests for the speciesSearch and caresSpeciesSearch list views"""
+
+    def setUp(self):
+        self.client = Client()
+        self.cichlid = Species.objects.create(name='Aulonocara jacobfreibergi', category='CIC', global_region='AFR')
+        self.cares = Species.objects.create(name='Ptychochromis insolitus', category='CIC', global_region='AFR',
+                                            cares_family='MACIC', render_cares=True)
+
+    def test_species_search_query(self):
+        """Test speciesSearch filters by query text"""
+        response = self.client.get(reverse('speciesSearch'), {'q': 'aulono'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['species_list']), [self.cichlid])
+
+    def test_species_search_query_with_category(self):
+        """Test speciesSearch combines query text and category filter"""
+        response = self.client.get(reverse('speciesSearch'), {'q': 'aulono', 'category': 'RBF'})
+        self.assertEqual(list(response.context['species_list']), [])
+
+    def test_cares_species_search_only_returns_cares_species(self):
+        """Test caresSpeciesSearch search stays restricted to CARES species"""
+        Species.objects.create(name='Ptychochromis oligacanthus', category='CIC', global_region='AFR')
+        response = self.client.get(reverse('caresSpeciesSearch'), {'q': 'ptychochromis'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['species_list']), [self.cares])
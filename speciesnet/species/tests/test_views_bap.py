@@ -3,13 +3,16 @@ Tests for BAP (Breeder Award Program) views:
 - BapSubmission (create, edit, delete)
 - BapGenus (edit, delete) - create is automated
 - BapSpecies (create, edit, delete)
+- BapLeaderboard (incremental maintenance, rebuild)
 """
+from io import StringIO
+from django.core.management import call_command
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from species.models import (
     AquaristClub, AquaristClubMember, Species, SpeciesInstance,
-    BapSubmission, BapGenus, BapSpecies
+    BapSubmission, BapGenus, BapSpecies, BapLeaderboard
 )
 
 User = get_user_model()
@@ -458,6 +461,22 @@ class BapSubmissionDeleteViewTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertFalse(BapSubmission.objects.filter(id=submission_id).exists())
 
+    def test_export_bap_submissions_streams_club_rows(self):
+        """Test that club admins can export the club's BAP submissions as streamed CSV"""
+        self.client.login(email='clubadmin@test.com', password='testpass123')
+        response = self.client.get(reverse('exportBapSubmissions', args=[self.club.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith('Test Submission,aquarist,'))
+
+    def test_export_bap_submissions_other_aquarist_denied(self):
+        """Test that non-admins cannot export BAP submissions"""
+        self.client.login(email='other@test.com', password='testpass123')
+        response = self.client.get(reverse('exportBapSubmissions', args=[self.club.id]))
+        self.assertEqual(response.status_code, 403)
+
     def test_delete_bap_submission_staff_can_delete(self):
         """Test that staff user can delete submissions"""
         self.client.login(email='staff@test.com', password='testpass123')
@@ -996,3 +1015,176 @@ class BapSpeciesDeleteViewTests(TestCase):
         
         self.assertEqual(response.status_code, 302)
         self.assertFalse(BapSpecies.objects.filter(id=species_id).exists())
+
+
+class BapLeaderboardTests(TestCase):
+    """Test suite for the incrementally maintained BapLeaderboard"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = Client()
+        self.aquarist = User.objects.create_user(
+            email='aquarist@test.com',
+            username='aquarist',
+            password='testpass123'
+        )
+        self.club = AquaristClub.objects.create(
+            name='Test BAP Club',
+            acronym='TBC',
+            city='Test City',
+            website='https://test-club.com'
+        )
+        AquaristClubMember.objects.create(
+            name='TBC: aquarist',
+            user=self.aquarist,
+            club=self.club,
+            membership_approved=True,
+            bap_participant=True
+        )
+        self.species = Species.objects.create(name='Aulonocara jacobfreibergi', category='CIC', global_region='AFR')
+        self.cares_species = Species.objects.create(name='Ptychochromis insolitus', category='CIC',
+                                                    global_region='AFR', render_cares=True)
+        self.instance = SpeciesInstance.objects.create(name='Aulonocara jacobfreibergi', user=self.aquarist,
+                                                       species=self.species)
+        self.cares_instance = SpeciesInstance.objects.create(name='Ptychochromis insolitus', user=self.aquarist,
+                                                             species=self.cares_species)
+        self.submission = BapSubmission.objects.create(
+            name='Submission 1',
+            aquarist=self.aquarist,
+            club=self.club,
+            speciesInstance=self.instance,
+            points=10
+        )
+        self.cares_submission = BapSubmission.objects.create(
+            name='Submission 2',
+            aquarist=self.aquarist,
+            club=self.club,
+            speciesInstance=self.cares_instance,
+            points=20
+        )
+
+    def approve(self, submission):
+        submission.status = BapSubmission.BapSubmissionStatus.APPROVED
+        submission.save()
+
+    def get_entry(self):
+        return BapLeaderboard.objects.get(club=self.club, year=2025, aquarist=self.aquarist)
+
+    def test_open_submissions_not_on_leaderboard(self):
+        """Test that only approved submissions create leaderboard entries"""
+        self.assertFalse(BapLeaderboard.objects.filter(club=self.club).exists())
+
+    def test_approving_submissions_updates_entry(self):
+        """Test that approved submissions are added to the aquarist entry"""
+        self.approve(self.submission)
+        self.approve(self.cares_submission)
+        entry = self.get_entry()
+        self.assertEqual(entry.species_count, 2)
+        self.assertEqual(entry.cares_species_count, 1)
+        self.assertEqual(entry.points, 30)
+        self.assertEqual(entry.name, '2025 - Test BAP Club - aquarist')
+
+    def test_editing_points_updates_entry(self):
+        """Test that editing an approved submission applies the points difference"""
+        self.approve(self.submission)
+        self.submission.points = 25
+        self.submission.save()
+        self.assertEqual(self.get_entry().points, 25)
+        self.assertEqual(self.get_entry().species_count, 1)
+
+    def test_declining_and_deleting_remove_entry(self):
+        """Test that un-approving or deleting submissions removes their contribution"""
+        self.approve(self.submission)
+        self.approve(self.cares_submission)
+        self.submission.status = BapSubmission.BapSubmissionStatus.DECLINED
+        self.submission.save()
+        self.assertEqual(self.get_entry().points, 20)
+        self.cares_submission.delete()
+        self.assertFalse(BapLeaderboard.objects.filter(club=self.club).exists())
+
+    def test_cares_count_follows_current_render_cares(self):
+        """Test that a change recomputes the CARES count from the species' current flag"""
+        self.approve(self.submission)
+        self.approve(self.cares_submission)
+        Species.objects.filter(pk=self.cares_species.pk).update(render_cares=False)
+        self.cares_submission.status = BapSubmission.BapSubmissionStatus.DECLINED
+        self.cares_submission.save()
+        self.assertEqual(self.get_entry().cares_species_count, 0)
+        Species.objects.filter(pk=self.species.pk).update(render_cares=True)
+        self.submission.points = 15
+        self.submission.save()
+        entry = self.get_entry()
+        self.assertEqual((entry.species_count, entry.cares_species_count, entry.points), (1, 1, 15))
+
+    def test_rebuild_command_matches_incremental_entries(self):
+        """Test that rebuild_bap_leaderboard recreates the same totals"""
+        self.approve(self.submission)
+        self.approve(self.cares_submission)
+        BapLeaderboard.objects.all().update(points=0, species_count=0, cares_species_count=0)
+        call_command('rebuild_bap_leaderboard', stdout=StringIO())
+        entry = self.get_entry()
+        self.assertEqual((entry.species_count, entry.cares_species_count, entry.points), (2, 1, 30))
+
+    def test_leaderboard_view_lists_entries(self):
+        """Test that the leaderboard view reads the maintained entries"""
+        self.approve(self.submission)
+        self.client.login(email='aquarist@test.com', password='testpass123')
+        response = self.client.get(reverse('bapLeaderboard', args=[self.club.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['bap_leaderboard']), [self.get_entry()])
+
+
+class BapGenusInitializationTests(TestCase):
+    """Test suite for building and updating a club's BapGenus list"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = Client()
+        self.club_admin = User.objects.create_user(
+            email='clubadmin@test.com',
+            username='clubadmin',
+            password='testpass123'
+        )
+        self.club = AquaristClub.objects.create(
+            name='Test BAP Club',
+            acronym='TBC',
+            city='Test City',
+            website='https://test-club.com',
+            bap_default_points=15
+        )
+        AquaristClubMember.objects.create(
+            name='TBC: clubadmin',
+            user=self.club_admin,
+            club=self.club,
+            membership_approved=True,
+            is_club_admin=True
+        )
+        Species.objects.create(name='Aulonocara jacobfreibergi', category='CIC', global_region='AFR')
+        Species.objects.create(name='Aulonocara baenschi', category='CIC', global_region='AFR')
+        Species.objects.create(name='Aphyosemion australe', category='KLF', global_region='AFR')
+        Species.objects.create(name='Unnamed', category='OTH', global_region='OTH')
+
+    def test_initial_list_built_on_first_view(self):
+        """Test that viewing the genus list builds one entry per genus with species counts"""
+        self.client.login(email='clubadmin@test.com', password='testpass123')
+        response = self.client.get(reverse('bapGenus', args=[self.club.id]))
+        self.assertEqual(response.status_code, 200)
+        genus_counts = dict(BapGenus.objects.filter(club=self.club).values_list('name', 'species_count'))
+        self.assertEqual(genus_counts, {'Aulonocara': 2, 'Aphyosemion': 1})
+        self.assertTrue(all(bg.points == 15 for bg in BapGenus.objects.filter(club=self.club)))
+
+    def test_update_adds_new_genera_and_keeps_points(self):
+        """Test that the update action adds new genera, refreshes counts and keeps configured points"""
+        self.client.login(email='clubadmin@test.com', password='testpass123')
+        self.client.get(reverse('bapGenus', args=[self.club.id]))
+        BapGenus.objects.filter(club=self.club, name='Aulonocara').update(points=40)
+        Species.objects.create(name='Aulonocara stuartgranti', category='CIC', global_region='AFR')
+        Species.objects.create(name='Melanotaenia boesemani', category='RBF', global_region='AUS')
+
+        response = self.client.post(reverse('bapGenus', args=[self.club.id]))
+        self.assertEqual(response.status_code, 302)
+        aulonocara = BapGenus.objects.get(club=self.club, name='Aulonocara')
+        self.assertEqual(aulonocara.points, 40)
+        self.assertEqual(aulonocara.species_count, 3)
+        self.assertTrue(BapGenus.objects.filter(club=self.club, name='Melanotaenia').exists())
+        self.assertEqual(BapGenus.objects.filter(club=self.club).count(), 3)
@@ -5,6 +5,7 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from species.models import AquaristClub, AquaristClubMember
+from species.asn_tools.asn_utils import user_can_edit_club, user_is_club_member, user_is_pending_club_member
 
 User = get_user_model()
 
@@ -808,4 +809,47 @@ class ClubPermissionEdgeCaseTests(TestCase):
         # Cannot edit other club
         url_other = reverse('editAquaristClub', args=[self.club_b.id])
         response_other = self.client.get(url_other)
-        self.assertEqual(response_other.status_code, 403)
\ No newline at end of file
+        self.assertEqual(response_other.status_code, 403)
+
+class ClubMembershipCacheTests(TestCase):
+    """Test suite for the per-request club membership cache used by permission helpers"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            email='member@test.com',
+            username='member',
+            password='testpass123'
+        )
+        self.club = AquaristClub.objects.create(name='Admin Club', acronym='ADM')
+        self.pending_club = AquaristClub.objects.create(name='Pending Club', acronym='PND')
+        self.other_club = AquaristClub.objects.create(name='Other Club', acronym='OTH')
+        AquaristClubMember.objects.create(name='ADM: member', user=self.user, club=self.club,
+                                          membership_approved=True, is_club_admin=True)
+        AquaristClubMember.objects.create(name='PND: member', user=self.user, club=self.pending_club,
+                                          membership_approved=False)
+
+    def test_helpers_share_one_query(self):
+        """Test that repeated permission checks for a user cost a single query"""
+        with self.assertNumQueries(1):
+            self.assertTrue(user_can_edit_club(self.user, self.club))
+            self.assertTrue(user_is_club_member(self.user, self.club))
+            self.assertFalse(user_is_pending_club_member(self.user, self.club))
+            self.assertFalse(user_can_edit_club(self.user, self.pending_club))
+            self.assertFalse(user_is_club_member(self.user, self.pending_club))
+            self.assertTrue(user_is_pending_club_member(self.user, self.pending_club))
+            self.assertFalse(user_is_club_member(self.user, self.other_club))
+            self.assertFalse(user_is_club_member(self.user, None))
+
+    def test_cache_is_per_user_object(self):
+        """Test that a freshly loaded user (a new request) sees membership changes"""
+        self.assertFalse(user_is_club_member(self.user, self.pending_club))
+        AquaristClubMember.objects.filter(user=self.user, club=self.pending_club).update(membership_approved=True)
+        self.assertTrue(user_is_club_member(User.objects.get(pk=self.user.pk), self.pending_club))
+
+    def test_duplicate_memberships_not_trusted(self):
+        """Test that duplicate membership rows are treated as not a member"""
+        AquaristClubMember.objects.create(name='ADM: member 2', user=self.user, club=self.club,
+                                          membership_approved=True, is_club_admin=True)
+        self.assertFalse(user_can_edit_club(self.user, self.club))
+        self.assertFalse(user_is_club_member(self.user, self.club))
@@ -381,6 +381,14 @@ class SpeciesDeleteViewTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertTrue(Species.objects.filter(id=species_id).exists())
 
+    def test_delete_species_blocked_when_cached_count_drifted(self):
+        """Test the delete guard checks instances, not the cached species_instance_count"""
+        Species.objects.filter(id=self.protected_species.id).update(species_instance_count=0)
+        self.client.login(email='staff@test.com', password='testpass123')
+        response = self.client.post(reverse('deleteSpecies', args=[self.protected_species.id]))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(Species.objects.filter(id=self.protected_species.id).exists())
+
 class AdminStaffPermissionComparisonTests(TestCase):
     """Test suite to explicitly compare is_admin vs is_staff permissions for Species"""
 
@@ -990,4 +998,31 @@ class SpeciesReferenceLinkDeleteViewTest(TestCase):
         
         # Species should still exist
         self.assertEqual(Species.objects.count(), 1)
-        self.assertTrue(Species.objects.filter(id=self.species.id).exists())
\ No newline at end of file
+        self.assertTrue(Species.objects.filter(id=self.species.id).exists())
+
+class SpeciesExportViewTest(TestCase):
+    """Tests for the streaming species CSV export"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@test.com',
+            password='testpass123'
+        )
+        Species.objects.create(name='Aulonocara jacobfreibergi', category='CIC', global_region='AFR', created_by=self.user)
+        Species.objects.create(name='Melanotaenia boesemani', category='RBF', global_region='AUS')
+        self.client = Client()
+
+    def test_export_species_streams_all_rows(self):
+        """Test the species export is streamed with a header and one row per species"""
+        self.client.login(email='test@test.com', password='testpass123')
+        response = self.client.get(reverse('exportSpecies'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('species_export.csv', response['Content-Disposition'])
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith('id,name,alt_name'))
+        self.assertIn('Aulonocara jacobfreibergi', lines[1])
+        self.assertIn('testuser', lines[1])
@@ -48,7 +48,7 @@ urlpatterns = [
     path('createBapSubmission/<str:pk>/', views.createBapSubmission, name="createBapSubmission"),
     path('editBapSubmission/<str:pk>/', views.editBapSubmission, name="editBapSubmission"),
     path('deleteBapSubmission/<str:pk>/', views.deleteBapSubmission, name="deleteBapSubmission"),
-    path('exportBapSubmissions/', views.exportBapSubmissions, name="exportBapSubmissions"),
+    path('exportBapSubmissions/<str:pk>/', views.exportBapSubmissions, name="exportBapSubmissions"),
 
     path('bapGenus/<str:pk>/', views.BapGenusView.as_view(), name="bapGenus"),
     path('editBapGenus/<str:pk>/', views.editBapGenus, name="editBapGenus"),
@@ -176,6 +176,8 @@ urlpatterns = [
     path('speciesProfilesWithPhotos/', views.speciesProfilesWithPhotos, name="speciesProfilesWithPhotos"),
 
     path('species/import/importArchiveResults/<str:pk>/', views.importArchiveResults, name="importArchiveResults"),    # admin-only
+    path('species/import/job/<str:pk>/', views.backgroundJob, name="backgroundJob"),                                 # admin or requester
+    path('species/import/job/<str:pk>/output/', views.downloadBackgroundJobOutput, name="downloadBackgroundJobOutput"), # admin or requester
     path('collectSpeciesData/', views.collectSpeciesData, name="collectSpeciesData"),                   # admin-only
     path('dirtyDeed/', views.dirtyDeed, name="dirtyDeed"),                                              # admin-only
 
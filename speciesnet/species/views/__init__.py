@@ -74,7 +74,8 @@ from .views_bap import (
 # User Experience
 from .views_ux import (
     home, about_us, howItWorks, bap_overview, cares_overview, 
-    importArchiveResults, addSpeciesInstanceWizard1, addSpeciesInstanceWizard2
+    importArchiveResults, backgroundJob, downloadBackgroundJobOutput,
+    addSpeciesInstanceWizard1, addSpeciesInstanceWizard2
 )
 
 # Admin Tools
@@ -147,7 +148,7 @@ __all__ = [
     # Import
     'exportSpecies', 'exportAquarists', 'exportSpeciesInstances',
     'importClubBapGenus', 'exportClubBapGenus',
-    'importArchiveResults',
+    'importArchiveResults', 'backgroundJob', 'downloadBackgroundJobOutput',
     
     # UX
     'home', 'about_us', 'howItWorks', 
@@ -33,7 +33,7 @@ from species.models import (
     SpeciesReferenceLink, SpeciesInstance, SpeciesInstanceLabel,
     SpeciesInstanceLogEntry, SpeciesMaintenanceLog, SpeciesMaintenanceLogEntry,
     ImportArchive, BapSubmission, BapLeaderboard, BapGenus, BapSpecies, 
-    CaresRegistration, CaresApprover, SpeciesImportStaging
+    CaresRegistration, CaresApprover, SpeciesImportStaging, BackgroundJob
 )
 
 # Local forms
@@ -70,7 +70,11 @@ from species.asn_tools.asn_utils import (
     validate_normalize_youtube_url
 )
 from species.asn_tools.asn_pdf_tools import generatePdfLabels
-from species.asn_tools.asn_species_aggregation import collect_species_data_as_csv
+
+# Local services
+from species.services.background_jobs import enqueue_job
+from species.services.bap_genus import sync_bap_genus_list
+from species.services.species_search import search_species
 
 # Logger
 logger = logging.getLogger(__name__)
\ No newline at end of file
@@ -284,53 +284,8 @@ class BapLeaderboardView(LoginRequiredMixin, ListView):
         # TODO manage 'BAP Year' which may be calendar year or school year
         year = 2025
 
-        # Regenerate full list each time
-        bap_leaderboard = BapLeaderboard.objects.filter(club=bap_club, year=year)
-        for entry in bap_leaderboard: 
-            entry.species_count = 0
-            entry.cares_species_count = 0
-            entry.points = 0
-            entry.save()
-
-        print ('BAP Leaderboard CLEARED')
-
-        bap_submissions = BapSubmission.objects.filter(
-            club=bap_club,
-            year=year,
-            status=BapSubmission.BapSubmissionStatus.APPROVED
-        )
-        aquarist_ids = bap_submissions.values_list('aquarist', flat=True).distinct()
-        
-        for aquarist_id in aquarist_ids:
-            bap_leaderboard_entry, created = BapLeaderboard.objects.get_or_create(aquarist_id=aquarist_id)
-            if created:
-                bap_leaderboard_entry.name = f"{year} - {bap_club.name} - {bap_leaderboard_entry. aquarist.username}"
-                bap_leaderboard_entry.club = bap_club
-                bap_leaderboard_entry.year = year
-            
-            cur_aquarist_submissions = bap_submissions.filter(aquarist_id=aquarist_id)
-            bap_leaderboard_entry.species_count = 0
-            bap_leaderboard_entry.cares_species_count = 0
-            bap_leaderboard_entry.points = 0
-            
-            for bap_submission in cur_aquarist_submissions:
-                bap_leaderboard_entry.species_count += 1
-                if bap_submission.speciesInstance.species.render_cares:
-                    bap_leaderboard_entry.cares_species_count += 1
-                bap_leaderboard_entry.points += bap_submission.points
-                print ('  BAP Leaderboard Entry updated: ' + bap_leaderboard_entry.name + ' (' + str(bap_leaderboard_entry.points) + ')')
-            
-            bap_leaderboard_entry.save()
-            print ('BAP Leaderboard Entry finalized: ' + bap_leaderboard_entry.name + ' (' + str(bap_leaderboard_entry.points) + ')')
-        
-        # Clear out any zero value entries
-        bap_leaderboard = BapLeaderboard.objects.filter(club=bap_club, year=year)
-        for entry in bap_leaderboard:
-            if entry.points == 0:
-                entry.delete()
-
-        # Return clean updated list
-        bap_leaderboard = BapLeaderboard.objects.filter(club=bap_club, year=year).order_by('-points')
+        # Entries are maintained as BapSubmissions change (see species/services/bap_leaderboard.py)
+        bap_leaderboard = BapLeaderboard.objects.filter(club=bap_club, year=year).select_related('aquarist').order_by('-points')
         return bap_leaderboard
 
     def get_context_data(self, **kwargs):
@@ -356,46 +311,12 @@ class BapGenusView(LoginRequiredMixin, ListView):
     def post(self, request, pk):
         # update club BapGenus list with new genus names since last config
         club = get_object_or_404(AquaristClub, pk=pk)
-        current_bap_genus_set = BapGenus.objects.filter(club=club)
-        current_genus_names = set()
-        for bapGenus in current_bap_genus_set:
-            current_genus_names.add (bapGenus.name)
-        print ('BapGenusSet update - current genus count: ' + str(len(current_genus_names)))
-        species_set = Species.objects.all()
-        new_genus_names = set()
-        for species in species_set:
-            genus_name = species.genus_name 
-            if genus_name not in current_genus_names: 
-                if genus_name not in new_genus_names: 
-                    print('BapGenus initialization of new genus name:  ' + genus_name)
-                    new_genus_names.add(genus_name)
-                    bapGP = BapGenus(name=genus_name, club=club, example_species=species, points=club.bap_default_points)
-                    bapGP.save()
-                    
-                    try:
-                        print('updateBapGenusSet - getting number of species for ' + genus_name)
-                        genus_species = Species.objects.filter(name__regex=r'^' + genus_name + r'\s')
-                        bapGP.species_count = len(genus_species)
-                        bapGP.save()
-                        print(f'BapGenus object {bapGP.name} species count set:  {bapGP.species_count}')
-                    except ObjectDoesNotExist:
-                        print(f'updateBapGenusSet - ObjectDoesNotExist exception for {genus_name}')
-                        error_msg = f"Initialization error:  BapGenus object not found:  {genus_name}"
-                        messages.error(self.request, error_msg)
-                        logger.error('Initializing bapGenus list: entry not found for genus: %s', genus_name)
-                    except MultipleObjectsReturned:
-                        print(f'updateBapGenusSet - MultipleObjectsReturned exception for {genus_name}')
-                        error_msg = f"Initialization error: Multiple BapGenus objects found for Genus: {genus_name}"
-                        messages.error(self.request, error_msg)
-                        logger.error('Initializing bapGenus list: multiple entries found for genus: %s', genus_name)
+        new_genus_names = sync_bap_genus_list(club)
 
         if len(new_genus_names) > 0:
             print(f'BapGenus set updated - new genus entry count: {len(new_genus_names)}')
             logger.info('Update of bapGenus list complete for %s:  New genus count: %s', club.name, len(new_genus_names))
-            pop_name = new_genus_names.pop()
-            genus_update_msg = 'Successfully updated BAP Genus Config - added: ' + pop_name
-            for name in new_genus_names:
-                genus_update_msg = genus_update_msg + ', ' + name
+            genus_update_msg = 'Successfully updated BAP Genus Config - added: ' + ', '.join(new_genus_names)
             messages.success(request, genus_update_msg)
         else:
             print(f'BapGenus set update - no new genus entries found')
@@ -408,36 +329,7 @@ class BapGenusView(LoginRequiredMixin, ListView):
 
     def initialize_bap_genus_list(self):
         club = self.get_bap_club()
-        species_set = Species.objects.all()
-        genus_names = set()  # Prevents duplicate entries
-        
-        for species in species_set:
-            species_name = species.name.lstrip()  # Clean out leading spaces
-            if species_name and ' ' in species_name:
-                genus_name = species_name.split(' ')[0]
-                if genus_name not in genus_names: 
-                    print('BapGenus initialization genus name:  ' + genus_name)
-                    genus_names.add(genus_name)
-                    bapGP = BapGenus(name=genus_name, club=club, example_species=species, points=club.bap_default_points)
-                    bapGP.save()
-                    
-                    try:
-                        print('initialize_bap_genus_list - getting number of species for ' + genus_name)
-                        genus_species = Species.objects.filter(name__regex=r'^' + genus_name + r'\s')
-                        bapGP.species_count = len(genus_species)
-                        bapGP.save()
-                        print(f'BapGenus object {bapGP.name} species count set:  {bapGP.species_count}')
-                    except ObjectDoesNotExist:
-                        print(f'initialize_bap_genus_list - ObjectDoesNotExist exception for {genus_name}')
-                        error_msg = f"Initialization error:  BapGenus object not found:  {genus_name}"
-                        messages.error(self.request, error_msg)
-                        logger.error('Initializing bapGenus list: entry not found for genus: %s', genus_name)
-                    except MultipleObjectsReturned:
-                        print(f'initialize_bap_genus_list - MultipleObjectsReturned exception for {genus_name}')
-                        error_msg = f"Initialization error: Multiple BapGenus objects found for Genus: {genus_name}"
-                        messages.error(self.request, error_msg)
-                        logger.error('Initializing bapGenus list: multiple entries found for genus: %s', genus_name)
-
+        genus_names = sync_bap_genus_list(club)
         print(f'BapGenus initialized - genus count: {len(genus_names)}')
         logger.info('Initialization of bapGenus list complete for %s:  Genus count: %s', club.name, len(genus_names))
 
@@ -586,8 +478,8 @@ class BapGenusSpeciesView(LoginRequiredMixin, ListView):
             messages.error(self.request, error_msg)
             logger.error('Multiple BapGenus entries found for genus:  %s', genus_name)
 
-        species_set = Species.objects.filter(name__regex=r'^' + genus_name + r'\s')
-        bsp_set = BapSpecies.objects.filter(club=club, name__regex=r'^' + genus_name + r'\s')
+        species_set = Species.objects.filter(genus=genus_name)
+        bsp_set = BapSpecies.objects.filter(club=club, genus=genus_name)
         bsp_species_ids = [bsp.species.id for bsp in bsp_set]
         results_set = species_set.exclude(id__in=bsp_species_ids)
         
@@ -607,7 +499,7 @@ class BapGenusSpeciesView(LoginRequiredMixin, ListView):
             raise PermissionDenied
         
         genus_name = self.get_genus_name()
-        queryset = BapSpecies.objects.filter(club=club, name__regex=r'^' + genus_name + r'\s')
+        queryset = BapSpecies.objects.filter(club=club, genus=genus_name)
         print(f'BapGenusSpeciesView query BapSpecies override count: {queryset.count()}')
         
         if bgp.species_override_count != queryset.count():
@@ -728,9 +620,14 @@ def importClubBapGenus(request, pk):
     if request.method == 'POST':
         form = ImportCsvForm(request.POST, request.FILES)
         if form.is_valid():
-            import_archive = form.save()
-            import_csv_bap_genus(import_archive, current_user, bap_club)
-            return HttpResponseRedirect(reverse("importArchiveResults", args=[import_archive.id]))
+            import_archive = form.save(commit=False)
+            import_archive.aquarist = current_user
+            import_archive.name = current_user.username + "_" + bap_club.acronym + "_bap_genus_import"
+            import_archive.save()
+            job = enqueue_job(BackgroundJob.JobType.BAP_GENUS, import_archive, current_user, club=bap_club)
+            logger.info('User %s queued BapGenus import job %s for club %s', current_user.username, job.pk, bap_club.acronym)
+            messages.info(request, 'BAP genus import queued.')
+            return HttpResponseRedirect(reverse("backgroundJob", args=[job.id]))
     
     return render(request, "species/import/importClubBapGenus.html", {"form": form})
 
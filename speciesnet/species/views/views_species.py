@@ -67,13 +67,7 @@ class SpeciesListView(ListView):
         if global_region: 
             queryset = queryset.filter(global_region=global_region)
         if query_text: 
-            queryset = queryset.filter(
-                Q(name__icontains=query_text) |
-                Q(alt_name__icontains=query_text) |
-                Q(common_name__icontains=query_text) |
-                Q(local_distribution__icontains=query_text) |
-                Q(description__icontains=query_text)
-            )
+            queryset = search_species(queryset, query_text)   # indexed full-text search ranked by relevance
         return queryset
 
     def get_context_data(self, **kwargs):
@@ -180,9 +174,8 @@ def deleteSpecies(request, pk):
     if not userCanEdit: 
         raise PermissionDenied()
     
-    speciesInstances = SpeciesInstance.objects.filter(species=species)
-    if speciesInstances.count() > 0:
-        msg = f'{species.name} has {speciesInstances.count()} aquarist entries and cannot be deleted.'
+    if SpeciesInstance.objects.filter(species=species).exists():   # the cached count may have drifted - PROTECT must not be hit
+        msg = f'{species.name} has {species.species_instance_count} aquarist entries and cannot be deleted.'
         messages.info(request, msg)
         logger.warning('User %s attempted to delete species:  %s with speciesInstance dependencies. Deletion blocked.', request.user.username, species.name)
         return HttpResponseRedirect(reverse("species", args=[species.id]))
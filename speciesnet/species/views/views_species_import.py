@@ -6,8 +6,7 @@ from .base import *
 from django.utils import timezone
 from species.models import SpeciesImportStaging
 from species.forms import SpeciesImportStagingForm
-from species.asn_tools.asn_csv_tools import (import_csv_species_to_staging, commit_species_import_staging,
-                                              import_csv_species_reference_links,)
+from species.asn_tools.asn_csv_tools import commit_species_import_staging
 
 
 # ---------------------------------------------------------------------------
@@ -16,7 +15,7 @@ from species.asn_tools.asn_csv_tools import (import_csv_species_to_staging, comm
 
 @login_required(login_url='login')
 def importSpeciesToStaging(request):
-    """Upload a CARES species CSV and parse it into staging records for review."""
+    """Upload a CARES species CSV and queue a job parsing it into staging records for review."""
     if not user_is_admin(request.user):
         raise PermissionDenied()
 
@@ -29,18 +28,13 @@ def importSpeciesToStaging(request):
             import_archive.name = f"{request.user.username}_cares_species_staging"
             import_archive.save()
 
-            summary = import_csv_species_to_staging(import_archive, request.user)
+            job = enqueue_job(BackgroundJob.JobType.SPECIES_STAGING, import_archive, request.user)
             logger.info(
-                'User %s created CARES staging import %s: %s',
-                request.user.username, import_archive.pk, summary,
+                'User %s queued CARES staging import %s as job %s',
+                request.user.username, import_archive.pk, job.pk,
             )
-            messages.success(
-                request,
-                f"Staging import complete – {summary['new']} new, "
-                f"{summary['update']} updates, {summary['conflict']} conflicts, "
-                f"{summary['skip']} unchanged, {summary['error']} errors.",
-            )
-            return HttpResponseRedirect(reverse('reviewSpeciesImport', args=[import_archive.pk]))
+            messages.info(request, 'Staging import queued – review opens once the import has finished.')
+            return HttpResponseRedirect(reverse('backgroundJob', args=[job.pk]))
         
     context = {'form': form}
     return render(request, 'species/import/importSpeciesStaging.html', context)
@@ -268,7 +262,7 @@ def commitSpeciesImport(request, pk):
 
 @login_required(login_url='login')
 def importSpeciesReferenceLinks(request):
-    """Upload a CSV file and import SpeciesReferenceLink objects row by row.
+    """Upload a CSV file and queue a job importing SpeciesReferenceLink objects row by row.
 
     Expected CSV columns: species, reference_url, name_prefix
     """
@@ -286,16 +280,13 @@ def importSpeciesReferenceLinks(request):
             import_archive.name = f"{request.user.username}_species_reference_link_import"
             import_archive.save()
 
-            summary = import_csv_species_reference_links(import_archive, request.user)
-
+            job = enqueue_job(BackgroundJob.JobType.REFERENCE_LINKS, import_archive, request.user)
             logger.info(
-                'User %s completed species reference link import %s: %d succeeded, %d errors',
-                request.user.username,
-                import_archive.pk,
-                summary['success_count'],
-                summary['error_count'],
+                'User %s queued species reference link import %s as job %s',
+                request.user.username, import_archive.pk, job.pk,
             )
-        return HttpResponseRedirect(reverse("importArchiveResults", args=[import_archive.id]))
+            messages.info(request, 'Species reference link import queued.')
+            return HttpResponseRedirect(reverse("backgroundJob", args=[job.id]))
 
     context = {
         'form': form,
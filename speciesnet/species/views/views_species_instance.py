@@ -239,8 +239,6 @@ def createSpeciesAndInstance(request):
                     
                     if speciesInstance:
                         speciesInstance.save()
-                        # species.species_instance_count = 1
-                        # species.save()
 
                     messages.success(request, f'Successfully created species "{species.name}" and your Aquarist Species!')
                     logger.info('User %s added species: %s (%s) and speciesInstance: %s (%s)', 
@@ -310,6 +310,7 @@ def collectSpeciesData(request):
     Inputs a species list with csv header: Family, Species
     Scrapes targeted data from Fishbase.se
     Outputs roughly structured csv with heaer: FishBase URL, Distribution, Biology, Conservation Notes, IUCN Status
+    Runs as a BackgroundJob - the enriched csv is downloaded from the job page when done
     """    
     current_user = request.user
     userCanEdit = user_is_admin (request.user)
@@ -319,10 +320,14 @@ def collectSpeciesData(request):
     if request.method == 'POST':
         form = ImportCsvForm(request.POST, request.FILES)
         if form.is_valid():
-            import_archive = form.save()
-            #TODO sort out mechanims of downloading csv output and displaying progress and/or summary results
-            return collect_species_data_as_csv (import_archive, current_user)
-            #return HttpResponseRedirect(reverse("importArchiveResults", args=[import_archive.id]))
+            import_archive = form.save(commit=False)
+            import_archive.aquarist = current_user
+            import_archive.name = current_user.username + "_species_data_collection"
+            import_archive.save()
+            job = enqueue_job(BackgroundJob.JobType.SPECIES_AGGREGATION, import_archive, current_user)
+            logger.info('User %s queued species data collection job %s', current_user.username, job.pk)
+            messages.info(request, 'Species data collection queued - this page updates as species are processed.')
+            return HttpResponseRedirect(reverse("backgroundJob", args=[job.id]))
         
     form = ImportCsvForm()
     return render(request, "species/importSpecies.html", {"form": form})
@@ -7,6 +7,7 @@ Public-facing and helper pages for users
 
 from .base import *
 from django.conf import settings
+from django.http import FileResponse
 
 
 ### Home Page
@@ -152,4 +153,47 @@ def importArchiveResults(request, pk):
         messages.error(request, error_msg)
         logger.error('Error reading import archive %s:  %s', str(pk), str(e))
 
-    return redirect('home')
\ No newline at end of file
+    return redirect('home')
+
+
+### Background Jobs (queued imports and data aggregation)
+
+def _user_can_view_job(user, job):
+    return user_is_admin(user) or job.requested_by_id == user.id
+
+
+@login_required(login_url='login')
+def backgroundJob(request, pk):
+    """
+    Status and progress of a queued import or aggregation job.
+    The page refreshes itself while the job is pending or running.
+    """
+    job = get_object_or_404(BackgroundJob.objects.select_related('import_archive', 'club'), pk=pk)
+    if not _user_can_view_job(request.user, job):
+        raise PermissionDenied()
+
+    results_url = None
+    if job.status == BackgroundJob.JobStatus.DONE:
+        if job.job_type == BackgroundJob.JobType.SPECIES_STAGING:
+            results_url = reverse('reviewSpeciesImport', args=[job.import_archive_id])
+        elif job.import_archive.import_results_file:
+            results_url = reverse('importArchiveResults', args=[job.import_archive_id])
+
+    context = {
+        'job': job,
+        'results_url': results_url,
+        'refresh_seconds': 5 if job.is_active else None,
+    }
+    return render(request, 'species/import/backgroundJob.html', context)
+
+
+@login_required(login_url='login')
+def downloadBackgroundJobOutput(request, pk):
+    job = get_object_or_404(BackgroundJob, pk=pk)
+    if not _user_can_view_job(request.user, job):
+        raise PermissionDenied()
+    if not job.output_file:
+        messages.error(request, 'This job has no output file.')
+        return HttpResponseRedirect(reverse('backgroundJob', args=[job.id]))
+    logger.info('User %s downloaded output of background job %s', request.user.username, job.pk)
+    return FileResponse(job.output_file.open('rb'), as_attachment=True, filename='species_data_collection.csv')
@@ -329,6 +329,10 @@ DATABASES = {
 if 'mysql' in db_engine:
     DATABASES['default']['OPTIONS'] = {'charset': 'utf8mb4'}
 
+# Species search uses the MariaDB FULLTEXT indexes when available; set to False to always use the
+# SpeciesSearchToken table (InnoDB FULLTEXT only sees committed rows, e.g. not inside TestCase transactions)
+SPECIES_SEARCH_USE_FULLTEXT = os.environ.get('SPECIES_SEARCH_USE_FULLTEXT', 'True') == 'True'
+
 ### Custom User Model ###
 
 AUTH_USER_MODEL = 'species.User'
@@ -384,6 +388,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'species.api.authentication.ServiceSignatureAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
@@ -413,8 +418,33 @@ if SITE2_URL:
 
 API_SERVICE_EMAIL = os.environ.get('API_SERVICE_EMAIL', 'api_service@localhost')
 API_SERVICE_PASSWORD = os.environ.get('API_SERVICE_PASSWORD', 'changeme_in_production')
+# HMAC key for signed sync API requests (derived from API_SERVICE_PASSWORD when empty); must match on both sites
+API_SERVICE_KEY = os.environ.get('API_SERVICE_KEY', '')
+API_SIGNATURE_MAX_AGE = int(os.environ.get('API_SIGNATURE_MAX_AGE', '300'))   # seconds - bounds replay and clock skew
+SPECIES_CHANGE_FEED_SETTLE_SECONDS = int(os.environ.get('SPECIES_CHANGE_FEED_SETTLE_SECONDS', '5'))   # newest change log entries held back from the feed
 
 ### Target API URL (Site2 URL for Site1, Site1 URL for Site2) ###
 
 TARGET_API_URL = os.environ.get('TARGET_API_URL', 'http://localhost:8001')
 
+### Outbound HTTP client (species sync, FishBase) ###
+
+# Pooled keep-alive sessions; connection errors and 429/5xx responses are retried with exponential backoff plus jitter
+HTTP_CLIENT_RETRIES = int(os.environ.get('HTTP_CLIENT_RETRIES', '3'))
+HTTP_CLIENT_BACKOFF = float(os.environ.get('HTTP_CLIENT_BACKOFF', '0.5'))
+HTTP_CLIENT_BACKOFF_JITTER = float(os.environ.get('HTTP_CLIENT_BACKOFF_JITTER', '0.5'))
+HTTP_CLIENT_CONNECT_TIMEOUT = float(os.environ.get('HTTP_CLIENT_CONNECT_TIMEOUT', '5'))
+HTTP_CLIENT_READ_TIMEOUT = float(os.environ.get('HTTP_CLIENT_READ_TIMEOUT', '30'))
+HTTP_CLIENT_POOL_SIZE = int(os.environ.get('HTTP_CLIENT_POOL_SIZE', '10'))
+
+### FishBase species data aggregation ###
+
+# Requests per second to fishbase.se shared by all aggregation threads (politeness limit)
+FISHBASE_REQUESTS_PER_SECOND = float(os.environ.get('FISHBASE_REQUESTS_PER_SECOND', '0.5'))
+FISHBASE_MAX_WORKERS = int(os.environ.get('FISHBASE_MAX_WORKERS', '4'))
+
+# On-disk FishBase response cache (empty string disables it); negative entries cache 404 / not-a-species pages
+FISHBASE_CACHE_DIR = os.environ.get('FISHBASE_CACHE_DIR', os.path.join(BASE_DIR, 'fishbase_cache'))
+FISHBASE_CACHE_TTL = int(os.environ.get('FISHBASE_CACHE_TTL', 30 * 24 * 3600))
+FISHBASE_CACHE_NEGATIVE_TTL = int(os.environ.get('FISHBASE_CACHE_NEGATIVE_TTL', 7 * 24 * 3600))
+FISHBASE_CACHE_MAX_BYTES = int(os.environ.get('FISHBASE_CACHE_MAX_BYTES', 500 * 1024 * 1024))